@@ -0,0 +1,22 @@
+"""
+Lookups personnalisés pour l'ORM.
+"""
+
+from django.db.models import GenericIPAddressField, Lookup
+
+
+@GenericIPAddressField.register_lookup
+class NetContainedOrEqual(Lookup):
+    """
+    Adresse IP contenue dans un réseau (opérateur PostgreSQL inet <<=).
+    Ex. : ContactMessage.objects.filter(ip_address__net_contained_or_equal='203.0.113.0/24')
+    GenericIPAddressField est déjà stocké en type inet natif sous PostgreSQL.
+    """
+    lookup_name = 'net_contained_or_equal'
+    # Le réseau (notation CIDR) n'est pas une adresse : pas de nettoyage par le champ
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} <<= {rhs}', (*lhs_params, *rhs_params)
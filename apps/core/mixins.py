@@ -2,6 +2,8 @@
 Core Mixins - Mixins réutilisables pour les vues et serializers
 """
 
+from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -28,7 +30,21 @@ class MultiSerializerViewSetMixin:
             return super().get_serializer_class()
 
 
-class PublishedQuerySetMixin:
+class PublishedMixin:
+    """
+    Horodatage de publication figé pour toute la requête HTTP (une instance de vue par requête) :
+    toutes les requêtes SQL d'une même vue partagent le même prédicat « publié ».
+
+    Usage:
+        queryset.published(self.published_now)
+    """
+
+    @cached_property
+    def published_now(self):
+        return timezone.now()
+
+
+class PublishedQuerySetMixin(PublishedMixin):
     """
     Mixin pour filtrer les contenus publiés pour les utilisateurs anonymes.
     Les admins/éditeurs voient tous les contenus.
@@ -41,15 +57,8 @@ class PublishedQuerySetMixin:
             if self.request.user.is_staff or getattr(self.request.user, 'is_editor', False):
                 return queryset
 
-        # Les autres ne voient que les contenus publiés
-        from django.utils import timezone
-
-        return queryset.filter(
-            status='published',
-        ).filter(
-            models.Q(published_at__isnull=True) |
-            models.Q(published_at__lte=timezone.now())
-        )
+        # Les autres ne voient que les contenus publiés (PublishedQuerySet)
+        return queryset.published(self.published_now)
 
 
 class CacheResponseMixin:
@@ -83,6 +92,172 @@ class CacheResponseMixin:
         return response
 
 
+class ConditionalGetMixin:
+    """
+    Mixin ajoutant ETag (list, retrieve) et Last-Modified (retrieve) aux lectures publiques.
+    Détail : version lue sur la ligne (updated_at...) ; listes : marques de
+    modification posées par les signaux de contenu. Une ressource inchangée
+    renvoie 304 (If-None-Match ou If-Modified-Since) sans charger ni sérialiser les objets.
+    Les éditeurs reçoivent toujours la réponse complète.
+    """
+    etag_cache_timeout = 5  # secondes
+    # Fenêtre des versions de liste : une publication planifiée (sans signal)
+    # apparaît au plus tard après ce délai
+    list_version_window = 60  # secondes
+    # Modèles dont une modification change les listes (défaut : modèle de la vue)
+    list_version_models = ()
+    # Réponses détail, clé liée à la version ; durée bornée comme les listes en cache
+    # (contenus liés, compteurs de la catégorie / de l'auteur)
+    detail_cache_timeout = 60 * 5
+    # Colonnes de la version détail : pk et updated_at en tête, puis ce que la réponse
+    # affiche et qui change sans toucher updated_at (vues, objets liés)
+    detail_version_fields = ('pk', 'updated_at')
+
+    def is_public_request(self, request) -> bool:
+        """Lecture par un visiteur (ni éditeur, ni méthode d'écriture)."""
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        user = request.user
+        return not user.is_authenticated or not getattr(user, 'is_editor', False)
+
+    def _get_cached_version(self, request, compute):
+        """Calcule la version (ou la lit en cache pour quelques secondes)."""
+        from django.core.cache import cache
+
+        cache_key = f"etag:{self.__class__.__name__}:{request.get_full_path()}"
+        version = cache.get(cache_key)
+        if version is None:
+            version = compute()
+            if version is not None:
+                cache.set(cache_key, version, self.etag_cache_timeout)
+        return version
+
+    def get_list_version(self):
+        """
+        Version d'une liste, sans requête : URL, marques de dernière modification
+        des modèles (get_content_version) et fenêtre de temps courante.
+        """
+        import time
+
+        from .utils import get_content_version
+
+        models = self.list_version_models or (self.queryset.model,)
+        return (
+            self.request.get_full_path(),
+            get_content_version(*models),
+            int(time.time()) // self.list_version_window,
+        )
+
+    @staticmethod
+    def _make_version(values) -> tuple:
+        from datetime import datetime
+
+        return tuple(value.isoformat() if isinstance(value, datetime) else value for value in values)
+
+    def get_detail_version(self):
+        """Version d'un objet (detail_version_fields), sans charger la ligne complète."""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = self.get_queryset().filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        ).values_list(*self.detail_version_fields).first()
+        if row is None:
+            return None
+        return self._make_version(row)
+
+    def get_instance_version(self, instance):
+        """Version d'un objet déjà chargé (même format que get_detail_version)."""
+        values = []
+        for field in self.detail_version_fields:
+            value = instance
+            for name in field.split('__'):
+                value = getattr(value, name) if value is not None else None
+            values.append(value)
+        return self._make_version(values)
+
+    def get_detail_conditions(self, request):
+        """
+        Retourne (etag, last_modified, pk) de l'objet demandé,
+        ou (None, None, None) s'il est introuvable.
+        """
+        version = self._get_cached_version(request, self.get_detail_version)
+        if version is None:
+            return None, None, None
+        return self.make_etag(version), self.get_last_modified(version), version[0]
+
+    def get_detail_cache_key(self, etag: str) -> str:
+        """
+        Clé du cache des réponses détail. Elle contient la version (ETag) :
+        une modification change de clé, les anciennes entrées expirent seules.
+        """
+        return 'detail:%s:%s' % (self.__class__.__name__, etag.strip('"'))
+
+    def get_cached_detail_data(self, etag: str):
+        """Données sérialisées d'un objet pour une version donnée (None si absentes)."""
+        from django.core.cache import cache
+
+        return cache.get(self.get_detail_cache_key(etag))
+
+    def set_cached_detail_data(self, etag: str, data) -> None:
+        from django.core.cache import cache
+
+        cache.set(self.get_detail_cache_key(etag), data, self.detail_cache_timeout)
+
+    @staticmethod
+    def make_etag(version) -> str:
+        import hashlib
+
+        return '"%s"' % hashlib.md5(repr(version).encode()).hexdigest()
+
+    @staticmethod
+    def get_last_modified(version):
+        """Timestamp (secondes entières) du updated_at porté par la version, ou None."""
+        from datetime import datetime
+
+        if not version[1]:
+            return None
+        return int(datetime.fromisoformat(version[1]).timestamp())
+
+    @staticmethod
+    def conditional_headers(etag: str, last_modified=None) -> dict:
+        from django.utils.http import http_date
+
+        headers = {'ETag': etag}
+        if last_modified is not None:
+            headers['Last-Modified'] = http_date(last_modified)
+        return headers
+
+    def get_not_modified_response(self, request, etag: str, last_modified=None):
+        """
+        Réponse 304 si la copie du client est à jour (If-None-Match, à défaut
+        If-Modified-Since), sinon None.
+        """
+        from django.utils.cache import get_conditional_response
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            return None
+        if response.status_code != status.HTTP_304_NOT_MODIFIED:
+            return response
+        return Response(
+            status=status.HTTP_304_NOT_MODIFIED,
+            headers=self.conditional_headers(etag, last_modified),
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_public_request(request):
+            return super().list(request, *args, **kwargs)
+
+        # ETag seul : la version ne porte pas de date de modification
+        etag = self.make_etag(self._get_cached_version(request, self.get_list_version))
+        not_modified = self.get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
+
+
 class BulkActionMixin:
     """
     Mixin pour les actions en masse (bulk actions).
@@ -11,6 +11,10 @@ class TimeStampedModel(models.Model):
     """
     Modèle abstrait avec timestamps de création et modification.
     Hérité par tous les modèles métier.
+
+    updated_at (auto_now) n'est rempli que par save() : les transitions d'état
+    écrites par QuerySet.update() (confirm(), mark_as_read()...) ne le touchent
+    volontairement pas, et save(update_fields=...) ne l'écrit que s'il y figure.
     """
     created_at = models.DateTimeField(
         'Date de création',
@@ -79,6 +83,79 @@ class SluggedModel(models.Model):
         return slug
 
 
+class PublishedQuerySet(models.QuerySet):
+    """
+    QuerySet des contenus publiables.
+    Le prédicat « publié » est défini ici une seule fois : même SQL partout,
+    compatible avec les index partiels (condition status='published').
+    """
+
+    def published(self, now=None):
+        """Contenus publiés dont la date de publication est atteinte."""
+        from django.utils import timezone
+
+        return self.filter(
+            models.Q(published_at__isnull=True) | models.Q(published_at__lte=now or timezone.now()),
+            status='published',
+        )
+
+
+class IndexableManager(models.Manager):
+    """
+    Manager pour la (re)construction de l'index de recherche Wagtail.
+    Ne charge que les champs déclarés dans search_fields et itère par lots
+    (curseur côté serveur sur PostgreSQL) : mémoire bornée quel que soit le volume.
+    """
+
+    def indexed_field_names(self) -> list:
+        """Noms des champs lus par l'index (clé primaire incluse)."""
+        names = [self.model._meta.pk.name]
+        for field in self.model.get_search_fields():
+            if field.field_name not in names:
+                names.append(field.field_name)
+        return names
+
+    def indexable_queryset(self):
+        """Queryset limité aux champs indexés."""
+        return self.get_queryset().only(*self.indexed_field_names())
+
+    def indexable(self, chunk_size: int = 500):
+        """Itère sur les objets à indexer, par lots de chunk_size."""
+        return self.indexable_queryset().order_by('pk').iterator(chunk_size=chunk_size)
+
+
+class LoadedStateMixin:
+    """
+    Mémorise les valeurs de tracked_fields telles que lues en base (from_db),
+    dans _loaded_state : les signaux comparent l'état précédent sans relire la ligne.
+    Un champ différé (only() / defer()) n'y figure pas.
+    """
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_state = {
+            name: value for name, value in zip(field_names, values)
+            if name in cls.tracked_fields and value is not models.DEFERRED
+        }
+        return instance
+
+    def get_loaded_state(self):
+        """État lu en base, ou None s'il n'est pas connu pour tous les tracked_fields."""
+        state = getattr(self, '_loaded_state', None)
+        if state is None or any(name not in state for name in self.tracked_fields):
+            return None
+        return state
+
+    def remember_loaded_state(self, *fields) -> None:
+        """Enregistre l'état courant comme état en base après une écriture (fields : tous par défaut)."""
+        self._loaded_state = {
+            **getattr(self, '_loaded_state', {}),
+            **{name: getattr(self, name) for name in fields or self.tracked_fields},
+        }
+
+
 class PublishableModel(models.Model):
     """
     Modèle abstrait pour les contenus publiables.
@@ -106,6 +183,39 @@ class PublishableModel(models.Model):
     class Meta:
         abstract = True
 
+    def save(self, *args, **kwargs):
+        # Publication immédiate : la date est fixée pour un tri (et une pagination) stable
+        if self.status == self.PublicationStatus.PUBLISHED and not self.published_at:
+            from django.utils import timezone
+
+            self.published_at = timezone.now()
+        super().save(*args, **kwargs)
+
+    def update_status(self, status: str) -> None:
+        """
+        Change le statut par un UPDATE limité aux colonnes de publication :
+        ni save() complet, ni chaîne pre_save / post_save. Les effets liés à la
+        publication sont déclenchés par le signal publication_changed.
+        """
+        from django.utils import timezone
+
+        from .signals import publication_changed
+
+        previous_status = self.status
+        now = timezone.now()
+        self.status = status
+        if status == self.PublicationStatus.PUBLISHED and not self.published_at:
+            self.published_at = now
+
+        changes = {'status': self.status, 'published_at': self.published_at}
+        # updated_at (TimeStampedModel) n'est pas rempli par update() : il porte l'ETag
+        if hasattr(self, 'updated_at'):
+            self.updated_at = changes['updated_at'] = now
+        type(self)._default_manager.filter(pk=self.pk).update(**changes)
+        publication_changed.send(
+            sender=type(self), instance=self, previous_status=previous_status
+        )
+
     @property
     def is_published(self) -> bool:
         """Vérifie si le contenu est publié."""
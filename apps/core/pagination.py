@@ -0,0 +1,53 @@
+"""
+Pagination personnalisée pour l'API GAM.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator qui évite le COUNT(*) exact sur les grandes tables non filtrées :
+    le nombre de lignes est alors lu dans les statistiques PostgreSQL (pg_class.reltuples).
+    Les querysets filtrés, et les petites tables, gardent un comptage exact.
+    """
+    # En dessous de ce nombre de lignes estimées, le COUNT(*) exact reste bon marché
+    estimate_threshold = 10_000
+
+    def get_estimated_count(self):
+        """Estimation PostgreSQL du nombre de lignes, ou None si elle ne s'applique pas."""
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is None or query.where or query.distinct or query.is_sliced:
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # reltuples vaut -1 tant que la table n'a pas été analysée
+        if row is None or row[0] < self.estimate_threshold:
+            return None
+        return row[0]
+
+    @cached_property
+    def count(self):
+        estimated = self.get_estimated_count()
+        if estimated is not None:
+            return estimated
+        return super().count
+
+
+class EstimatedCountPageNumberPagination(PageNumberPagination):
+    """PageNumberPagination utilisant EstimatedCountPaginator (pagination par défaut de l'API)."""
+    django_paginator_class = EstimatedCountPaginator
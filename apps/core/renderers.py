@@ -0,0 +1,30 @@
+"""
+Renderers personnalisés pour l'API GAM.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer basé sur orjson : même sortie compacte, sérialisation nettement
+    plus rapide des listes d'articles / vidéos et de la page d'accueil.
+    Les types qu'orjson ne connaît pas (Decimal, chaînes paresseuses...) passent
+    par l'encodeur DRF. Une sortie indentée (API navigable, ?indent=) reste
+    produite par le JSONRenderer standard.
+    """
+    options = orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+
+        # Comme JSONRenderer : \u2028 et \u2029 échappés (sous-ensemble strict de JavaScript)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
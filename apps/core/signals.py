@@ -0,0 +1,9 @@
+"""
+Core Signals - Signaux partagés entre les apps
+"""
+
+from django.dispatch import Signal
+
+# Changement de statut fait par UPDATE (PublishableModel.update_status), sans post_save.
+# Arguments : instance (valeurs à jour), previous_status
+publication_changed = Signal()
@@ -4,8 +4,17 @@ Core Utilities - Fonctions utilitaires partagées
 
 import re
 import math
+import time
 from typing import Optional
 from django.conf import settings
+from django.core.cache import cache
+
+
+# Patterns pour les URLs YouTube (watch, youtu.be, embed, shorts), compilés une fois
+_YOUTUBE_ID_RE = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/shorts/)'
+    r'([a-zA-Z0-9_-]{11})'
+)
 
 
 def calculate_reading_time(content: str) -> int:
@@ -47,18 +56,8 @@ def extract_youtube_id(url: str) -> Optional[str]:
     if not url:
         return None
 
-    # Patterns pour les URLs YouTube
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/shorts\/([a-zA-Z0-9_-]{11})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    return None
+    match = _YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def get_youtube_thumbnail(video_id: str, quality: str = 'maxresdefault') -> str:
@@ -162,3 +161,45 @@ def generate_excerpt(content: str, max_length: int = 200) -> str:
     clean_text = re.sub(r'\s+', ' ', clean_text).strip()
 
     return truncate_text(clean_text, max_length)
+
+
+def get_client_ip(request) -> Optional[str]:
+    """
+    Adresse IP du client : premier élément de X-Forwarded-For (proxy), sinon REMOTE_ADDR.
+
+    Args:
+        request: Requête HTTP (Django ou DRF)
+
+    Returns:
+        Adresse IP, ou None si inconnue
+    """
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if x_forwarded_for:
+        return x_forwarded_for.partition(',')[0].strip()
+    return request.META.get('REMOTE_ADDR')
+
+
+# Marque de dernière modification d'un modèle (changée par les signaux de contenu)
+CONTENT_VERSION_KEY = 'content-version:{}'
+
+
+def get_content_version(*models) -> tuple:
+    """
+    Marques de dernière modification des modèles donnés, lues en un seul accès
+    au cache (posées au premier appel).
+    """
+    keys = [CONTENT_VERSION_KEY.format(model._meta.label) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return tuple(versions[key] for key in keys)
+
+
+def bump_content_version(*models) -> None:
+    """Change la marque de dernière modification des modèles donnés."""
+    version = time.time_ns()
+    cache.set_many(
+        {CONTENT_VERSION_KEY.format(model._meta.label): version for model in models}, None
+    )
@@ -2,12 +2,83 @@
 Editorial Admin - Configuration de l'administration éditoriale
 """
 
+from django.conf import settings
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
 from django.utils import timezone
+from apps.core.utils import bump_content_version
+from .counters import refresh_counts_for_queryset
+from .homepage import invalidate_homepage_cache
 from .models import Author, Category, Article, ArticleBlock, Video
 
 
+def _freeze_selection(queryset):
+    """
+    Sélection d'une action figée sur ses pks : le queryset de la liste garde ses
+    filtres (ex. statut), relu après update() il ne retrouverait plus les lignes.
+    """
+    pks = list(queryset.values_list('pk', flat=True))
+    return queryset.model.objects.filter(pk__in=pks)
+
+
+def _schedule_notifications(queryset) -> None:
+    """
+    Planifie les notifications newsletter d'une publication groupée :
+    update() n'émet pas post_save, les contenus sont donc envoyés en une seule tâche.
+    """
+    if not getattr(settings, 'ENABLE_ARTICLE_NOTIFICATIONS', True):
+        return
+
+    from apps.engagement.tasks import send_notifications_bulk_task
+
+    label = queryset.model._meta.label
+    pks = list(queryset.values_list('pk', flat=True))
+    transaction.on_commit(lambda: send_notifications_bulk_task.enqueue(label, pks))
+
+
+def _publication_changed(queryset) -> None:
+    """
+    Effets d'un publish / unpublish groupé (update() n'émet aucun signal) :
+    compteurs, page d'accueil et index de recherche, comme on_publication_changed.
+    """
+    from wagtail.search.backends import get_search_backends
+
+    refresh_counts_for_queryset(queryset)
+    invalidate_homepage_cache()
+    bump_content_version(queryset.model)
+
+    model = queryset.model
+    objects = list(model.get_indexed_objects().filter(pk__in=queryset.values('pk')))
+    for backend in get_search_backends(with_auto_update=True):
+        backend.add_bulk(model, objects)
+
+
+# Badges de statut (Article / Video) : libellés et HTML précalculés au chargement
+# du module, au lieu d'un get_status_display() + format_html par ligne
+STATUS_BADGE_TEMPLATE = (
+    '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; '
+    'color: white; font-size: 11px;">{}</span>'
+)
+STATUS_BADGE_COLORS = {
+    'draft': '#FFA500',
+    'published': '#28A745',
+}
+_STATUS_LABELS = dict(Article.PublicationStatus.choices)
+_STATUS_BADGES = {
+    value: format_html(STATUS_BADGE_TEMPLATE, STATUS_BADGE_COLORS.get(value, '#6C757D'), label)
+    for value, label in _STATUS_LABELS.items()
+}
+
+
+def _status_badge(obj):
+    """Badge précalculé ; format_html seulement pour un statut hors choix."""
+    badge = _STATUS_BADGES.get(obj.status)
+    if badge is None:
+        badge = format_html(STATUS_BADGE_TEMPLATE, '#6C757D', obj.status)
+    return badge
+
+
 # =============================================================================
 # AUTHOR ADMIN
 # =============================================================================
@@ -61,6 +132,8 @@ class CategoryAdmin(admin.ModelAdmin):
     """Administration des catégories."""
 
     list_display = ['name', 'color_preview', 'parent', 'articles_count', 'is_featured', 'order', 'is_active']
+    # parent est nullable : le select_related automatique de l'admin ne le suit pas
+    list_select_related = ['parent']
     list_filter = ['is_active', 'is_featured', 'parent']
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
@@ -154,15 +227,7 @@ class ArticleAdmin(admin.ModelAdmin):
     readonly_fields = ['reading_time', 'views_count', 'created_by', 'updated_by']
 
     def status_badge(self, obj):
-        colors = {
-            'draft': '#FFA500',
-            'published': '#28A745',
-        }
-        color = colors.get(obj.status, '#6C757D')
-        return format_html(
-            '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; color: white; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _status_badge(obj)
     status_badge.short_description = 'Statut'
 
     def save_model(self, request, obj, form, change):
@@ -175,17 +240,27 @@ class ArticleAdmin(admin.ModelAdmin):
 
     @admin.action(description='Publier les articles sélectionnés')
     def publish_articles(self, request, queryset):
-        updated = queryset.update(status='published', published_at=timezone.now())
+        queryset = _freeze_selection(queryset)
+        now = timezone.now()
+        updated = queryset.update(status='published', published_at=now, updated_at=now)
+        if updated:
+            _publication_changed(queryset)
+            _schedule_notifications(queryset)
         self.message_user(request, f'{updated} article(s) publié(s).')
 
     @admin.action(description='Dépublier les articles sélectionnés')
     def unpublish_articles(self, request, queryset):
-        updated = queryset.update(status='draft')
+        queryset = _freeze_selection(queryset)
+        updated = queryset.update(status='draft', updated_at=timezone.now())
+        if updated:
+            _publication_changed(queryset)
         self.message_user(request, f'{updated} article(s) dépublié(s).')
 
     @admin.action(description='Mettre en vedette')
     def feature_articles(self, request, queryset):
         updated = queryset.update(is_featured=True)
+        if updated:
+            bump_content_version(queryset.model)
         self.message_user(request, f'{updated} article(s) mis en vedette.')
 
 
@@ -201,6 +276,8 @@ class VideoAdmin(admin.ModelAdmin):
         'title', 'thumbnail_preview', 'video_type', 'category',
         'status_badge', 'is_featured', 'is_live', 'views_count', 'published_at'
     ]
+    # category est nullable : le select_related automatique de l'admin ne la suit pas
+    list_select_related = ['category']
     list_filter = ['status', 'video_type', 'is_featured', 'is_live', 'category', 'created_at']
     search_fields = ['title', 'description', 'tags']
     prepopulated_fields = {'slug': ('title',)}
@@ -245,15 +322,7 @@ class VideoAdmin(admin.ModelAdmin):
     thumbnail_preview.short_description = 'Miniature'
 
     def status_badge(self, obj):
-        colors = {
-            'draft': '#FFA500',
-            'published': '#28A745',
-        }
-        color = colors.get(obj.status, '#6C757D')
-        return format_html(
-            '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; color: white; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _status_badge(obj)
     status_badge.short_description = 'Statut'
 
     def save_model(self, request, obj, form, change):
@@ -265,15 +334,25 @@ class VideoAdmin(admin.ModelAdmin):
 
     @admin.action(description='Publier les vidéos sélectionnées')
     def publish_videos(self, request, queryset):
-        updated = queryset.update(status='published', published_at=timezone.now())
+        queryset = _freeze_selection(queryset)
+        now = timezone.now()
+        updated = queryset.update(status='published', published_at=now, updated_at=now)
+        if updated:
+            _publication_changed(queryset)
+            _schedule_notifications(queryset)
         self.message_user(request, f'{updated} vidéo(s) publiée(s).')
 
     @admin.action(description='Dépublier les vidéos sélectionnées')
     def unpublish_videos(self, request, queryset):
-        updated = queryset.update(status='draft')
+        queryset = _freeze_selection(queryset)
+        updated = queryset.update(status='draft', updated_at=timezone.now())
+        if updated:
+            _publication_changed(queryset)
         self.message_user(request, f'{updated} vidéo(s) dépubliée(s).')
 
     @admin.action(description='Mettre en vedette')
     def feature_videos(self, request, queryset):
         updated = queryset.update(is_featured=True)
+        if updated:
+            bump_content_version(queryset.model)
         self.message_user(request, f'{updated} vidéo(s) mise(s) en vedette.')
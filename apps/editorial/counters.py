@@ -0,0 +1,144 @@
+"""
+Editorial Counters - Mise à jour groupée des compteurs de vues
+Les vues sont comptées en mémoire puis écrites en base par lots :
+la lecture d'un article ne déclenche plus d'UPDATE.
+"""
+
+import atexit
+import threading
+import time
+from collections import Counter, defaultdict
+from itertools import islice
+
+from django.apps import apps
+from django.db.models import Case, Count, F, OuterRef, PositiveIntegerField, Subquery, When
+from django.db.models.functions import Coalesce
+
+# Nombre de lignes par UPDATE ... CASE WHEN
+FLUSH_BATCH_SIZE = 500
+
+# Déclenchement de l'écriture : nombre de vues en attente ou délai écoulé
+FLUSH_THRESHOLD = 100
+FLUSH_INTERVAL = 10  # secondes
+
+_pending_views = defaultdict(Counter)
+_pending_total = 0
+_last_flush = time.monotonic()
+_lock = threading.Lock()
+
+
+def _batches(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def flush_view_counters(model, pk_to_delta: dict, batch_size: int = FLUSH_BATCH_SIZE) -> int:
+    """
+    Ajoute les deltas de vues {pk: delta} à views_count.
+    Un seul UPDATE (CASE WHEN) par lot au lieu d'un UPDATE par ligne.
+    Retourne le nombre de lignes mises à jour.
+    """
+    updated = 0
+    deltas = [(pk, delta) for pk, delta in pk_to_delta.items() if delta]
+
+    for batch in _batches(deltas, batch_size):
+        whens = [When(pk=pk, then=F('views_count') + delta) for pk, delta in batch]
+        updated += model.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+            views_count=Case(*whens, default=F('views_count'), output_field=PositiveIntegerField())
+        )
+
+    return updated
+
+
+def record_view(model, pk) -> None:
+    """Compte une vue en mémoire ; l'écriture en base est différée et groupée."""
+    global _pending_total
+
+    with _lock:
+        _pending_views[model._meta.label][pk] += 1
+        _pending_total += 1
+        due = (
+            _pending_total >= FLUSH_THRESHOLD
+            or time.monotonic() - _last_flush >= FLUSH_INTERVAL
+        )
+
+    if due:
+        flush_pending_views()
+
+
+def _take_pending_views() -> dict:
+    """Retire et retourne les vues en attente {label: {pk: delta}}."""
+    global _pending_views, _pending_total, _last_flush
+
+    with _lock:
+        pending = _pending_views
+        _pending_views = defaultdict(Counter)
+        _pending_total = 0
+        _last_flush = time.monotonic()
+    return pending
+
+
+def flush_pending_views() -> None:
+    """Planifie l'écriture des vues en attente (une tâche par modèle)."""
+    from .tasks import flush_view_counters_task
+
+    for label, deltas in _take_pending_views().items():
+        if deltas:
+            flush_view_counters_task.enqueue(label, list(deltas.items()))
+
+
+@atexit.register
+def _flush_pending_views_at_exit():
+    """Écrit les vues restantes à l'arrêt du processus."""
+    for label, deltas in _take_pending_views().items():
+        if deltas:
+            flush_view_counters(apps.get_model(label), deltas)
+
+
+# =============================================================================
+# COMPTEURS DE CONTENUS PUBLIÉS (Category / Author)
+# =============================================================================
+
+def _published_count(model, fk: str):
+    """Sous-requête : nombre de contenus publiés rattachés à la ligne courante."""
+    counts = model.objects.filter(
+        **{fk: OuterRef('pk')}, status='published'
+    ).order_by().values(fk).annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(counts), 0)
+
+
+def refresh_category_counts(*category_ids) -> None:
+    """Recalcule articles_count / videos_count des catégories données (un seul UPDATE)."""
+    from .models import Article, Category, Video
+
+    ids = {pk for pk in category_ids if pk}
+    if ids:
+        Category.objects.filter(pk__in=ids).update(
+            articles_count=_published_count(Article, 'category'),
+            videos_count=_published_count(Video, 'category'),
+        )
+
+
+def refresh_author_counts(*author_ids) -> None:
+    """Recalcule articles_count des auteurs donnés (un seul UPDATE)."""
+    from .models import Article, Author
+
+    ids = {pk for pk in author_ids if pk}
+    if ids:
+        Author.objects.filter(pk__in=ids).update(
+            articles_count=_published_count(Article, 'author'),
+        )
+
+
+def refresh_counts_for_queryset(queryset) -> None:
+    """
+    Recalcule les compteurs touchés par une mise à jour en masse (update() n'émet pas de signal).
+    Catégories et auteurs concernés sont lus en une seule requête DISTINCT.
+    """
+    if queryset.model._meta.label == 'editorial.Article':
+        pairs = list(queryset.order_by().values_list('category_id', 'author_id').distinct())
+        refresh_category_counts(*{category_id for category_id, _ in pairs})
+        refresh_author_counts(*{author_id for _, author_id in pairs})
+    else:
+        refresh_category_counts(*queryset.order_by().values_list('category_id', flat=True).distinct())
@@ -0,0 +1,111 @@
+"""
+Editorial Homepage - Construction et cache des données de la page d'accueil (US-05)
+et des listes éditoriales (articles à la Une, tendance, récents).
+"""
+
+from django.core.cache import cache
+from django.db.models import CharField, Q, Value
+from django.utils import timezone
+
+from .models import Article, Category, Video
+from .serializers import (
+    ARTICLE_LIST_FIELDS,
+    VIDEO_LIST_FIELDS,
+    article_list_data,
+    category_list_data,
+    video_list_data,
+)
+
+# Clé stable (indépendante de l'URL, des cookies et de l'utilisateur)
+HOMEPAGE_CACHE_KEY = 'editorial:homepage:v1'
+HOMEPAGE_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+
+# Listes des actions featured / trending / recent d'ArticleViewSet
+ARTICLE_LISTS_CACHE_KEY = 'editorial:article_lists:v1'
+ARTICLE_LISTS_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+
+# Sections d'articles : (nom, filtre, nombre)
+ARTICLE_SECTIONS = (
+    ('featured_articles', Q(is_featured=True), 3),
+    ('recent_articles', Q(), 8),
+    ('trending_articles', Q(is_trending=True), 6),
+)
+ARTICLE_LIST_SECTIONS = (
+    ('featured', Q(is_featured=True), 3),
+    ('trending', Q(is_trending=True), 6),
+    ('recent', Q(), 10),
+)
+
+
+def _article_section(now, name, section_filter, limit):
+    return Article.objects.published(now).filter(
+        section_filter
+    ).select_related('author', 'category').only(*ARTICLE_LIST_FIELDS).annotate(
+        section=Value(name, output_field=CharField())
+    ).order_by('-published_at', '-created_at')[:limit]
+
+
+def build_article_sections(now, sections) -> dict:
+    """
+    Sérialise plusieurs sections d'articles lues en une seule requête UNION ALL.
+    Un article présent dans plusieurs sections n'est sérialisé qu'une fois.
+    Retourne {nom de section: [articles]}.
+    """
+    querysets = [
+        _article_section(now, name, section_filter, limit)
+        for name, section_filter, limit in sections
+    ]
+    articles = querysets[0].union(*querysets[1:], all=True).order_by(
+        'section', '-published_at', '-created_at'
+    )
+
+    data = {name: [] for name, _, _ in sections}
+    serialized = {}
+    for article in articles:
+        if article.pk not in serialized:
+            serialized[article.pk] = article_list_data(article)
+        data[article.section].append(serialized[article.pk])
+    return data
+
+
+def build_homepage_data() -> dict:
+    """Construit les données de la page d'accueil."""
+    now = timezone.now()
+    data = build_article_sections(now, ARTICLE_SECTIONS)
+
+    featured_videos = Video.objects.published(now).filter(
+        is_featured=True
+    ).select_related('category').only(*VIDEO_LIST_FIELDS)[:4]
+    data['featured_videos'] = [video_list_data(video) for video in featured_videos]
+
+    featured_categories = Category.objects.filter(is_active=True, is_featured=True)[:6]
+    data['featured_categories'] = [
+        category_list_data(category) for category in featured_categories
+    ]
+    return data
+
+
+def build_article_lists_data() -> dict:
+    """Construit les listes featured / trending / recent."""
+    return build_article_sections(timezone.now(), ARTICLE_LIST_SECTIONS)
+
+
+def get_homepage_data() -> dict:
+    """Données de la page d'accueil, servies depuis le cache."""
+    return cache.get_or_set(HOMEPAGE_CACHE_KEY, build_homepage_data, HOMEPAGE_CACHE_TIMEOUT)
+
+
+def get_article_list(name: str) -> list:
+    """
+    Liste éditoriale publiée (featured, trending ou recent), précalculée.
+    Les trois listes sont construites ensemble et servies depuis le cache.
+    """
+    lists = cache.get_or_set(
+        ARTICLE_LISTS_CACHE_KEY, build_article_lists_data, ARTICLE_LISTS_CACHE_TIMEOUT
+    )
+    return lists[name]
+
+
+def invalidate_homepage_cache() -> None:
+    """Invalide la page d'accueil et les listes éditoriales (appelé par les signaux)."""
+    cache.delete_many([HOMEPAGE_CACHE_KEY, ARTICLE_LISTS_CACHE_KEY])
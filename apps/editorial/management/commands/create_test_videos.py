@@ -38,7 +38,6 @@ class Command(BaseCommand):
                 'description': 'Rencontre avec les entrepreneurs qui révolutionnent le paysage technologique africain. Innovation, défis et vision pour l\'avenir du continent.',
                 'youtube_url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
                 'youtube_id': 'dQw4w9WgXcQ',
-                'youtube_thumbnail': 'https://img.youtube.com/vi/dQw4w9WgXcQ/maxresdefault.jpg',
                 'video_type': 'interview',
                 'category': random.choice(categories) if categories else None,
                 'tags': 'Tech, Innovation, Afrique, Interview, Entrepreneurs',
@@ -51,7 +50,6 @@ class Command(BaseCommand):
                 'description': 'Un voyage à travers le continent pour découvrir les projets d\'énergie solaire et éolienne qui transforment l\'Afrique. Du Maroc au Kenya, l\'avenir énergétique se dessine.',
                 'youtube_url': 'https://www.youtube.com/watch?v=jNQXAC9IVRw',
                 'youtube_id': 'jNQXAC9IVRw',
-                'youtube_thumbnail': 'https://img.youtube.com/vi/jNQXAC9IVRw/maxresdefault.jpg',
                 'video_type': 'documentary',
                 'category': random.choice(categories) if categories else None,
                 'tags': 'Énergie, Solaire, Renouvelables, Documentaire, Afrique',
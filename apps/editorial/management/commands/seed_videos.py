@@ -6,7 +6,7 @@ Usage: python manage.py seed_videos
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from apps.editorial.models import Video, Category
-from apps.core.utils import extract_youtube_id, get_youtube_thumbnail
+from apps.core.utils import extract_youtube_id
 
 
 class Command(BaseCommand):
@@ -139,14 +139,12 @@ Production : Bo Travail ! et Voyage pour TV5 Monde''',
         for video_data in videos_data:
             youtube_url = video_data['youtube_url']
             youtube_id = extract_youtube_id(youtube_url)
-            youtube_thumbnail = get_youtube_thumbnail(youtube_id) if youtube_id else ''
 
             video, created = Video.objects.get_or_create(
                 slug=video_data['slug'],
                 defaults={
                     **video_data,
                     'youtube_id': youtube_id,
-                    'youtube_thumbnail': youtube_thumbnail,
                 }
             )
 
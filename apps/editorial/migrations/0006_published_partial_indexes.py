@@ -0,0 +1,87 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0005_make_author_social_fields_optional"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="article",
+            name="editorial_a_status_1518b6_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="article",
+            name="editorial_a_is_feat_c1a3f0_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="article",
+            name="editorial_a_is_tren_64d7f9_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="video",
+            name="editorial_v_status_43cb16_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="video",
+            name="editorial_v_is_feat_5d3208_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="video",
+            name="editorial_v_video_t_68465e_idx",
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-published_at"],
+                name="article_pub_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["is_featured", "-published_at"],
+                name="article_feat_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["is_trending", "-published_at"],
+                name="article_trend_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-published_at"],
+                name="video_pub_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["is_featured", "-published_at"],
+                name="video_feat_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["video_type", "-published_at"],
+                name="video_type_pub_idx",
+            ),
+        ),
+    ]
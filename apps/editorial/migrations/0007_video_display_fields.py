@@ -0,0 +1,66 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:30
+
+from django.db import migrations, models
+
+
+def backfill_display_fields(apps, schema_editor):
+    """Renseigne les colonnes précalculées pour les vidéos existantes."""
+    Video = apps.get_model("editorial", "Video")
+    for video in Video.objects.only(
+        "pk", "duration", "thumbnail", "youtube_thumbnail", "youtube_id"
+    ).iterator():
+        hours, remainder = divmod(video.duration or 0, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        if hours:
+            duration_formatted = f"{hours}:{minutes:02d}:{seconds:02d}"
+        else:
+            duration_formatted = f"{minutes}:{seconds:02d}"
+
+        if video.thumbnail:
+            thumbnail_url = video.thumbnail.url
+        elif video.youtube_thumbnail:
+            thumbnail_url = video.youtube_thumbnail
+        elif video.youtube_id:
+            thumbnail_url = (
+                f"https://img.youtube.com/vi/{video.youtube_id}/hqdefault.jpg"
+            )
+        else:
+            thumbnail_url = ""
+
+        Video.objects.filter(pk=video.pk).update(
+            duration_formatted=duration_formatted,
+            thumbnail_url_cached=thumbnail_url,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0006_published_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="duration_formatted",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Calculée à la sauvegarde (MM:SS ou HH:MM:SS)",
+                max_length=12,
+                verbose_name="Durée formatée",
+            ),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="thumbnail_url_cached",
+            field=models.URLField(
+                blank=True,
+                editable=False,
+                help_text="Calculée à la sauvegarde (lue directement par les listes)",
+                max_length=500,
+                verbose_name="URL de la miniature",
+            ),
+        ),
+        migrations.RunPython(backfill_display_fields, migrations.RunPython.noop),
+    ]
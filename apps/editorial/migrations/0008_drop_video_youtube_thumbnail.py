@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0007_video_display_fields"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="video",
+            name="youtube_thumbnail",
+        ),
+        migrations.AlterField(
+            model_name="video",
+            name="youtube_id",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=11, verbose_name="ID YouTube"
+            ),
+        ),
+    ]
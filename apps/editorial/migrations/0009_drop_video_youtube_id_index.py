@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0008_drop_video_youtube_thumbnail"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="video",
+            name="youtube_id",
+            field=models.CharField(
+                blank=True, max_length=11, verbose_name="ID YouTube"
+            ),
+        ),
+    ]
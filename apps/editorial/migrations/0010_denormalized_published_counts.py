@@ -0,0 +1,61 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:37
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_published_counts(apps, schema_editor):
+    """Initialise les compteurs dénormalisés à partir des contenus publiés."""
+    Article = apps.get_model("editorial", "Article")
+    Video = apps.get_model("editorial", "Video")
+    Author = apps.get_model("editorial", "Author")
+    Category = apps.get_model("editorial", "Category")
+
+    def published_count(model, fk):
+        counts = (
+            model.objects.filter(**{fk: OuterRef("pk")}, status="published")
+            .order_by()
+            .values(fk)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    Category.objects.update(
+        articles_count=published_count(Article, "category"),
+        videos_count=published_count(Video, "category"),
+    )
+    Author.objects.update(articles_count=published_count(Article, "author"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0009_drop_video_youtube_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="articles_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Articles publiés"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="articles_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Articles publiés"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="videos_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Vidéos publiées"
+            ),
+        ),
+        migrations.RunPython(backfill_published_counts, migrations.RunPython.noop),
+    ]
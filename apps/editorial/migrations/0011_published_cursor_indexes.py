@@ -0,0 +1,50 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:38
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_published_at(apps, schema_editor):
+    """Contenus publiés sans date : published_at = created_at (clé de pagination)."""
+    for model_name in ("Article", "Video"):
+        model = apps.get_model("editorial", model_name)
+        model.objects.filter(status="published", published_at__isnull=True).update(
+            published_at=F("created_at")
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0010_denormalized_published_counts"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_published_at, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="article",
+            name="article_pub_recent_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="video",
+            name="video_pub_recent_idx",
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-published_at", "-id"],
+                name="article_pub_cursor_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-published_at", "-id"],
+                name="video_pub_cursor_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0011_published_cursor_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["author", "-published_at"],
+                name="article_author_pub_idx",
+            ),
+        ),
+    ]
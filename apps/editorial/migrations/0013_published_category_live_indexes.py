@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("editorial", "0012_article_author_published_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["category", "-published_at"],
+                name="article_cat_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["category", "-published_at"],
+                name="video_cat_pub_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                condition=models.Q(("is_live", True), ("status", "published")),
+                fields=["-published_at"],
+                name="video_live_pub_idx",
+            ),
+        ),
+    ]
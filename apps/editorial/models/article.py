@@ -4,13 +4,18 @@ Wagtail Snippet avec StreamField pour blocs dynamiques
 """
 
 from django.db import models
+from django.db.models import F, Q
 from django.conf import settings
+from django.utils.functional import cached_property
 from wagtail.fields import StreamField
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel, FieldRowPanel
 from wagtail.search import index
 from wagtail.models import PreviewableMixin
 from django.http import HttpResponseRedirect
 from apps.core.models import (
+    IndexableManager,
+    LoadedStateMixin,
+    PublishedQuerySet,
     TimeStampedModel,
     SluggedModel,
     PublishableModel,
@@ -20,7 +25,7 @@ from apps.editorial.blocks import ArticleStreamBlock
 
 
 # Note: Enregistré comme snippet via EditorialViewSetGroup dans wagtail_hooks.py
-class Article(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, PublishableModel, SEOModel):
+class Article(LoadedStateMixin, PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, PublishableModel, SEOModel):
     """
     Modèle Article avec contenu riche.
     US-02: Composition d'article à l'aide de blocs dynamiques.
@@ -179,6 +184,12 @@ class Article(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, P
         ], heading="SEO", classname="collapsed"),
     ]
 
+    objects = PublishedQuerySet.as_manager()
+    index_objects = IndexableManager()
+
+    # État lu en base, comparé par les signaux des compteurs publiés
+    tracked_fields = ('status', 'category_id', 'author_id')
+
     # Wagtail Search Index
     search_fields = [
         index.SearchField('title', boost=10),
@@ -194,9 +205,32 @@ class Article(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, P
         verbose_name_plural = 'Articles'
         ordering = ['-published_at', '-created_at']
         indexes = [
-            models.Index(fields=['status', 'published_at']),
-            models.Index(fields=['is_featured', 'status']),
-            models.Index(fields=['is_trending', 'status']),
+            # Index partiels limités aux articles publiés (chemin des listes publiques)
+            models.Index(
+                fields=['-published_at', '-id'],
+                name='article_pub_cursor_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['is_featured', '-published_at'],
+                name='article_feat_pub_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['is_trending', '-published_at'],
+                name='article_trend_pub_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['author', '-published_at'],
+                name='article_author_pub_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['category', '-published_at'],
+                name='article_cat_pub_idx',
+                condition=Q(status='published'),
+            ),
             models.Index(fields=['category', 'status']),
             models.Index(fields=['author', 'status']),
         ]
@@ -204,11 +238,21 @@ class Article(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, P
     def __str__(self):
         return self.title
 
-    def get_tags_list(self) -> list:
-        """Retourne les tags sous forme de liste."""
+    @classmethod
+    def get_indexed_objects(cls):
+        """Reconstruction de l'index : seuls les champs indexés sont chargés."""
+        return cls.index_objects.indexable_queryset()
+
+    @cached_property
+    def tags_list_cached(self) -> list:
+        """Tags parsés une seule fois par instance."""
         if not self.tags:
             return []
-        return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
+        return [tag for tag in (t.strip() for t in self.tags.split(',')) if tag]
+
+    def get_tags_list(self) -> list:
+        """Retourne les tags sous forme de liste."""
+        return self.tags_list_cached
 
     def get_full_content(self) -> str:
         """
@@ -229,17 +273,28 @@ class Article(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, P
         return self.content
 
     def increment_views(self):
-        """Incrémente le compteur de vues."""
-        self.views_count += 1
-        self.save(update_fields=['views_count'])
+        """
+        Incrémente le compteur de vues.
+        UPDATE atomique (F) : une seule requête, pas de perte d'incrément
+        en cas de lectures concurrentes.
+        """
+        Article.objects.filter(pk=self.pk).update(views_count=F('views_count') + 1)
+        self.views_count = (self.views_count or 0) + 1
 
-    @property
-    def related_articles(self):
-        """Retourne les articles liés (même catégorie, US-06)."""
+    def get_related_articles_queryset(self):
+        """Queryset des articles liés (même catégorie, US-06)."""
         return Article.objects.filter(
-            category=self.category,
+            category_id=self.category_id,
             status=self.PublicationStatus.PUBLISHED
-        ).exclude(pk=self.pk)[:4]
+        ).exclude(pk=self.pk).select_related('author', 'category')
+
+    @cached_property
+    def related_articles(self) -> list:
+        """
+        Retourne les articles liés (même catégorie, US-06).
+        Évalué une seule fois par instance ; peut être pré-rempli par la vue.
+        """
+        return list(self.get_related_articles_queryset()[:4])
 
     @property
     def image_url(self) -> str:
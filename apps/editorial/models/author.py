@@ -77,6 +77,13 @@ class Author(TimeStampedModel, SluggedModel):
         help_text='Les auteurs inactifs n\'apparaissent pas dans les listes'
     )
 
+    # Compteur dénormalisé (maintenu par les signaux Article)
+    articles_count = models.PositiveIntegerField(
+        'Articles publiés',
+        default=0,
+        editable=False
+    )
+
     # Configuration du slug
     slug_source_field = 'name'
 
@@ -104,11 +111,6 @@ class Author(TimeStampedModel, SluggedModel):
     def __str__(self):
         return self.name
 
-    @property
-    def articles_count(self) -> int:
-        """Nombre d'articles publiés par cet auteur."""
-        return self.articles.filter(status='published').count()
-
     @property
     def photo_url(self) -> str:
         """URL de la photo ou placeholder."""
@@ -70,6 +70,18 @@ class Category(TimeStampedModel, SluggedModel, OrderedModel):
         help_text='Afficher dans la section vedette de l\'accueil'
     )
 
+    # Compteurs dénormalisés (maintenus par les signaux Article / Video)
+    articles_count = models.PositiveIntegerField(
+        'Articles publiés',
+        default=0,
+        editable=False
+    )
+    videos_count = models.PositiveIntegerField(
+        'Vidéos publiées',
+        default=0,
+        editable=False
+    )
+
     # Configuration du slug
     slug_source_field = 'name'
 
@@ -102,16 +114,6 @@ class Category(TimeStampedModel, SluggedModel, OrderedModel):
             return f'{self.parent.name} > {self.name}'
         return self.name
 
-    @property
-    def articles_count(self) -> int:
-        """Nombre d'articles publiés dans cette catégorie."""
-        return self.articles.filter(status='published').count()
-
-    @property
-    def videos_count(self) -> int:
-        """Nombre de vidéos publiées dans cette catégorie."""
-        return self.videos.filter(status='published').count()
-
     @property
     def total_content_count(self) -> int:
         """Nombre total de contenus dans cette catégorie."""
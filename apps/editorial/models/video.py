@@ -4,12 +4,17 @@ Wagtail Snippet pour interface unifiée
 """
 
 from django.db import models
+from django.db.models import F, Q
 from django.conf import settings
+from django.utils.functional import cached_property
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel, FieldRowPanel
 from wagtail.search import index
 from wagtail.models import PreviewableMixin
 from django.http import HttpResponseRedirect
 from apps.core.models import (
+    IndexableManager,
+    LoadedStateMixin,
+    PublishedQuerySet,
     TimeStampedModel,
     SluggedModel,
     PublishableModel,
@@ -19,7 +24,7 @@ from apps.core.validators import validate_youtube_url
 
 
 # Note: Enregistré comme snippet via EditorialViewSetGroup dans wagtail_hooks.py
-class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, PublishableModel, SEOModel):
+class Video(LoadedStateMixin, PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, PublishableModel, SEOModel):
     """
     Modèle Vidéo pour la Web TV.
     US-03: Publication de vidéos via URL YouTube.
@@ -69,10 +74,12 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
         null=True,
         help_text='Laisser vide pour utiliser la miniature YouTube'
     )
-    youtube_thumbnail = models.URLField(
-        'Miniature YouTube',
+    thumbnail_url_cached = models.URLField(
+        'URL de la miniature',
+        max_length=500,
         blank=True,
-        help_text='URL de la miniature YouTube (auto-générée)'
+        editable=False,
+        help_text='Calculée à la sauvegarde (lue directement par les listes)'
     )
 
     # Catégorisation
@@ -104,11 +111,17 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
         default=0,
         help_text='Durée de la vidéo en secondes'
     )
+    duration_formatted = models.CharField(
+        'Durée formatée',
+        max_length=12,
+        blank=True,
+        editable=False,
+        help_text='Calculée à la sauvegarde (MM:SS ou HH:MM:SS)'
+    )
     youtube_id = models.CharField(
         'ID YouTube',
-        max_length=20,
-        blank=True,
-        db_index=True
+        max_length=11,
+        blank=True
     )
 
     # Statistiques
@@ -172,6 +185,12 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
         ], heading="SEO", classname="collapsed"),
     ]
 
+    objects = PublishedQuerySet.as_manager()
+    index_objects = IndexableManager()
+
+    # État lu en base, comparé par les signaux des compteurs publiés
+    tracked_fields = ('status', 'category_id')
+
     # Wagtail Search Index
     search_fields = [
         index.SearchField('title', boost=10),
@@ -187,10 +206,33 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
         verbose_name_plural = 'Vidéos'
         ordering = ['-published_at', '-created_at']
         indexes = [
-            models.Index(fields=['status', 'published_at']),
-            models.Index(fields=['is_featured', 'status']),
+            # Index partiels limités aux vidéos publiées (chemin des listes publiques)
+            models.Index(
+                fields=['-published_at', '-id'],
+                name='video_pub_cursor_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['is_featured', '-published_at'],
+                name='video_feat_pub_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['video_type', '-published_at'],
+                name='video_type_pub_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['category', '-published_at'],
+                name='video_cat_pub_idx',
+                condition=Q(status='published'),
+            ),
+            models.Index(
+                fields=['-published_at'],
+                name='video_live_pub_idx',
+                condition=Q(status='published', is_live=True),
+            ),
             models.Index(fields=['is_live', 'status']),
-            models.Index(fields=['video_type', 'status']),
             models.Index(fields=['category', 'status']),
         ]
 
@@ -198,27 +240,30 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
         return self.title
 
     def save(self, *args, **kwargs):
-        # Extraire l'ID YouTube depuis l'URL si pas encore renseigné
-        if self.youtube_url and not self.youtube_id:
-            from apps.core.utils import extract_youtube_id
-            self.youtube_id = extract_youtube_id(self.youtube_url)
-        # Générer la miniature YouTube si on a un ID mais pas encore de miniature
-        if self.youtube_id and not self.youtube_thumbnail:
-            from apps.core.utils import get_youtube_thumbnail
-            self.youtube_thumbnail = get_youtube_thumbnail(self.youtube_id)
         super().save(*args, **kwargs)
+        # Miniature envoyée : son URL (upload_to, nom retenu par le stockage)
+        # n'est connue qu'une fois le fichier enregistré par FileField.pre_save
+        url = self.thumbnail_url
+        if url != self.thumbnail_url_cached:
+            Video.objects.filter(pk=self.pk).update(thumbnail_url_cached=url)
+            self.thumbnail_url_cached = url
+
+    @classmethod
+    def get_indexed_objects(cls):
+        """Reconstruction de l'index : seuls les champs indexés sont chargés."""
+        return cls.index_objects.indexable_queryset()
+
+    @property
+    def youtube_thumbnail(self) -> str:
+        """URL de la miniature YouTube, dérivée de youtube_id."""
+        return f'https://i.ytimg.com/vi/{self.youtube_id}/hqdefault.jpg' if self.youtube_id else ''
 
     @property
     def thumbnail_url(self) -> str:
-        """Retourne l'URL de la miniature (personnalisée > youtube_thumbnail > générée)."""
+        """Retourne l'URL de la miniature (personnalisée > YouTube)."""
         if self.thumbnail:
             return self.thumbnail.url
-        if self.youtube_thumbnail:
-            return self.youtube_thumbnail
-        # Fallback : générer l'URL directement depuis youtube_id sans accès réseau
-        if self.youtube_id:
-            return f'https://img.youtube.com/vi/{self.youtube_id}/hqdefault.jpg'
-        return ''
+        return self.youtube_thumbnail
 
     @property
     def embed_url(self) -> str:
@@ -227,9 +272,8 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
             return f'https://www.youtube.com/embed/{self.youtube_id}'
         return ''
 
-    @property
-    def duration_formatted(self) -> str:
-        """Retourne la durée formatée (MM:SS ou HH:MM:SS)."""
+    def format_duration(self) -> str:
+        """Calcule la durée formatée (MM:SS ou HH:MM:SS)."""
         if not self.duration:
             return '0:00'
 
@@ -241,34 +285,43 @@ class Video(PreviewableMixin, index.Indexed, TimeStampedModel, SluggedModel, Pub
             return f'{hours}:{minutes:02d}:{seconds:02d}'
         return f'{minutes}:{seconds:02d}'
 
-    def get_tags_list(self) -> list:
-        """Retourne les tags sous forme de liste."""
+    @cached_property
+    def tags_list_cached(self) -> list:
+        """Tags parsés une seule fois par instance."""
         if not self.tags:
             return []
-        return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
+        return [tag for tag in (t.strip() for t in self.tags.split(',')) if tag]
 
-    def increment_views(self):
-        """Incrémente le compteur de vues."""
-        self.views_count += 1
-        self.save(update_fields=['views_count'])
+    def get_tags_list(self) -> list:
+        """Retourne les tags sous forme de liste."""
+        return self.tags_list_cached
 
-    @property
-    def related_videos(self):
-        """Retourne les vidéos liées."""
+    def increment_views(self):
+        """
+        Incrémente le compteur de vues.
+        UPDATE atomique (F) : une seule requête, pas de perte d'incrément
+        en cas de lectures concurrentes.
+        """
+        Video.objects.filter(pk=self.pk).update(views_count=F('views_count') + 1)
+        self.views_count = (self.views_count or 0) + 1
+
+    @cached_property
+    def related_videos(self) -> list:
+        """
+        Retourne les vidéos liées.
+        Évalué une seule fois par instance (pas de COUNT supplémentaire).
+        """
         queryset = Video.objects.filter(
             status=self.PublicationStatus.PUBLISHED
-        ).exclude(pk=self.pk)
+        ).exclude(pk=self.pk).select_related('category')
 
         # Même type de vidéo en priorité
-        same_type = queryset.filter(video_type=self.video_type)[:4]
-        if same_type.count() >= 4:
+        same_type = list(queryset.filter(video_type=self.video_type)[:4])
+        if len(same_type) >= 4 or not self.category_id:
             return same_type
 
         # Compléter avec la même catégorie
-        if self.category:
-            same_category = queryset.filter(category=self.category).exclude(
-                pk__in=same_type.values_list('pk', flat=True)
-            )[:4 - same_type.count()]
-            return list(same_type) + list(same_category)
-
-        return same_type
+        same_category = queryset.filter(category_id=self.category_id).exclude(
+            pk__in=[video.pk for video in same_type]
+        )[:4 - len(same_type)]
+        return same_type + list(same_category)
@@ -3,6 +3,10 @@ Editorial Serializers - Sérialiseurs pour le contenu éditorial
 Compatible avec Wagtail StreamField
 """
 
+import threading
+from collections import OrderedDict
+
+from django.core.cache import cache
 from rest_framework import serializers
 from wagtail.rich_text import RichText
 from .models import Author, Category, Article, Video
@@ -22,22 +26,14 @@ except ImportError:
 class AuthorListSerializer(serializers.ModelSerializer):
     """Serializer minimal pour les listes d'auteurs."""
 
-    articles_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Author
         fields = ['id', 'name', 'slug', 'photo', 'articles_count']
 
-    def get_articles_count(self, obj):
-        # Utilise l'annotation si disponible, sinon la propriété
-        return getattr(obj, '_articles_count', None) or obj.articles_count
-
 
 class AuthorDetailSerializer(serializers.ModelSerializer):
     """Serializer complet pour les détails d'un auteur."""
 
-    articles_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Author
         fields = [
@@ -47,9 +43,6 @@ class AuthorDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'slug', 'created_at']
 
-    def get_articles_count(self, obj):
-        return getattr(obj, '_articles_count', None) or obj.articles_count
-
 
 class AuthorCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer pour la création/modification d'auteur."""
@@ -66,12 +59,17 @@ class AuthorCreateUpdateSerializer(serializers.ModelSerializer):
 # CATEGORY SERIALIZERS
 # =============================================================================
 
+# Colonnes lues par CategoryListSerializer (parent_id : rattachement des enfants préchargés).
+CATEGORY_LIST_FIELDS = (
+    'id', 'name', 'slug', 'color', 'icon', 'image',
+    'is_active', 'is_featured', 'order', 'parent_id',
+    'articles_count', 'videos_count',
+)
+
+
 class CategoryListSerializer(serializers.ModelSerializer):
     """Serializer minimal pour les listes de catégories."""
 
-    articles_count = serializers.SerializerMethodField()
-    videos_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Category
         fields = [
@@ -80,18 +78,10 @@ class CategoryListSerializer(serializers.ModelSerializer):
             'articles_count', 'videos_count'
         ]
 
-    def get_articles_count(self, obj):
-        return getattr(obj, '_articles_count', None) or obj.articles_count
-
-    def get_videos_count(self, obj):
-        return getattr(obj, '_videos_count', None) or obj.videos_count
-
 
 class CategoryDetailSerializer(serializers.ModelSerializer):
     """Serializer complet pour les détails d'une catégorie."""
 
-    articles_count = serializers.SerializerMethodField()
-    videos_count = serializers.SerializerMethodField()
     children = CategoryListSerializer(many=True, read_only=True)
 
     class Meta:
@@ -103,12 +93,6 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'slug', 'created_at']
 
-    def get_articles_count(self, obj):
-        return getattr(obj, '_articles_count', None) or obj.articles_count
-
-    def get_videos_count(self, obj):
-        return getattr(obj, '_videos_count', None) or obj.videos_count
-
 
 class CategoryCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer pour la création/modification de catégorie."""
@@ -125,6 +109,56 @@ class CategoryCreateUpdateSerializer(serializers.ModelSerializer):
 # STREAMFIELD BLOCK SERIALIZERS (Wagtail)
 # =============================================================================
 
+def _serialize_text_block(value):
+    return {'content': str(value.get('content', ''))}
+
+
+def _serialize_image_block(value):
+    image = value.get('image')
+    return {
+        'image_url': image.file.url if image else None,
+        'caption': value.get('caption', ''),
+        'attribution': value.get('attribution', ''),
+    }
+
+
+def _serialize_video_block(value):
+    embed = value.get('video')
+    return {
+        'embed_url': embed.url if embed else '',
+        'caption': value.get('caption', ''),
+    }
+
+
+def _serialize_list_block(value):
+    return {
+        'items': list(value.get('items', [])),
+        'list_type': value.get('list_type', 'ul'),
+    }
+
+
+def _fields_serializer(defaults):
+    """Construit un handler qui copie des champs simples avec leurs valeurs par défaut."""
+    def serialize(value):
+        return {name: value.get(name, default) for name, default in defaults}
+    return serialize
+
+
+# Dispatch par type de bloc, construit une seule fois au chargement du module.
+# Les handlers acceptent une valeur vide ({}) et renvoient alors les valeurs par défaut.
+_BLOCK_HANDLERS = {
+    'text': _serialize_text_block,
+    'image': _serialize_image_block,
+    'quote': _fields_serializer((('quote', ''), ('author', ''), ('source', ''))),
+    'video': _serialize_video_block,
+    'tweet': _fields_serializer((('tweet_url', ''),)),
+    'heading': _fields_serializer((('heading', ''), ('level', 'h2'))),
+    'list': _serialize_list_block,
+    'code': _fields_serializer((('language', ''), ('code', ''))),
+    'cta': _fields_serializer((('text', ''), ('url', ''), ('style', 'primary'))),
+}
+
+
 class StreamFieldBlockSerializer(serializers.Serializer):
     """Serializer pour les blocs StreamField de Wagtail."""
     type = serializers.CharField(source='block_type')
@@ -133,58 +167,45 @@ class StreamFieldBlockSerializer(serializers.Serializer):
 
     def get_value(self, block):
         """Convertit le bloc en dictionnaire sérialisable."""
-        block_type = block.block_type
         value = block.value
+        handler = _BLOCK_HANDLERS.get(block.block_type)
+        if handler is None:
+            return dict(value) if value else {}
+        return handler(value or {})
+
+
+# Cache des blocs sérialisés, clé (pk, updated_at) : une édition change la clé.
+# LRU borné en mémoire du processus, puis cache Django partagé entre workers.
+BODY_BLOCKS_CACHE_SIZE = 2048
+BODY_BLOCKS_CACHE_TIMEOUT = 60 * 60 * 24  # 24 heures
+
+_body_blocks_lru = OrderedDict()
+_body_blocks_lock = threading.Lock()
+
+
+def get_cached_body_blocks(article) -> list:
+    """Retourne les blocs StreamField sérialisés d'un article, mis en cache."""
+    updated_at = article.updated_at.isoformat() if article.updated_at else ''
+    key = (article.pk, updated_at)
+
+    with _body_blocks_lock:
+        blocks = _body_blocks_lru.get(key)
+        if blocks is not None:
+            _body_blocks_lru.move_to_end(key)
+            return blocks
 
-        if block_type == 'text':
-            return {
-                'content': str(value.get('content', '')) if value else ''
-            }
-        elif block_type == 'image':
-            image = value.get('image') if value else None
-            return {
-                'image_url': image.file.url if image else None,
-                'caption': value.get('caption', '') if value else '',
-                'attribution': value.get('attribution', '') if value else ''
-            }
-        elif block_type == 'quote':
-            return {
-                'quote': value.get('quote', '') if value else '',
-                'author': value.get('author', '') if value else '',
-                'source': value.get('source', '') if value else ''
-            }
-        elif block_type == 'video':
-            embed = value.get('video') if value else None
-            return {
-                'embed_url': embed.url if embed else '',
-                'caption': value.get('caption', '') if value else ''
-            }
-        elif block_type == 'tweet':
-            return {
-                'tweet_url': value.get('tweet_url', '') if value else ''
-            }
-        elif block_type == 'heading':
-            return {
-                'heading': value.get('heading', '') if value else '',
-                'level': value.get('level', 'h2') if value else 'h2'
-            }
-        elif block_type == 'list':
-            return {
-                'items': list(value.get('items', [])) if value else [],
-                'list_type': value.get('list_type', 'ul') if value else 'ul'
-            }
-        elif block_type == 'code':
-            return {
-                'language': value.get('language', '') if value else '',
-                'code': value.get('code', '') if value else ''
-            }
-        elif block_type == 'cta':
-            return {
-                'text': value.get('text', '') if value else '',
-                'url': value.get('url', '') if value else '',
-                'style': value.get('style', 'primary') if value else 'primary'
-            }
-        return dict(value) if value else {}
+    cache_key = f'article_body_blocks_{article.pk}_{updated_at}'
+    blocks = cache.get(cache_key)
+    if blocks is None:
+        blocks = list(StreamFieldBlockSerializer(article.body, many=True).data)
+        cache.set(cache_key, blocks, BODY_BLOCKS_CACHE_TIMEOUT)
+
+    with _body_blocks_lock:
+        _body_blocks_lru[key] = blocks
+        _body_blocks_lru.move_to_end(key)
+        if len(_body_blocks_lru) > BODY_BLOCKS_CACHE_SIZE:
+            _body_blocks_lru.popitem(last=False)
+    return blocks
 
 
 # Legacy serializer pour compatibilité avec l'ancienne API
@@ -204,6 +225,22 @@ class ArticleBlockSerializer(serializers.Serializer):
 # ARTICLE SERIALIZERS
 # =============================================================================
 
+# Colonnes lues par ArticleListSerializer (auteur et catégorie imbriqués inclus).
+# Les clés étrangères author_id / category_id doivent rester présentes pour que
+# select_related puisse rattacher les objets sans requête supplémentaire.
+ARTICLE_LIST_FIELDS = (
+    'id', 'title', 'slug', 'excerpt', 'featured_image', 'external_image_url',
+    'author_id', 'category_id', 'reading_time', 'views_count',
+    'is_featured', 'is_trending', 'status', 'published_at', 'created_at',
+    'author__id', 'author__name', 'author__slug', 'author__photo',
+    'author__articles_count',
+    'category__id', 'category__name', 'category__slug', 'category__color',
+    'category__icon', 'category__image', 'category__is_active',
+    'category__is_featured', 'category__order',
+    'category__articles_count', 'category__videos_count',
+)
+
+
 class ArticleListSerializer(serializers.ModelSerializer):
     """Serializer minimal pour les listes d'articles (US-05)."""
 
@@ -228,7 +265,7 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
     body_blocks = serializers.SerializerMethodField()
     # Legacy: blocks pour compatibilité avec l'ancienne API
     blocks = ArticleBlockSerializer(many=True, read_only=True)
-    tags_list = serializers.ListField(source='get_tags_list', read_only=True)
+    tags_list = serializers.ListField(source='tags_list_cached', read_only=True)
     related_articles = ArticleListSerializer(many=True, read_only=True)
     image_url = serializers.CharField(read_only=True)
 
@@ -244,10 +281,10 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_body_blocks(self, obj):
-        """Sérialise les blocs StreamField du body."""
+        """Sérialise les blocs StreamField du body (mis en cache par version)."""
         if not obj.body:
             return []
-        return StreamFieldBlockSerializer(obj.body, many=True).data
+        return get_cached_body_blocks(obj)
 
 
 class ArticleCreateUpdateSerializer(serializers.ModelSerializer):
@@ -314,12 +351,23 @@ class ArticleAdminSerializer(serializers.ModelSerializer):
 # VIDEO SERIALIZERS
 # =============================================================================
 
+# Colonnes lues par VideoListSerializer (catégorie imbriquée incluse).
+VIDEO_LIST_FIELDS = (
+    'id', 'title', 'slug', 'description', 'youtube_id',
+    'thumbnail_url_cached', 'duration_formatted', 'video_type', 'category_id',
+    'views_count', 'is_featured', 'is_live', 'status', 'published_at',
+    'category__id', 'category__name', 'category__slug', 'category__color',
+    'category__icon', 'category__image', 'category__is_active',
+    'category__is_featured', 'category__order',
+    'category__articles_count', 'category__videos_count',
+)
+
+
 class VideoListSerializer(serializers.ModelSerializer):
     """Serializer minimal pour les listes de vidéos (US-07)."""
 
     category = CategoryListSerializer(read_only=True)
-    thumbnail_url = serializers.CharField(read_only=True)
-    duration_formatted = serializers.CharField(read_only=True)
+    thumbnail_url = serializers.CharField(source='thumbnail_url_cached', read_only=True)
 
     class Meta:
         model = Video
@@ -335,10 +383,9 @@ class VideoDetailSerializer(serializers.ModelSerializer):
     """Serializer complet pour les détails d'une vidéo."""
 
     category = CategoryDetailSerializer(read_only=True)
-    thumbnail_url = serializers.CharField(read_only=True)
+    thumbnail_url = serializers.CharField(source='thumbnail_url_cached', read_only=True)
     embed_url = serializers.CharField(read_only=True)
-    duration_formatted = serializers.CharField(read_only=True)
-    tags_list = serializers.ListField(source='get_tags_list', read_only=True)
+    tags_list = serializers.ListField(source='tags_list_cached', read_only=True)
     related_videos = VideoListSerializer(many=True, read_only=True)
 
     class Meta:
@@ -371,7 +418,7 @@ class VideoAdminSerializer(serializers.ModelSerializer):
 
     category_name = serializers.CharField(source='category.name', read_only=True)
     created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
-    thumbnail_url = serializers.CharField(read_only=True)
+    thumbnail_url = serializers.CharField(source='thumbnail_url_cached', read_only=True)
 
     class Meta:
         model = Video
@@ -382,3 +429,92 @@ class VideoAdminSerializer(serializers.ModelSerializer):
             'created_by', 'created_by_name', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'slug', 'views_count', 'created_at', 'updated_at']
+
+
+# =============================================================================
+# PROJECTIONS LÉGÈRES (listes à fort trafic)
+# =============================================================================
+# Même sortie que les *ListSerializer, sans l'arbre de champs DRF par ligne.
+# Utilisées par la page d'accueil et les actions featured / trending / recent.
+
+_datetime_field = serializers.DateTimeField()
+
+
+def _file_url(file):
+    return file.url if file else None
+
+
+def _datetime(value):
+    return _datetime_field.to_representation(value) if value else None
+
+
+def author_list_data(author) -> dict:
+    """Équivalent de AuthorListSerializer(author).data."""
+    if author is None:
+        return None
+    return {
+        'id': author.id,
+        'name': author.name,
+        'slug': author.slug,
+        'photo': _file_url(author.photo),
+        'articles_count': author.articles_count,
+    }
+
+
+def category_list_data(category) -> dict:
+    """Équivalent de CategoryListSerializer(category).data."""
+    if category is None:
+        return None
+    return {
+        'id': category.id,
+        'name': category.name,
+        'slug': category.slug,
+        'color': category.color,
+        'icon': category.icon,
+        'image': _file_url(category.image),
+        'is_active': category.is_active,
+        'is_featured': category.is_featured,
+        'order': category.order,
+        'articles_count': category.articles_count,
+        'videos_count': category.videos_count,
+    }
+
+
+def article_list_data(article) -> dict:
+    """Équivalent de ArticleListSerializer(article).data."""
+    return {
+        'id': article.id,
+        'title': article.title,
+        'slug': article.slug,
+        'excerpt': article.excerpt,
+        'featured_image': _file_url(article.featured_image),
+        'image_url': article.image_url,
+        'author': author_list_data(article.author),
+        'category': category_list_data(article.category),
+        'reading_time': article.reading_time,
+        'views_count': article.views_count,
+        'is_featured': article.is_featured,
+        'is_trending': article.is_trending,
+        'status': article.status,
+        'published_at': _datetime(article.published_at),
+    }
+
+
+def video_list_data(video) -> dict:
+    """Équivalent de VideoListSerializer(video).data."""
+    return {
+        'id': video.id,
+        'title': video.title,
+        'slug': video.slug,
+        'description': video.description,
+        'youtube_id': video.youtube_id,
+        'thumbnail_url': video.thumbnail_url_cached,
+        'duration_formatted': video.duration_formatted,
+        'video_type': video.video_type,
+        'category': category_list_data(video.category),
+        'views_count': video.views_count,
+        'is_featured': video.is_featured,
+        'is_live': video.is_live,
+        'status': video.status,
+        'published_at': _datetime(video.published_at),
+    }
@@ -3,12 +3,21 @@ Editorial Signals - Signaux pour les opérations automatiques
 """
 
 import logging
-from django.db.models.signals import pre_save, post_save
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.conf import settings
 
-from apps.core.utils import calculate_reading_time, extract_youtube_id, get_youtube_thumbnail
-from .models import Article, Video
+from apps.core.signals import publication_changed
+from apps.core.utils import (
+    bump_content_version,
+    calculate_reading_time,
+    extract_youtube_id,
+    generate_excerpt,
+)
+from .counters import refresh_author_counts, refresh_category_counts
+from .homepage import invalidate_homepage_cache
+from .models import Article, Author, Category, Video
 
 logger = logging.getLogger(__name__)
 
@@ -26,38 +35,42 @@ def update_article_reading_time(sender, instance, **kwargs):
 @receiver(pre_save, sender=Video)
 def update_video_youtube_data(sender, instance, **kwargs):
     """
-    Extrait l'ID YouTube et la miniature automatiquement (US-03).
+    Extrait l'ID YouTube automatiquement (US-03).
+    La miniature YouTube est dérivée de l'ID (propriété du modèle).
     """
     if instance.youtube_url:
-        # Extraire l'ID YouTube
         video_id = extract_youtube_id(instance.youtube_url)
         if video_id:
             instance.youtube_id = video_id
 
-            # Générer la miniature si pas déjà définie
-            if not instance.youtube_thumbnail:
-                instance.youtube_thumbnail = get_youtube_thumbnail(video_id)
 
+@receiver(pre_save, sender=Video)
+def update_video_display_fields(sender, instance, **kwargs):
+    """
+    Précalcule la durée formatée et l'URL de la miniature.
+    Les listes lisent ces colonnes au lieu de les recalculer à chaque ligne.
+    L'URL d'une miniature pas encore enregistrée est fixée par Video.save().
+    """
+    instance.duration_formatted = instance.format_duration()
+    if not instance.thumbnail or instance.thumbnail._committed:
+        instance.thumbnail_url_cached = instance.thumbnail_url
 
-@receiver(post_save, sender=Article)
-def generate_article_excerpt(sender, instance, created, **kwargs):
+
+@receiver(pre_save, sender=Article)
+def generate_article_excerpt(sender, instance, **kwargs):
     """
     Génère un extrait automatique si non défini.
+    Calculé avant la sauvegarde : écrit dans le même INSERT/UPDATE.
     """
     if not instance.excerpt and instance.content:
-        from apps.core.utils import generate_excerpt
-
-        excerpt = generate_excerpt(instance.content, max_length=300)
-        if excerpt:
-            # Utiliser update pour éviter une boucle infinie
-            Article.objects.filter(pk=instance.pk).update(excerpt=excerpt)
+        instance.excerpt = generate_excerpt(instance.content, max_length=300) or ''
 
 
 @receiver(post_save, sender=Article)
 def send_newsletter_on_publish(sender, instance, created, **kwargs):
     """
-    Envoie une notification newsletter quand un article est publié.
-    Déclenché uniquement quand le statut passe à 'published'.
+    Planifie la notification newsletter quand un article est publié.
+    L'envoi est délégué à une tâche, déclenchée après le commit.
     """
     from apps.core.models import PublishableModel
 
@@ -70,29 +83,17 @@ def send_newsletter_on_publish(sender, instance, created, **kwargs):
         return
 
     # Importer ici pour éviter les imports circulaires
-    from apps.engagement.services import send_article_notification
+    from apps.engagement.tasks import send_article_notification_task
 
-    try:
-        # Envoyer la notification (la fonction vérifie les doublons)
-        result = send_article_notification(instance)
-
-        if result.get('already_sent'):
-            logger.debug(f'Notification already sent for article: {instance.title}')
-        elif result.get('success'):
-            logger.info(f'Newsletter notification sent for article: {instance.title}')
-        else:
-            logger.warning(f'Failed to send notification for article: {instance.title}')
-
-    except Exception as e:
-        # Ne pas bloquer la sauvegarde de l'article en cas d'erreur
-        logger.error(f'Error sending newsletter notification: {e}')
+    article_pk = instance.pk
+    transaction.on_commit(lambda: send_article_notification_task.enqueue(article_pk))
 
 
 @receiver(post_save, sender=Video)
 def send_newsletter_on_video_publish(sender, instance, created, **kwargs):
     """
-    Envoie une notification newsletter quand une vidéo est publiée.
-    Déclenché uniquement quand le statut passe à 'published'.
+    Planifie la notification newsletter quand une vidéo est publiée.
+    L'envoi est délégué à une tâche, déclenchée après le commit.
     """
     from apps.core.models import PublishableModel
 
@@ -105,19 +106,128 @@ def send_newsletter_on_video_publish(sender, instance, created, **kwargs):
         return
 
     # Importer ici pour éviter les imports circulaires
-    from apps.engagement.services import send_video_notification
-
-    try:
-        # Envoyer la notification (la fonction vérifie les doublons)
-        result = send_video_notification(instance)
-
-        if result.get('already_sent'):
-            logger.debug(f'Notification already sent for video: {instance.title}')
-        elif result.get('success'):
-            logger.info(f'Newsletter notification sent for video: {instance.title}')
-        else:
-            logger.warning(f'Failed to send notification for video: {instance.title}')
-
-    except Exception as e:
-        # Ne pas bloquer la sauvegarde de la vidéo en cas d'erreur
-        logger.error(f'Error sending video newsletter notification: {e}')
+    from apps.engagement.tasks import send_video_notification_task
+
+    video_pk = instance.pk
+    transaction.on_commit(lambda: send_video_notification_task.enqueue(video_pk))
+
+
+# =============================================================================
+# COMPTEURS DÉNORMALISÉS (Category.articles_count / videos_count, Author.articles_count)
+# =============================================================================
+
+# Champs dont la modification peut changer les compteurs (update_fields)
+COUNTER_FIELDS = frozenset({'status', 'category', 'category_id', 'author', 'author_id'})
+
+
+def _touches_counters(update_fields) -> bool:
+    """La sauvegarde peut modifier statut, catégorie ou auteur."""
+    return update_fields is None or not COUNTER_FIELDS.isdisjoint(update_fields)
+
+
+@receiver(pre_save, sender=Article)
+@receiver(pre_save, sender=Video)
+def remember_previous_counter_state(sender, instance, update_fields=None, **kwargs):
+    """
+    Mémorise statut et rattachements avant modification : état lu par from_db,
+    relu en base seulement s'il est inconnu (instance construite, champs différés).
+    """
+    instance._previous_counter_state = None
+    if instance.pk and _touches_counters(update_fields):
+        instance._previous_counter_state = instance.get_loaded_state() or sender.objects.filter(
+            pk=instance.pk
+        ).values(*sender.tracked_fields).first()
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Video)
+def update_published_counters(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Met à jour les compteurs lorsque le statut publié ou la catégorie / l'auteur change.
+    """
+    if not _touches_counters(update_fields):
+        return
+
+    previous = getattr(instance, '_previous_counter_state', None) or {}
+    instance.remember_loaded_state(*(
+        name for name in sender.tracked_fields
+        if update_fields is None or name in update_fields or name.removesuffix('_id') in update_fields
+    ))
+    was_published = previous.get('status') == 'published'
+    is_published = instance.status == 'published'
+
+    moved = previous.get('category_id') != instance.category_id or (
+        sender is Article and previous.get('author_id') != instance.author_id
+    )
+    if not (was_published or is_published) or (was_published == is_published and not moved):
+        return
+
+    refresh_category_counts(previous.get('category_id'), instance.category_id)
+    if sender is Article:
+        refresh_author_counts(previous.get('author_id'), instance.author_id)
+
+
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Video)
+def update_published_counters_on_delete(sender, instance, **kwargs):
+    """Met à jour les compteurs après suppression d'un contenu publié."""
+    if instance.status != 'published':
+        return
+    refresh_category_counts(instance.category_id)
+    if sender is Article:
+        refresh_author_counts(instance.author_id)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Video)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Video)
+@receiver(post_delete, sender=Category)
+def invalidate_homepage_on_change(sender, instance, **kwargs):
+    """
+    Invalide le cache de la page d'accueil après toute modification de contenu.
+    La lecture suivante le reconstruit (get_or_set) : une série de sauvegardes
+    (import, publication groupée) ne paie aucune reconstruction.
+    """
+    invalidate_homepage_cache()
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Video)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Video)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Author)
+def bump_list_version_on_change(sender, **kwargs):
+    """Change la version (ETag) des listes publiques après toute modification de contenu."""
+    bump_content_version(sender)
+
+
+@receiver(publication_changed, sender=Article)
+@receiver(publication_changed, sender=Video)
+def on_publication_changed(sender, instance, previous_status, **kwargs):
+    """
+    Effets d'un publish / unpublish fait par UPDATE (sans post_save) :
+    compteurs, page d'accueil, newsletter et index de recherche.
+    """
+    from wagtail.search import index
+
+    if previous_status != instance.status:
+        # Seul le statut a été écrit (update_status)
+        instance.remember_loaded_state('status')
+        refresh_category_counts(instance.category_id)
+        if sender is Article:
+            refresh_author_counts(instance.author_id)
+
+    invalidate_homepage_on_change(sender, instance)
+    bump_list_version_on_change(sender)
+
+    if sender is Article:
+        send_newsletter_on_publish(sender, instance, created=False)
+    else:
+        send_newsletter_on_video_publish(sender, instance, created=False)
+
+    index.insert_or_update_object(instance)
@@ -0,0 +1,20 @@
+"""
+Editorial Tasks - Tâches asynchrones (django_tasks, backend configuré via TASKS)
+"""
+
+import logging
+from django.apps import apps
+from django_tasks import task
+
+from .counters import flush_view_counters
+
+logger = logging.getLogger(__name__)
+
+
+@task()
+def flush_view_counters_task(model_label: str, deltas: list):
+    """Écrit en base un lot de vues [(pk, delta), ...] pour un modèle."""
+    model = apps.get_model(model_label)
+    updated = flush_view_counters(model, dict(deltas))
+    logger.debug(f'{updated} {model_label} view counters flushed')
+    return updated
@@ -2,28 +2,89 @@
 Editorial Views - Vues pour le contenu éditorial
 """
 
+import orjson
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAdminUser
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from django.utils import timezone
-from django.db.models import Q, Count, Prefetch
+from django.http import StreamingHttpResponse
+from django.db.models import Prefetch
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from apps.core.permissions import IsEditorOrReadOnly, CanPublish
-from apps.core.mixins import MultiSerializerViewSetMixin
+from apps.core.mixins import ConditionalGetMixin, MultiSerializerViewSetMixin, PublishedMixin
+from apps.core.pagination import EstimatedCountPageNumberPagination
 from .models import Author, Category, Article, Video
 from .serializers import (
     AuthorListSerializer, AuthorDetailSerializer, AuthorCreateUpdateSerializer,
     CategoryListSerializer, CategoryDetailSerializer, CategoryCreateUpdateSerializer,
     ArticleListSerializer, ArticleDetailSerializer, ArticleCreateUpdateSerializer, ArticleAdminSerializer,
     VideoListSerializer, VideoDetailSerializer, VideoCreateUpdateSerializer, VideoAdminSerializer,
+    ARTICLE_LIST_FIELDS, CATEGORY_LIST_FIELDS, VIDEO_LIST_FIELDS, article_list_data, video_list_data,
 )
 from .filters import ArticleFilter, VideoFilter
+from .counters import record_view
+from .homepage import get_article_list, get_homepage_data
+
+
+# Forme des listes publiques d'articles / vidéos (schéma OpenAPI)
+CURSOR_LIST_DESCRIPTION = (
+    'Visiteurs : pagination par curseur, réponse {"next", "previous", "results"} '
+    'sans "count" ni numéro de page ; suivre les URLs next / previous. '
+    'Éditeurs : pagination par numéro de page ({"count", "next", "previous", "results"}, ?page=). '
+    '?ordering= accepte les champs de tri de la liste (préfixe - pour décroissant).'
+)
+
+
+class PublishedCursorPagination(CursorPagination):
+    """
+    Pagination par curseur (published_at, id) pour les listes d'articles et de vidéos.
+    Pas de COUNT ni d'OFFSET : chaque page est une recherche dans l'index.
+    La réponse ne porte ni count ni numéro de page (CURSOR_LIST_DESCRIPTION).
+    """
+    ordering = ('-published_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+
+    def get_ordering(self, request, queryset, view):
+        # Tri demandé (?ordering=) limité aux ordering_fields de la vue, id en départage
+        requested = [
+            field.strip() for field in request.query_params.get('ordering', '').split(',')
+            if field.strip()
+        ]
+        allowed = getattr(view, 'ordering_fields', ())
+        invalid = [field for field in requested if field.lstrip('-') not in allowed]
+        if invalid:
+            raise ValidationError({'ordering': [f'Tri non supporté : {", ".join(invalid)}.']})
+        if requested:
+            return tuple(requested) + ('-id',)
+        return self.ordering
+
+
+class EditorPageNumberPagination(EstimatedCountPageNumberPagination):
+    """Pagination par numéro de page des listes éditeurs (brouillons compris)."""
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+
+
+class PublishedPaginationMixin:
+    """
+    Curseur (published_at, id) pour les listes publiées uniquement : les éditeurs
+    voient aussi les brouillons, dont published_at est NULL et ne peut servir
+    de position de curseur ; leurs listes sont paginées par numéro de page.
+    """
+
+    @property
+    def pagination_class(self):
+        user = getattr(getattr(self, 'request', None), 'user', None)
+        if user is not None and user.is_authenticated and getattr(user, 'is_editor', False):
+            return EditorPageNumberPagination
+        return PublishedCursorPagination
 
 
 # =============================================================================
@@ -38,7 +99,7 @@ from .filters import ArticleFilter, VideoFilter
     partial_update=extend_schema(tags=['Authors']),
     destroy=extend_schema(tags=['Authors']),
 )
-class AuthorViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
+class AuthorViewSet(PublishedMixin, MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour la gestion des auteurs (US-01).
     """
@@ -63,19 +124,13 @@ class AuthorViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
         # Admins voient tous les auteurs
         if self.request.user.is_authenticated and self.request.user.is_staff:
             queryset = Author.objects.all()
-        # Annoter le count des articles pour éviter N+1
-        return queryset.annotate(
-            _articles_count=Count('articles', filter=Q(articles__status='published'))
-        )
+        return queryset
 
     @action(detail=True, methods=['get'])
     def articles(self, request, pk=None):
         """Liste des articles d'un auteur."""
         author = self.get_object()
-        articles = author.articles.filter(
-            status='published',
-            published_at__lte=timezone.now()
-        ).select_related('author', 'category')
+        articles = author.articles.published(self.published_now).select_related('author', 'category').only(*ARTICLE_LIST_FIELDS)
         serializer = ArticleListSerializer(articles, many=True)
         return Response(serializer.data)
 
@@ -84,7 +139,7 @@ class AuthorViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
 # CATEGORY VIEWS
 # =============================================================================
 
-class CategoryPagination(PageNumberPagination):
+class CategoryPagination(EstimatedCountPageNumberPagination):
     """Pagination pour les catégories — autorise page_size jusqu'à 200."""
     page_size = 100
     page_size_query_param = 'page_size'
@@ -99,7 +154,7 @@ class CategoryPagination(PageNumberPagination):
     partial_update=extend_schema(tags=['Categories']),
     destroy=extend_schema(tags=['Categories']),
 )
-class CategoryViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
+class CategoryViewSet(PublishedMixin, MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour la gestion des catégories (US-01).
     """
@@ -129,11 +184,13 @@ class CategoryViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
         elif self.action == 'list':
             # Par défaut, ne montrer que les catégories racines
             queryset = queryset.filter(parent__isnull=True)
-        # Annoter les counts pour éviter N+1
-        return queryset.annotate(
-            _articles_count=Count('articles', filter=Q(articles__status='published')),
-            _videos_count=Count('videos', filter=Q(videos__status='published'))
-        ).prefetch_related('children')
+        if self.action == 'retrieve':
+            # Seul CategoryDetailSerializer affiche les sous-catégories
+            queryset = queryset.prefetch_related(Prefetch(
+                'children',
+                queryset=Category.objects.filter(is_active=True).only(*CATEGORY_LIST_FIELDS),
+            ))
+        return queryset
 
     @method_decorator(cache_page(60 * 10))  # Cache liste 10 min
     def list(self, request, *args, **kwargs):
@@ -143,10 +200,7 @@ class CategoryViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     def articles(self, request, pk=None):
         """Liste des articles d'une catégorie."""
         category = self.get_object()
-        articles = category.articles.filter(
-            status='published',
-            published_at__lte=timezone.now()
-        ).select_related('author', 'category')
+        articles = category.articles.published(self.published_now).select_related('author', 'category').only(*ARTICLE_LIST_FIELDS)
         serializer = ArticleListSerializer(articles, many=True)
         return Response(serializer.data)
 
@@ -154,10 +208,7 @@ class CategoryViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     def videos(self, request, pk=None):
         """Liste des vidéos d'une catégorie."""
         category = self.get_object()
-        videos = category.videos.filter(
-            status='published',
-            published_at__lte=timezone.now()
-        ).select_related('category')
+        videos = category.videos.published(self.published_now).select_related('category').only(*VIDEO_LIST_FIELDS)
         serializer = VideoListSerializer(videos, many=True)
         return Response(serializer.data)
 
@@ -174,14 +225,14 @@ class CategoryViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
 # =============================================================================
 
 @extend_schema_view(
-    list=extend_schema(tags=['Articles']),
+    list=extend_schema(tags=['Articles'], description=CURSOR_LIST_DESCRIPTION),
     retrieve=extend_schema(tags=['Articles']),
     create=extend_schema(tags=['Articles']),
     update=extend_schema(tags=['Articles']),
     partial_update=extend_schema(tags=['Articles']),
     destroy=extend_schema(tags=['Articles']),
 )
-class ArticleViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
+class ArticleViewSet(PublishedPaginationMixin, ConditionalGetMixin, PublishedMixin, MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour la gestion des articles (US-02, US-04, US-05, US-06).
     """
@@ -191,7 +242,13 @@ class ArticleViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = ArticleFilter
     search_fields = ['title', 'excerpt', 'content', 'tags']
-    ordering_fields = ['published_at', 'created_at', 'views_count', 'reading_time']
+    ordering_fields = ['published_at', 'created_at', 'views_count', 'reading_time', 'title']
+
+    # Vues (écrites par update()) et objets liés affichés par le détail
+    detail_version_fields = ('pk', 'updated_at', 'views_count', 'category__updated_at', 'author__updated_at')
+
+    # Modèles affichés par les listes (version / ETag)
+    list_version_models = (Article, Category, Author)
 
     serializer_class = ArticleListSerializer
     serializer_action_classes = {
@@ -202,16 +259,18 @@ class ArticleViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
         'partial_update': ArticleCreateUpdateSerializer,
     }
 
+    # Actions rendues avec ArticleListSerializer : inutile de charger content/body
+    list_actions = ('list', 'featured', 'trending', 'recent')
+
     def get_queryset(self):
         queryset = super().get_queryset()
 
         # Les visiteurs ne voient que les articles publiés
         if not self.request.user.is_authenticated or not self.request.user.is_editor:
-            queryset = queryset.filter(
-                status='published'
-            ).filter(
-                Q(published_at__isnull=True) | Q(published_at__lte=timezone.now())
-            )
+            queryset = queryset.published(self.published_now)
+
+        if self.action in self.list_actions:
+            queryset = queryset.only(*ARTICLE_LIST_FIELDS)
 
         return queryset
 
@@ -222,50 +281,72 @@ class ArticleViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
         serializer.save(updated_by=self.request.user)
 
     def retrieve(self, request, *args, **kwargs):
+        is_visitor = self.is_public_request(request)
+        if is_visitor:
+            # Version (pk, updated_at) lue sans charger la ligne complète
+            etag, last_modified, pk = self.get_detail_conditions(request)
+            if etag:
+                # Vue comptée en mémoire, écrite en base par lots
+                record_view(Article, pk)
+                not_modified = self.get_not_modified_response(request, etag, last_modified)
+                if not_modified is not None:
+                    return not_modified
+                # Réponse déjà sérialisée pour cette version : ni chargement, ni sérialisation
+                data = self.get_cached_detail_data(etag)
+                if data is not None:
+                    return Response(data, headers=self.conditional_headers(etag, last_modified))
+
         instance = self.get_object()
-        # Incrémenter les vues pour les visiteurs
-        if not request.user.is_authenticated or not request.user.is_editor:
-            instance.increment_views()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        # Articles liés : une seule requête, limitée aux colonnes des listes
+        instance.related_articles = list(
+            instance.get_related_articles_queryset().only(*ARTICLE_LIST_FIELDS)[:4]
+        )
+        data = self.get_serializer(instance).data
+        if not is_visitor:
+            return Response(data)
+
+        version = self.get_instance_version(instance)
+        etag = self.make_etag(version)
+        self.set_cached_detail_data(etag, data)
+        return Response(data, headers=self.conditional_headers(etag, self.get_last_modified(version)))
 
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Articles à la Une (US-05)."""
+        if self.is_public_request(request):
+            return Response(get_article_list('featured'))
         articles = self.get_queryset().filter(is_featured=True)[:3]
-        serializer = ArticleListSerializer(articles, many=True)
-        return Response(serializer.data)
+        return Response([article_list_data(article) for article in articles])
 
     @action(detail=False, methods=['get'])
     def trending(self, request):
         """Articles tendance."""
+        if self.is_public_request(request):
+            return Response(get_article_list('trending'))
         articles = self.get_queryset().filter(is_trending=True)[:6]
-        serializer = ArticleListSerializer(articles, many=True)
-        return Response(serializer.data)
+        return Response([article_list_data(article) for article in articles])
 
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """Articles récents."""
+        if self.is_public_request(request):
+            return Response(get_article_list('recent'))
         articles = self.get_queryset().order_by('-published_at')[:10]
-        serializer = ArticleListSerializer(articles, many=True)
-        return Response(serializer.data)
+        return Response([article_list_data(article) for article in articles])
 
     @action(detail=True, methods=['post'], permission_classes=[CanPublish])
-    def publish(self, request, pk=None):
+    def publish(self, request, slug=None):
         """Publier un article (US-04)."""
         article = self.get_object()
-        article.status = 'published'
-        if not article.published_at:
-            article.published_at = timezone.now()
-        article.save()
+        # UPDATE limité aux colonnes de publication (signal publication_changed)
+        article.update_status('published')
         return Response({'message': 'Article publié'})
 
     @action(detail=True, methods=['post'], permission_classes=[CanPublish])
-    def unpublish(self, request, pk=None):
+    def unpublish(self, request, slug=None):
         """Dépublier un article."""
         article = self.get_object()
-        article.status = 'draft'
-        article.save()
+        article.update_status('draft')
         return Response({'message': 'Article dépublié'})
 
 
@@ -274,14 +355,14 @@ class ArticleViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
 # =============================================================================
 
 @extend_schema_view(
-    list=extend_schema(tags=['Videos']),
+    list=extend_schema(tags=['Videos'], description=CURSOR_LIST_DESCRIPTION),
     retrieve=extend_schema(tags=['Videos']),
     create=extend_schema(tags=['Videos']),
     update=extend_schema(tags=['Videos']),
     partial_update=extend_schema(tags=['Videos']),
     destroy=extend_schema(tags=['Videos']),
 )
-class VideoViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
+class VideoViewSet(PublishedPaginationMixin, ConditionalGetMixin, PublishedMixin, MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour la gestion des vidéos Web TV (US-03, US-07).
     """
@@ -291,7 +372,13 @@ class VideoViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = VideoFilter
     search_fields = ['title', 'description', 'tags']
-    ordering_fields = ['published_at', 'created_at', 'views_count', 'duration']
+    ordering_fields = ['published_at', 'created_at', 'views_count', 'duration', 'title']
+
+    # Vues (écrites par update()) et objets liés affichés par le détail
+    detail_version_fields = ('pk', 'updated_at', 'views_count', 'category__updated_at')
+
+    # Modèles affichés par les listes (version / ETag)
+    list_version_models = (Video, Category)
 
     serializer_class = VideoListSerializer
     serializer_action_classes = {
@@ -302,16 +389,15 @@ class VideoViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
         'partial_update': VideoCreateUpdateSerializer,
     }
 
+    # Plafond de by_type lorsque ?type= est absent
+    by_type_max_results = 500
+
     def get_queryset(self):
         queryset = super().get_queryset()
 
         # Les visiteurs ne voient que les vidéos publiées
         if not self.request.user.is_authenticated or not self.request.user.is_editor:
-            queryset = queryset.filter(
-                status='published'
-            ).filter(
-                Q(published_at__isnull=True) | Q(published_at__lte=timezone.now())
-            )
+            queryset = queryset.published(self.published_now)
 
         return queryset
 
@@ -319,54 +405,78 @@ class VideoViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
         serializer.save(created_by=self.request.user)
 
     def retrieve(self, request, *args, **kwargs):
+        is_visitor = self.is_public_request(request)
+        if is_visitor:
+            # Version (pk, updated_at) lue sans charger la ligne complète
+            etag, last_modified, pk = self.get_detail_conditions(request)
+            if etag:
+                # Vue comptée en mémoire, écrite en base par lots
+                record_view(Video, pk)
+                not_modified = self.get_not_modified_response(request, etag, last_modified)
+                if not_modified is not None:
+                    return not_modified
+                # Réponse déjà sérialisée pour cette version : ni chargement, ni sérialisation
+                data = self.get_cached_detail_data(etag)
+                if data is not None:
+                    return Response(data, headers=self.conditional_headers(etag, last_modified))
+
         instance = self.get_object()
-        # Incrémenter les vues pour les visiteurs
-        if not request.user.is_authenticated or not request.user.is_editor:
-            instance.increment_views()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        data = self.get_serializer(instance).data
+        if not is_visitor:
+            return Response(data)
+
+        version = self.get_instance_version(instance)
+        etag = self.make_etag(version)
+        self.set_cached_detail_data(etag, data)
+        return Response(data, headers=self.conditional_headers(etag, self.get_last_modified(version)))
 
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Vidéos en vedette (US-03)."""
         videos = self.get_queryset().filter(is_featured=True)[:4]
-        serializer = VideoListSerializer(videos, many=True)
-        return Response(serializer.data)
+        return Response([video_list_data(video) for video in videos])
 
     @action(detail=False, methods=['get'])
     def live(self, request):
         """Vidéos en direct."""
         videos = self.get_queryset().filter(is_live=True)
-        serializer = VideoListSerializer(videos, many=True)
-        return Response(serializer.data)
+        return Response([video_list_data(video) for video in videos])
 
     @action(detail=False, methods=['get'])
     def by_type(self, request):
         """Vidéos groupées par type (US-07)."""
         video_type = request.query_params.get('type', None)
+        videos = self.get_queryset().only(*VIDEO_LIST_FIELDS)
         if video_type:
-            videos = self.get_queryset().filter(video_type=video_type)
+            videos = videos.filter(video_type=video_type)
         else:
-            videos = self.get_queryset()
-        serializer = VideoListSerializer(videos, many=True)
-        return Response(serializer.data)
+            # Sans type, la liste est plafonnée côté serveur
+            videos = videos[:self.by_type_max_results]
+
+        def stream():
+            # Tableau JSON produit au fil de l'eau, lu par lots depuis la base
+            yield b'['
+            for index, video in enumerate(videos.iterator(chunk_size=500)):
+                if index:
+                    yield b','
+                yield orjson.dumps(video_list_data(video))
+            yield b']'
+
+        return StreamingHttpResponse(stream(), content_type='application/json')
 
     @action(detail=True, methods=['post'], permission_classes=[CanPublish])
-    def publish(self, request, pk=None):
+    def publish(self, request, slug=None):
         """Publier une vidéo."""
         video = self.get_object()
-        video.status = 'published'
-        if not video.published_at:
-            video.published_at = timezone.now()
-        video.save()
+        # UPDATE limité aux colonnes de publication (signal publication_changed)
+        video.update_status('published')
         return Response({'message': 'Vidéo publiée'})
 
     @action(detail=True, methods=['post'], permission_classes=[CanPublish])
-    def unpublish(self, request, pk=None):
+    def unpublish(self, request, slug=None):
         """Dépublier une vidéo."""
         video = self.get_object()
-        video.status = 'draft'
-        video.save()
+        video.update_status('draft')
         return Response({'message': 'Vidéo dépubliée'})
 
 
@@ -379,68 +489,9 @@ class HomepageView(viewsets.ViewSet):
     """
     Vue pour la page d'accueil (US-05).
     Retourne toutes les données nécessaires en une seule requête.
-    Cache de 5 minutes pour améliorer les performances.
+    Cache de 5 minutes (clé stable, invalidée à la modification des contenus).
     """
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-    @method_decorator(cache_page(60 * 5))  # Cache 5 minutes
     def list(self, request):
-        now = timezone.now()
-        published_filter = Q(status='published') & (
-            Q(published_at__isnull=True) | Q(published_at__lte=now)
-        )
-
-        # Articles à la Une - avec annotations pour éviter N+1
-        featured_articles = Article.objects.filter(
-            published_filter, is_featured=True
-        ).select_related('author', 'category').only(
-            'id', 'title', 'slug', 'excerpt', 'featured_image',
-            'reading_time', 'is_featured', 'is_trending', 'published_at',
-            'author__id', 'author__name', 'author__slug', 'author__photo',
-            'category__id', 'category__name', 'category__slug', 'category__color'
-        )[:3]
-
-        # Articles récents
-        recent_articles = Article.objects.filter(
-            published_filter
-        ).select_related('author', 'category').only(
-            'id', 'title', 'slug', 'excerpt', 'featured_image',
-            'reading_time', 'is_featured', 'is_trending', 'published_at',
-            'author__id', 'author__name', 'author__slug', 'author__photo',
-            'category__id', 'category__name', 'category__slug', 'category__color'
-        ).order_by('-published_at')[:8]
-
-        # Articles tendance
-        trending_articles = Article.objects.filter(
-            published_filter, is_trending=True
-        ).select_related('author', 'category').only(
-            'id', 'title', 'slug', 'excerpt', 'featured_image',
-            'reading_time', 'is_featured', 'is_trending', 'published_at',
-            'author__id', 'author__name', 'author__slug', 'author__photo',
-            'category__id', 'category__name', 'category__slug', 'category__color'
-        )[:6]
-
-        # Vidéos en vedette
-        featured_videos = Video.objects.filter(
-            published_filter, is_featured=True
-        ).select_related('category').only(
-            'id', 'title', 'slug', 'description', 'youtube_id', 'thumbnail',
-            'video_type', 'duration', 'is_featured', 'is_live', 'published_at',
-            'category__id', 'category__name', 'category__slug', 'category__color'
-        )[:4]
-
-        # Catégories en vedette avec count annoté
-        featured_categories = Category.objects.filter(
-            is_active=True, is_featured=True
-        ).annotate(
-            _articles_count=Count('articles', filter=Q(articles__status='published')),
-            _videos_count=Count('videos', filter=Q(videos__status='published'))
-        )[:6]
-
-        return Response({
-            'featured_articles': ArticleListSerializer(featured_articles, many=True).data,
-            'recent_articles': ArticleListSerializer(recent_articles, many=True).data,
-            'trending_articles': ArticleListSerializer(trending_articles, many=True).data,
-            'featured_videos': VideoListSerializer(featured_videos, many=True).data,
-            'featured_categories': CategoryListSerializer(featured_categories, many=True).data,
-        })
+        return Response(get_homepage_data())
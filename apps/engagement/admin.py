@@ -4,7 +4,75 @@ Engagement Admin - Administration des inscriptions newsletter et contacts
 
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import NewsletterSubscription, ContactMessage, ArticleNotification, VideoNotification
+from django.utils.safestring import mark_safe
+from .models import (
+    NewsletterSubscription, ContactMessage, ArticleNotification, VideoNotification,
+    ContentNotificationStatus, NewsletterSyncState,
+)
+
+# =============================================================================
+# BADGES DE STATUT (HTML précalculé au chargement du module)
+# =============================================================================
+
+BADGE_TEMPLATE = (
+    '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; '
+    'color: white; font-size: 11px;">{}</span>'
+)
+DEFAULT_BADGE_COLOR = '#6C757D'
+
+
+def _build_status_badges(choices, colors: dict) -> dict:
+    """Badges HTML {statut: SafeString} pour toutes les valeurs d'un TextChoices."""
+    return {
+        value: format_html(BADGE_TEMPLATE, colors.get(value, DEFAULT_BADGE_COLOR), label)
+        for value, label in choices
+    }
+
+
+def _status_badge(badges: dict, obj):
+    """Badge précalculé ; format_html seulement pour un statut hors choix."""
+    badge = badges.get(obj.status)
+    if badge is None:
+        badge = format_html(BADGE_TEMPLATE, DEFAULT_BADGE_COLOR, obj.get_status_display())
+    return badge
+
+
+_NEWSLETTER_BADGES = _build_status_badges(NewsletterSubscription.Status.choices, {
+    'pending': '#FFA500',
+    'confirmed': '#28A745',
+    'unsubscribed': '#DC3545',
+})
+_CONTACT_BADGES = _build_status_badges(ContactMessage.Status.choices, {
+    'new': '#007BFF',
+    'read': '#FFA500',
+    'replied': '#28A745',
+    'archived': '#6C757D',
+})
+_NOTIFICATION_BADGES = _build_status_badges(ContentNotificationStatus.choices, {
+    'pending': '#FFA500',
+    'sent': '#28A745',
+    'failed': '#DC3545',
+})
+# Fragments constants (aucune donnée utilisateur) : sûrs tels quels
+_SYNC_STATE_LABELS = {
+    NewsletterSyncState.ERROR: mark_safe('<span style="color: #DC3545;">❌ Erreur</span>'),
+    NewsletterSyncState.SYNCED: mark_safe('<span style="color: #28A745;">✓ Synchronisé</span>'),
+    NewsletterSyncState.PENDING: mark_safe('<span style="color: #6C757D;">⏳ En attente</span>'),
+}
+
+
+class SyncStateFilter(admin.SimpleListFilter):
+    """Filtre sur l'état de synchronisation annoté en SQL (sync_state)."""
+    title = 'Synchronisation'
+    parameter_name = 'sync_state'
+
+    def lookups(self, request, model_admin):
+        return NewsletterSyncState.choices
+
+    def queryset(self, request, queryset):
+        if self.value() in NewsletterSyncState.values:
+            return queryset.filter(sync_state=self.value())
+        return queryset
 
 
 @admin.register(NewsletterSubscription)
@@ -15,7 +83,9 @@ class NewsletterSubscriptionAdmin(admin.ModelAdmin):
         'email', 'status_badge', 'source', 'synced_status',
         'confirmed_at', 'created_at'
     ]
-    list_filter = ['status', 'source', 'created_at']
+    # source est nullable : le select_related automatique de l'admin ne la suit pas
+    list_select_related = ['source']
+    list_filter = ['status', SyncStateFilter, 'source', 'created_at']
     search_fields = ['email']
     ordering = ['-created_at']
     readonly_fields = [
@@ -38,51 +108,32 @@ class NewsletterSubscriptionAdmin(admin.ModelAdmin):
     )
 
     def status_badge(self, obj):
-        colors = {
-            'pending': '#FFA500',
-            'confirmed': '#28A745',
-            'unsubscribed': '#DC3545',
-        }
-        color = colors.get(obj.status, '#6C757D')
-        return format_html(
-            '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; color: white; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _status_badge(_NEWSLETTER_BADGES, obj)
     status_badge.short_description = 'Statut'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_sync_state()
+
     def synced_status(self, obj):
-        if obj.sync_error:
-            return format_html(
-                '<span style="color: #DC3545;">❌ Erreur</span>'
-            )
-        elif obj.synced_at:
-            return format_html(
-                '<span style="color: #28A745;">✓ Synchronisé</span>'
-            )
-        return format_html(
-            '<span style="color: #6C757D;">⏳ En attente</span>'
-        )
+        return _SYNC_STATE_LABELS[obj.sync_state]
     synced_status.short_description = 'Sync'
+    synced_status.admin_order_field = 'sync_state'
 
     actions = ['confirm_subscriptions', 'export_emails']
 
     @admin.action(description='Confirmer les inscriptions sélectionnées')
     def confirm_subscriptions(self, request, queryset):
-        from django.utils import timezone
-        updated = queryset.filter(
-            status=NewsletterSubscription.Status.PENDING
-        ).update(
-            status=NewsletterSubscription.Status.CONFIRMED,
-            confirmed_at=timezone.now()
-        )
+        updated = NewsletterSubscription.bulk_confirm(queryset)
         self.message_user(request, f'{updated} inscription(s) confirmée(s).')
 
     @admin.action(description='Exporter les emails (copier dans presse-papier)')
     def export_emails(self, request, queryset):
-        emails = list(queryset.values_list('email', flat=True))
+        # Seuls le nombre et les 10 premiers emails sont affichés : COUNT + LIMIT
+        total = queryset.count()
+        emails = list(queryset.values_list('email', flat=True)[:10])
         self.message_user(
             request,
-            f'{len(emails)} email(s) : {", ".join(emails[:10])}{"..." if len(emails) > 10 else ""}'
+            f'{total} email(s) : {", ".join(emails)}{"..." if total > 10 else ""}'
         )
 
 
@@ -94,6 +145,8 @@ class ContactMessageAdmin(admin.ModelAdmin):
         'subject', 'name', 'email', 'status_badge',
         'replied_by', 'created_at'
     ]
+    # replied_by est nullable : le select_related automatique de l'admin ne le suit pas
+    list_select_related = ['replied_by']
     list_filter = ['status', 'created_at']
     search_fields = ['name', 'email', 'subject', 'message']
     ordering = ['-created_at']
@@ -117,37 +170,24 @@ class ContactMessageAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # Corps du message (TEXT) non affiché dans la liste : chargé à la demande sur le formulaire
+        return super().get_queryset(request).defer('message')
+
     def status_badge(self, obj):
-        colors = {
-            'new': '#007BFF',
-            'read': '#FFA500',
-            'replied': '#28A745',
-            'archived': '#6C757D',
-        }
-        color = colors.get(obj.status, '#6C757D')
-        return format_html(
-            '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; color: white; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _status_badge(_CONTACT_BADGES, obj)
     status_badge.short_description = 'Statut'
 
     actions = ['mark_as_read', 'mark_as_replied', 'archive_messages']
 
     @admin.action(description='Marquer comme lu')
     def mark_as_read(self, request, queryset):
-        updated = queryset.filter(
-            status=ContactMessage.Status.NEW
-        ).update(status=ContactMessage.Status.READ)
+        updated = ContactMessage.bulk_mark_as_read(queryset)
         self.message_user(request, f'{updated} message(s) marqué(s) comme lu(s).')
 
     @admin.action(description='Marquer comme répondu')
     def mark_as_replied(self, request, queryset):
-        from django.utils import timezone
-        updated = queryset.update(
-            status=ContactMessage.Status.REPLIED,
-            replied_at=timezone.now(),
-            replied_by=request.user
-        )
+        updated = ContactMessage.bulk_mark_as_replied(queryset, request.user)
         self.message_user(request, f'{updated} message(s) marqué(s) comme répondu(s).')
 
     @admin.action(description='Archiver')
@@ -163,24 +203,23 @@ class ArticleNotificationAdmin(admin.ModelAdmin):
     list_display = [
         'article_id', 'status_badge', 'campaign_id', 'sent_at'
     ]
-    list_filter = ['status', 'sent_at']
+    list_filter = ['status', 'created_at']
     search_fields = ['article_id', 'campaign_id']
-    ordering = ['-sent_at']
+    ordering = ['-created_at']
     readonly_fields = ['article_id', 'campaign_id', 'status', 'error_message', 'sent_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('error_message')
+
     def status_badge(self, obj):
-        colors = {
-            'pending': '#FFA500',
-            'sent': '#28A745',
-            'failed': '#DC3545',
-        }
-        color = colors.get(obj.status, '#6C757D')
-        return format_html(
-            '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; color: white; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _status_badge(_NOTIFICATION_BADGES, obj)
     status_badge.short_description = 'Statut'
 
+    def sent_at(self, obj):
+        return obj.created_at
+    sent_at.short_description = 'Date d\'envoi'
+    sent_at.admin_order_field = 'created_at'
+
     def has_add_permission(self, request):
         return False  # Les notifications sont créées automatiquement
 
@@ -195,24 +234,23 @@ class VideoNotificationAdmin(admin.ModelAdmin):
     list_display = [
         'video_id', 'status_badge', 'campaign_id', 'sent_at'
     ]
-    list_filter = ['status', 'sent_at']
+    list_filter = ['status', 'created_at']
     search_fields = ['video_id', 'campaign_id']
-    ordering = ['-sent_at']
+    ordering = ['-created_at']
     readonly_fields = ['video_id', 'campaign_id', 'status', 'error_message', 'sent_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('error_message')
+
     def status_badge(self, obj):
-        colors = {
-            'pending': '#FFA500',
-            'sent': '#28A745',
-            'failed': '#DC3545',
-        }
-        color = colors.get(obj.status, '#6C757D')
-        return format_html(
-            '<span style="background-color: {}; padding: 3px 10px; border-radius: 3px; color: white; font-size: 11px;">{}</span>',
-            color, obj.get_status_display()
-        )
+        return _status_badge(_NOTIFICATION_BADGES, obj)
     status_badge.short_description = 'Statut'
 
+    def sent_at(self, obj):
+        return obj.created_at
+    sent_at.short_description = 'Date d\'envoi'
+    sent_at.admin_order_field = 'created_at'
+
     def has_add_permission(self, request):
         return False  # Les notifications sont créées automatiquement
 
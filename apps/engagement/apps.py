@@ -5,3 +5,8 @@ class EngagementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.engagement'
     verbose_name = 'Engagement'
+
+    def ready(self):
+        from .services import warm_email_templates
+
+        warm_email_templates()
@@ -0,0 +1,17 @@
+"""
+Engagement Filters - Filtres pour l'administration des inscriptions
+"""
+
+import django_filters
+from .models import NewsletterSubscription
+
+
+class NewsletterSubscriptionFilter(django_filters.FilterSet):
+    """Filtres pour les inscriptions newsletter."""
+
+    status = django_filters.ChoiceFilter(choices=NewsletterSubscription.Status.choices)
+    source = django_filters.CharFilter(field_name='source__slug')
+
+    class Meta:
+        model = NewsletterSubscription
+        fields = ['status', 'source']
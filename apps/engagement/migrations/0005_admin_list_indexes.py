@@ -0,0 +1,57 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0004_add_video_notification"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="articlenotification",
+            index=models.Index(
+                fields=["-sent_at"], name="engagement__sent_at_871aaf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="articlenotification",
+            index=models.Index(
+                fields=["status", "-sent_at"], name="engagement__status_2bc761_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contactmessage",
+            index=models.Index(
+                fields=["status", "-created_at"], name="engagement__status_ae25b6_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newslettersubscription",
+            index=models.Index(
+                fields=["status", "-created_at"], name="engagement__status_ce4ac9_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newslettersubscription",
+            index=models.Index(
+                fields=["source", "-created_at"], name="engagement__source_593b2d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videonotification",
+            index=models.Index(
+                fields=["-sent_at"], name="engagement__sent_at_4547f5_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videonotification",
+            index=models.Index(
+                fields=["status", "-sent_at"], name="engagement__status_745383_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.0.14 on 2026-10-15 22:58
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Case, Count, Value, When
+from django.db.models.functions import Lower
+
+
+def merge_case_duplicate_emails(apps, schema_editor):
+    """
+    Fusionne les inscriptions dont l'email ne diffère que par la casse (la
+    confirmée, sinon la plus récente, est conservée), puis passe les emails
+    en minuscules : la contrainte LOWER(email) peut alors être créée.
+    """
+    NewsletterSubscription = apps.get_model("engagement", "NewsletterSubscription")
+    subscriptions = NewsletterSubscription.objects.annotate(email_lower=Lower("email"))
+
+    duplicated = (
+        subscriptions.order_by()
+        .values("email_lower")
+        .annotate(total=Count("pk"))
+        .filter(total__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+    for email in list(duplicated):
+        kept, *others = subscriptions.filter(email_lower=email).order_by(
+            Case(When(status="confirmed", then=Value(0)), default=Value(1)),
+            "-updated_at",
+            "-pk",
+        )
+        if not kept.external_id:
+            kept.external_id = next((other.external_id for other in others if other.external_id), "")
+            kept.save(update_fields=["external_id"])
+        NewsletterSubscription.objects.filter(pk__in=[other.pk for other in others]).delete()
+
+    NewsletterSubscription.objects.exclude(email=Lower("email")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0005_admin_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_case_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="newslettersubscription",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="newsletter_email_ci_uniq",
+                violation_error_message="Cette adresse email est déjà inscrite.",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0006_newsletter_email_case_insensitive"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newslettersubscription",
+            name="email",
+            field=models.EmailField(max_length=254, verbose_name="Email"),
+        ),
+    ]
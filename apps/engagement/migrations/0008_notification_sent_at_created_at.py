@@ -0,0 +1,65 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0007_newsletter_email_single_index"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="articlenotification",
+            options={
+                "ordering": ["-created_at"],
+                "verbose_name": "Notification article",
+                "verbose_name_plural": "Notifications articles",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="videonotification",
+            options={
+                "ordering": ["-created_at"],
+                "verbose_name": "Notification vidéo",
+                "verbose_name_plural": "Notifications vidéos",
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name="articlenotification",
+            name="engagement__sent_at_871aaf_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="articlenotification",
+            name="engagement__status_2bc761_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="videonotification",
+            name="engagement__sent_at_4547f5_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="videonotification",
+            name="engagement__status_745383_idx",
+        ),
+        migrations.RemoveField(
+            model_name="articlenotification",
+            name="sent_at",
+        ),
+        migrations.RemoveField(
+            model_name="videonotification",
+            name="sent_at",
+        ),
+        migrations.AddIndex(
+            model_name="articlenotification",
+            index=models.Index(
+                fields=["status", "-created_at"], name="engagement__status_f16194_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videonotification",
+            index=models.Index(
+                fields=["status", "-created_at"], name="engagement__status_d220c3_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def intern_sources(apps, schema_editor):
+    """Crée une NewsletterSource par valeur distincte et y rattache les inscriptions."""
+    NewsletterSource = apps.get_model("engagement", "NewsletterSource")
+    NewsletterSubscription = apps.get_model("engagement", "NewsletterSubscription")
+
+    slugs = (
+        NewsletterSubscription.objects.exclude(source="")
+        .order_by()
+        .values_list("source", flat=True)
+        .distinct()
+    )
+    for slug in slugs:
+        source = NewsletterSource.objects.create(slug=slug)
+        NewsletterSubscription.objects.filter(source=slug).update(source_ref=source)
+
+
+def restore_sources(apps, schema_editor):
+    NewsletterSource = apps.get_model("engagement", "NewsletterSource")
+    NewsletterSubscription = apps.get_model("engagement", "NewsletterSubscription")
+
+    for source in NewsletterSource.objects.all():
+        NewsletterSubscription.objects.filter(source_ref=source).update(
+            source=source.slug
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0008_notification_sent_at_created_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NewsletterSource",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "slug",
+                    models.CharField(
+                        max_length=100, unique=True, verbose_name="Source"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Source newsletter",
+                "verbose_name_plural": "Sources newsletter",
+                "ordering": ["slug"],
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name="newslettersubscription",
+            name="engagement__source_593b2d_idx",
+        ),
+        migrations.AddField(
+            model_name="newslettersubscription",
+            name="source_ref",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Page ou formulaire d'origine",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="subscriptions",
+                to="engagement.newslettersource",
+                verbose_name="Source",
+            ),
+        ),
+        migrations.RunPython(intern_sources, restore_sources),
+        migrations.RemoveField(
+            model_name="newslettersubscription",
+            name="source",
+        ),
+        migrations.RenameField(
+            model_name="newslettersubscription",
+            old_name="source_ref",
+            new_name="source",
+        ),
+        migrations.AddIndex(
+            model_name="newslettersubscription",
+            index=models.Index(
+                fields=["source", "-created_at"], name="engagement__source__017066_idx"
+            ),
+        ),
+    ]
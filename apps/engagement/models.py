@@ -3,10 +3,116 @@ Engagement Models - Modèles pour l'engagement utilisateur
 Newsletter (US-10)
 """
 
-from django.db import models
+from django.db import connections, models
+from django.db.models.functions import Lower, Now
 from apps.core.models import TimeStampedModel
 
 
+class NewsletterSource(models.Model):
+    """
+    Origine d'une inscription (page ou formulaire) : table de référence de
+    quelques lignes, référencée par clé étrangère au lieu d'un texte répété.
+    """
+
+    slug = models.CharField('Source', max_length=100, unique=True)
+
+    class Meta:
+        verbose_name = 'Source newsletter'
+        verbose_name_plural = 'Sources newsletter'
+        ordering = ['slug']
+
+    def __str__(self):
+        return self.slug
+
+    @staticmethod
+    def normalize_slug(slug: str) -> str:
+        """Forme canonique d'un slug de source (sans espaces autour)."""
+        return (slug or '').strip()
+
+    @classmethod
+    def get_for_slug(cls, slug: str):
+        """Source correspondant au slug (créée au besoin), None si vide."""
+        slug = cls.normalize_slug(slug)
+        if not slug:
+            return None
+        return cls.objects.get_or_create(slug=slug)[0]
+
+
+class NewsletterSyncState(models.TextChoices):
+    """État de synchronisation avec le provider, calculé en SQL (with_sync_state)."""
+    ERROR = 'error', 'Erreur'
+    SYNCED = 'synced', 'Synchronisé'
+    PENDING = 'pending', 'En attente'
+
+
+class NewsletterSubscriptionQuerySet(models.QuerySet):
+    """QuerySet des inscriptions newsletter."""
+
+    def with_sync_state(self):
+        """Annote sync_state (NewsletterSyncState) : filtrable et triable en base."""
+        return self.annotate(sync_state=models.Case(
+            models.When(~models.Q(sync_error=''), then=models.Value(NewsletterSyncState.ERROR)),
+            models.When(synced_at__isnull=False, then=models.Value(NewsletterSyncState.SYNCED)),
+            default=models.Value(NewsletterSyncState.PENDING),
+            output_field=models.CharField(),
+        ))
+
+    def for_email(self, email: str):
+        """Inscription d'un email, casse ignorée (servie par l'index unique sur LOWER(email))."""
+        return self.alias(email_lower=Lower('email')).filter(
+            email_lower=NewsletterSubscription.normalize_email(email)
+        )
+
+    def upsert_confirmed(self, email: str, ip_address=None, source: str = ''):
+        """
+        Inscrit ou réactive un email en une seule requête PostgreSQL :
+        INSERT ... ON CONFLICT (LOWER(email)) DO UPDATE, limité aux inscriptions
+        désabonnées. La source est lue dans la même requête ; une source inconnue
+        n'est créée que pour une nouvelle inscription.
+        Retourne (pk, created), ou None si l'email est déjà inscrit.
+        """
+        model = self.model
+        table = model._meta.db_table
+        source_table = NewsletterSource._meta.db_table
+        source = NewsletterSource.normalize_slug(source)
+        confirmed = model.Status.CONFIRMED
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f'''
+                INSERT INTO {table} (
+                    email, status, ip_address, source_id, external_id, sync_error,
+                    confirmed_at, created_at, updated_at
+                )
+                VALUES (
+                    %s, %s, %s, (SELECT id FROM {source_table} WHERE slug = %s),
+                    '', '', NOW(), NOW(), NOW()
+                )
+                ON CONFLICT (LOWER(email)) DO UPDATE
+                    SET status = %s, confirmed_at = NOW()
+                    WHERE {table}.status = %s
+                RETURNING id, (xmax = 0) AS created, source_id
+                ''',
+                [
+                    model.normalize_email(email), confirmed, ip_address, source,
+                    confirmed, model.Status.UNSUBSCRIBED,
+                ],
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        pk, created, source_id = row
+        if created and source and source_id is None:
+            self.filter(pk=pk).update(source=NewsletterSource.get_for_slug(source))
+        return pk, created
+
+    def for_emails(self, emails):
+        """Inscriptions de plusieurs emails, casse ignorée (même index que for_email)."""
+        return self.alias(email_lower=Lower('email')).filter(
+            email_lower__in=[NewsletterSubscription.normalize_email(email) for email in emails]
+        )
+
+
 class NewsletterSubscription(TimeStampedModel):
     """
     Modèle pour les inscriptions à la newsletter (US-10).
@@ -17,11 +123,8 @@ class NewsletterSubscription(TimeStampedModel):
         CONFIRMED = 'confirmed', 'Confirmé'
         UNSUBSCRIBED = 'unsubscribed', 'Désabonné'
 
-    email = models.EmailField(
-        'Email',
-        unique=True,
-        db_index=True
-    )
+    # Unicité portée par newsletter_email_ci_uniq (LOWER(email)), seul index sur la colonne
+    email = models.EmailField('Email')
     status = models.CharField(
         'Statut',
         max_length=20,
@@ -33,10 +136,13 @@ class NewsletterSubscription(TimeStampedModel):
         null=True,
         blank=True
     )
-    source = models.CharField(
-        'Source',
-        max_length=100,
+    source = models.ForeignKey(
+        NewsletterSource,
+        on_delete=models.PROTECT,
+        null=True,
         blank=True,
+        related_name='subscriptions',
+        verbose_name='Source',
         help_text='Page ou formulaire d\'origine'
     )
 
@@ -69,27 +175,83 @@ class NewsletterSubscription(TimeStampedModel):
         blank=True
     )
 
+    objects = NewsletterSubscriptionQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Inscription newsletter'
         verbose_name_plural = 'Inscriptions newsletter'
         ordering = ['-created_at']
+        constraints = [
+            # Un email ne peut être inscrit qu'une fois, quelle que soit sa casse
+            models.UniqueConstraint(
+                Lower('email'),
+                name='newsletter_email_ci_uniq',
+                violation_error_message='Cette adresse email est déjà inscrite.',
+            ),
+        ]
+        # Filtres et tri de l'admin (created_at est déjà indexé par TimeStampedModel)
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['source', '-created_at']),
+        ]
 
     def __str__(self):
         return f'{self.email} ({self.get_status_display()})'
 
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Forme canonique d'un email (minuscules, sans espaces)."""
+        return email.strip().lower()
+
+    def save(self, *args, **kwargs):
+        # Inscriptions créées hors API (admin) : même forme que via l'API
+        if self.email:
+            self.email = self.normalize_email(self.email)
+        super().save(*args, **kwargs)
+
     def confirm(self):
-        """Confirme l'inscription."""
+        """Confirme l'inscription (UPDATE direct, sans save() ni signaux)."""
         from django.utils import timezone
         self.status = self.Status.CONFIRMED
         self.confirmed_at = timezone.now()
-        self.save(update_fields=['status', 'confirmed_at'])
+        type(self).objects.filter(pk=self.pk).update(
+            status=self.status,
+            confirmed_at=self.confirmed_at
+        )
 
     def unsubscribe(self):
-        """Désabonne l'utilisateur."""
+        """Désabonne l'utilisateur (UPDATE direct, sans save() ni signaux)."""
         from django.utils import timezone
         self.status = self.Status.UNSUBSCRIBED
         self.unsubscribed_at = timezone.now()
-        self.save(update_fields=['status', 'unsubscribed_at'])
+        type(self).objects.filter(pk=self.pk).update(
+            status=self.status,
+            unsubscribed_at=self.unsubscribed_at
+        )
+
+    @classmethod
+    def bulk_confirm(cls, queryset) -> int:
+        """Confirme les inscriptions en attente du queryset (un seul UPDATE, date NOW() SQL)."""
+        return queryset.filter(status=cls.Status.PENDING).update(
+            status=cls.Status.CONFIRMED,
+            confirmed_at=Now()
+        )
+
+    @classmethod
+    def bulk_unsubscribe(cls, queryset) -> int:
+        """Désabonne les inscriptions du queryset (un seul UPDATE, date NOW() SQL)."""
+        return queryset.update(
+            status=cls.Status.UNSUBSCRIBED,
+            unsubscribed_at=Now()
+        )
+
+
+class ContactMessageQuerySet(models.QuerySet):
+    """QuerySet des messages de contact."""
+
+    def with_replier(self):
+        """Charge l'utilisateur ayant répondu dans la même requête (replied_by_name)."""
+        return self.select_related('replied_by')
 
 
 class ContactMessage(TimeStampedModel):
@@ -144,27 +306,66 @@ class ContactMessage(TimeStampedModel):
         verbose_name='Répondu par'
     )
 
+    objects = ContactMessageQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Message de contact'
         verbose_name_plural = 'Messages de contact'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+        ]
 
     def __str__(self):
         return f'{self.name}: {self.subject}'
 
     def mark_as_read(self):
-        """Marque le message comme lu."""
+        """
+        Marque le message comme lu (UPDATE direct, sans save() ni signaux).
+        Aucune écriture si le message chargé n'est plus nouveau ; l'UPDATE est
+        conditionné à status=new pour ne pas écraser une réponse ou un archivage
+        enregistré entre-temps.
+        """
         if self.status == self.Status.NEW:
-            self.status = self.Status.READ
-            self.save(update_fields=['status'])
+            updated = type(self).objects.filter(pk=self.pk, status=self.Status.NEW).update(
+                status=self.Status.READ
+            )
+            if updated:
+                self.status = self.Status.READ
 
     def mark_as_replied(self, user):
-        """Marque le message comme répondu."""
+        """Marque le message comme répondu (UPDATE direct, sans save() ni signaux)."""
         from django.utils import timezone
         self.status = self.Status.REPLIED
         self.replied_at = timezone.now()
         self.replied_by = user
-        self.save(update_fields=['status', 'replied_at', 'replied_by'])
+        type(self).objects.filter(pk=self.pk).update(
+            status=self.status,
+            replied_at=self.replied_at,
+            replied_by=user
+        )
+
+    def archive(self):
+        """Archive le message (UPDATE direct, sans save() ni signaux)."""
+        self.status = self.Status.ARCHIVED
+        type(self).objects.filter(pk=self.pk).update(status=self.status)
+
+    @classmethod
+    def bulk_mark_as_read(cls, queryset) -> int:
+        """Marque comme lus les nouveaux messages du queryset (un seul UPDATE)."""
+        return queryset.filter(status=cls.Status.NEW).update(status=cls.Status.READ)
+
+    @classmethod
+    def bulk_mark_as_replied(cls, queryset, user) -> int:
+        """
+        Marque les messages du queryset comme répondus (un seul UPDATE).
+        replied_at vaut NOW() côté base : la même date pour toutes les lignes du lot.
+        """
+        return queryset.update(
+            status=cls.Status.REPLIED,
+            replied_at=Now(),
+            replied_by=user
+        )
 
 
 class ContentNotificationStatus(models.TextChoices):
@@ -202,19 +403,50 @@ class ArticleNotification(TimeStampedModel):
         'Message d\'erreur',
         blank=True
     )
-    sent_at = models.DateTimeField(
-        'Date d\'envoi',
-        auto_now_add=True
-    )
 
     class Meta:
         verbose_name = 'Notification article'
         verbose_name_plural = 'Notifications articles'
-        ordering = ['-sent_at']
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+        ]
 
     def __str__(self):
         return f'Notification article {self.article_id} ({self.get_status_display()})'
 
+    @property
+    def sent_at(self):
+        """Date d'envoi : la notification est créée au moment de l'envoi (created_at)."""
+        return self.created_at
+
+    @classmethod
+    def bulk_mark_sent(cls, ids, campaign_id: str = '') -> None:
+        """
+        Enregistre les notifications envoyées en un seul INSERT ... ON CONFLICT DO NOTHING :
+        les contenus déjà notifiés sont ignorés sans erreur ni transaction annulée.
+        """
+        cls.objects.bulk_create(
+            [
+                cls(article_id=pk, campaign_id=campaign_id, status=ContentNotificationStatus.SENT)
+                for pk in ids
+            ],
+            ignore_conflicts=True,
+            batch_size=5000,
+        )
+
+    @classmethod
+    def bulk_mark_failed(cls, ids, error_message: str) -> None:
+        """Enregistre les échecs d'envoi (ON CONFLICT DO NOTHING, comme bulk_mark_sent)."""
+        cls.objects.bulk_create(
+            [
+                cls(article_id=pk, status=ContentNotificationStatus.FAILED, error_message=error_message)
+                for pk in ids
+            ],
+            ignore_conflicts=True,
+            batch_size=5000,
+        )
+
 
 class VideoNotification(TimeStampedModel):
     """
@@ -244,15 +476,46 @@ class VideoNotification(TimeStampedModel):
         'Message d\'erreur',
         blank=True
     )
-    sent_at = models.DateTimeField(
-        'Date d\'envoi',
-        auto_now_add=True
-    )
 
     class Meta:
         verbose_name = 'Notification vidéo'
         verbose_name_plural = 'Notifications vidéos'
-        ordering = ['-sent_at']
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+        ]
 
     def __str__(self):
         return f'Notification vidéo {self.video_id} ({self.get_status_display()})'
+
+    @property
+    def sent_at(self):
+        """Date d'envoi : la notification est créée au moment de l'envoi (created_at)."""
+        return self.created_at
+
+    @classmethod
+    def bulk_mark_sent(cls, ids, campaign_id: str = '') -> None:
+        """
+        Enregistre les notifications envoyées en un seul INSERT ... ON CONFLICT DO NOTHING :
+        les contenus déjà notifiés sont ignorés sans erreur ni transaction annulée.
+        """
+        cls.objects.bulk_create(
+            [
+                cls(video_id=pk, campaign_id=campaign_id, status=ContentNotificationStatus.SENT)
+                for pk in ids
+            ],
+            ignore_conflicts=True,
+            batch_size=5000,
+        )
+
+    @classmethod
+    def bulk_mark_failed(cls, ids, error_message: str) -> None:
+        """Enregistre les échecs d'envoi (ON CONFLICT DO NOTHING, comme bulk_mark_sent)."""
+        cls.objects.bulk_create(
+            [
+                cls(video_id=pk, status=ContentNotificationStatus.FAILED, error_message=error_message)
+                for pk in ids
+            ],
+            ignore_conflicts=True,
+            batch_size=5000,
+        )
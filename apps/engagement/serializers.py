@@ -2,8 +2,20 @@
 Engagement Serializers - Sérialiseurs pour l'engagement
 """
 
+import csv
+import io
+
 from rest_framework import serializers
-from .models import NewsletterSubscription, ContactMessage
+from .models import NewsletterSource, NewsletterSubscription, ContactMessage
+
+# Longueur maximale d'un message de contact (le TextField n'est pas borné)
+CONTACT_MESSAGE_MAX_LENGTH = 10_000
+
+# Caractères du message renvoyés par la liste d'administration
+CONTACT_MESSAGE_PREVIEW_LENGTH = 200
+
+# Contacts par import groupé de la newsletter
+NEWSLETTER_IMPORT_MAX_CONTACTS = 10_000
 
 
 class NewsletterSubscribeSerializer(serializers.Serializer):
@@ -16,7 +28,58 @@ class NewsletterSubscribeSerializer(serializers.Serializer):
 
     def validate_email(self, value):
         """Normalise l'email."""
-        return value.lower().strip()
+        return NewsletterSubscription.normalize_email(value)
+
+
+class NewsletterImportContactSerializer(serializers.Serializer):
+    """Contact d'un import groupé de la newsletter."""
+
+    email = serializers.EmailField()
+    first_name = serializers.CharField(max_length=100, required=False, allow_blank=True, default='')
+    last_name = serializers.CharField(max_length=100, required=False, allow_blank=True, default='')
+
+    def validate_email(self, value):
+        """Normalise l'email."""
+        return NewsletterSubscription.normalize_email(value)
+
+
+class NewsletterImportSerializer(serializers.Serializer):
+    """Serializer pour l'import groupé d'inscriptions (administration)."""
+
+    contacts = NewsletterImportContactSerializer(
+        many=True, allow_empty=False, max_length=NEWSLETTER_IMPORT_MAX_CONTACTS
+    )
+    source = serializers.CharField(max_length=100, required=False, allow_blank=True, default='import')
+
+
+class NewsletterImportCSVSerializer(serializers.Serializer):
+    """
+    Import groupé depuis un fichier CSV (administration).
+    Colonnes : email (obligatoire), first_name, last_name ; le fichier est lu en une passe.
+    """
+
+    file = serializers.FileField()
+    source = serializers.CharField(max_length=100, required=False, allow_blank=True, default='import')
+
+    def validate_file(self, value):
+        """Retourne les contacts validés du fichier."""
+        try:
+            rows = list(csv.DictReader(io.TextIOWrapper(value.file, encoding='utf-8-sig')))
+        except (UnicodeDecodeError, csv.Error):
+            raise serializers.ValidationError('Fichier CSV invalide (UTF-8 attendu).')
+
+        if rows and 'email' not in rows[0]:
+            raise serializers.ValidationError('Colonne "email" manquante.')
+
+        contacts = NewsletterImportContactSerializer(
+            data=[
+                {key: row[key] for key in ('email', 'first_name', 'last_name') if row.get(key)}
+                for row in rows
+            ],
+            many=True, allow_empty=False, max_length=NEWSLETTER_IMPORT_MAX_CONTACTS,
+        )
+        contacts.is_valid(raise_exception=True)
+        return contacts.validated_data
 
 
 class NewsletterUnsubscribeSerializer(serializers.Serializer):
@@ -25,16 +88,20 @@ class NewsletterUnsubscribeSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
     def validate_email(self, value):
-        """Vérifie que l'email existe et normalise."""
-        email = value.lower().strip()
-        if not NewsletterSubscription.objects.filter(email=email).exists():
-            raise serializers.ValidationError('Cette adresse email n\'est pas inscrite.')
-        return email
+        """Normalise l'email (l'existence est vérifiée par l'UPDATE de la vue)."""
+        return NewsletterSubscription.normalize_email(value)
 
 
 class NewsletterSubscriptionSerializer(serializers.ModelSerializer):
     """Serializer pour l'administration des inscriptions."""
 
+    source = serializers.SlugRelatedField(
+        slug_field='slug',
+        queryset=NewsletterSource.objects.all(),
+        allow_null=True,
+        required=False
+    )
+
     class Meta:
         model = NewsletterSubscription
         fields = [
@@ -48,13 +115,16 @@ class NewsletterSubscriptionSerializer(serializers.ModelSerializer):
 class ContactMessageCreateSerializer(serializers.ModelSerializer):
     """Serializer pour la création de message de contact."""
 
+    # Taille bornée avant tout traitement : un corps démesuré est rejeté sans copie (strip)
+    message = serializers.CharField(max_length=CONTACT_MESSAGE_MAX_LENGTH, trim_whitespace=False)
+
     class Meta:
         model = ContactMessage
         fields = ['name', 'email', 'subject', 'message']
 
     def validate_message(self, value):
-        """Vérifie la longueur minimale du message."""
-        if len(value.strip()) < 10:
+        """Vérifie la longueur minimale du message (len() brut d'abord, strip() ensuite)."""
+        if len(value) < 10 or len(value := value.strip()) < 10:
             raise serializers.ValidationError(
                 'Le message doit contenir au moins 10 caractères.'
             )
@@ -79,3 +149,18 @@ class ContactMessageSerializer(serializers.ModelSerializer):
         read_only_fields = [
             'id', 'ip_address', 'replied_at', 'replied_by', 'created_at'
         ]
+
+
+class ContactMessageListSerializer(ContactMessageSerializer):
+    """
+    Serializer de la liste des messages : un aperçu du message (calculé en SQL)
+    au lieu du texte complet, disponible sur le détail.
+    """
+
+    message_preview = serializers.CharField(read_only=True)
+
+    class Meta(ContactMessageSerializer.Meta):
+        fields = [
+            'message_preview' if field == 'message' else field
+            for field in ContactMessageSerializer.Meta.fields
+        ]
@@ -3,15 +3,183 @@ Engagement Services - Services pour la newsletter (US-10)
 Intégration Brevo (ex-Sendinblue) et Mailchimp
 """
 
+import functools
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from typing import Optional, Dict, Any, List
 from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import connection, connections, transaction
+from django.db.models.functions import Lower, Now
+from django.dispatch import receiver
+from django.template.loader import get_template
 from django.utils import timezone
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .models import (
+    ArticleNotification,
+    NewsletterSource,
+    NewsletterSubscription,
+    VideoNotification,
+)
+from .tasks import sync_newsletter_subscription_task, sync_newsletter_subscriptions_bulk_task
 
 logger = logging.getLogger(__name__)
 
 
+class _ProviderRetry(Retry):
+    """
+    Retry des appels providers : un 429 (requête refusée avant traitement) est
+    rejoué quelle que soit la méthode ; les autres statuts de status_forcelist
+    ne le sont que pour les méthodes de allowed_methods.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _build_http_session() -> requests.Session:
+    """
+    Session HTTP partagée par les services newsletter (une par processus) :
+    connexions keep-alive réutilisées, sans nouvelle poignée de main TLS par appel.
+    Les erreurs de connexion sont retentées pour toutes les méthodes (la requête
+    n'est pas partie), comme les 429 dont l'attente suit l'en-tête Retry-After.
+    Les réponses 500/502/503/504 ne le sont que pour les méthodes idempotentes :
+    un POST (création de campagne, de contact) n'est jamais rejoué après traitement.
+    """
+    retry = _ProviderRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'PUT', 'PATCH', 'DELETE'],
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return session
+
+
+_HTTP_SESSION = _build_http_session()
+
+
+class TokenBucket:
+    """
+    Limiteur de débit (seau à jetons) partagé par les threads du processus.
+    acquire() consomme un jeton et attend, si besoin, qu'il soit disponible :
+    les rafales sont lissées sous la limite du provider au lieu de recevoir des 429.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+            self.last_update = now
+            # Le jeton est réservé tout de suite : l'attente se fait hors du verrou
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+
+
+# Limites par processus, sous les plafonds des providers
+# (Brevo : 10 requêtes/s, Mailchimp : 10 connexions simultanées)
+_BREVO_BUCKET = TokenBucket(rate=9, capacity=9)
+_MAILCHIMP_BUCKET = TokenBucket(rate=9, capacity=9)
+_MAILCHIMP_CONNECTIONS = threading.BoundedSemaphore(9)
+
+# Avance de la date d'envoi des campagnes Brevo : Brevo refuse une date passée,
+# la marge absorbe la latence et un éventuel décalage d'horloge
+CAMPAIGN_SCHEDULE_DELAY = timedelta(minutes=1)
+
+# Abonnés lus chez le provider (get_subscriber), absences comprises
+SUBSCRIBER_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+_MISSING = object()
+
+# Contacts par appel aux endpoints d'import groupé (plafond Mailchimp : 500)
+BULK_SUBSCRIBE_BATCH_SIZE = 500
+
+
+def _dumps(data) -> Optional[bytes]:
+    """Corps JSON d'une requête provider (orjson ; les en-têtes déclarent déjà application/json)."""
+    return orjson.dumps(data) if data is not None else None
+
+
+def _json(response: requests.Response):
+    """Corps JSON d'une réponse provider, décodé par orjson."""
+    return orjson.loads(response.content)
+
+
+def _error_body(response: requests.Response) -> str:
+    """Corps d'une réponse d'erreur provider, pour le message d'erreur (UTF-8, sans détection d'encodage)."""
+    return response.content.decode(errors='replace')
+
+
+# Passage en minuscules des octets ASCII A-Z, en une passe (bytes.translate)
+_UPPER_TO_LOWER = bytes.maketrans(bytes(range(0x41, 0x5b)), bytes(range(0x61, 0x7b)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _subscriber_hash(email: str) -> str:
+    """Identifiant Mailchimp d'un abonné : MD5 de l'email en minuscules (non cryptographique)."""
+    if email.isascii():
+        data = email.encode('ascii').translate(_UPPER_TO_LOWER)
+    else:
+        # Adresse internationalisée : minuscules Unicode
+        data = email.lower().encode()
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+# Templates des emails envoyés par le module (préchargés au démarrage)
+EMAIL_TEMPLATES = (
+    'engagement/emails/article_notification.html',
+    'engagement/emails/video_notification.html',
+    'engagement/emails/contact_notification.html',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _email_template(template_name: str):
+    """Template d'email résolu et compilé une fois par processus."""
+    return get_template(template_name)
+
+
+def _render_email(template_name: str, context: dict) -> str:
+    """HTML d'un email (valeurs échappées par le moteur de templates)."""
+    return _email_template(template_name).render(context)
+
+
+def warm_email_templates() -> None:
+    """
+    Résout et compile les templates d'email au démarrage du processus :
+    le premier envoi ne paie plus le chargement depuis le disque.
+    """
+    for template_name in EMAIL_TEMPLATES:
+        _email_template(template_name)
+
+
+def _batches(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 class NewsletterServiceError(Exception):
     """Exception pour les erreurs du service newsletter."""
     pass
@@ -20,6 +188,14 @@ class NewsletterServiceError(Exception):
 class BaseNewsletterService:
     """Classe de base pour les services newsletter."""
 
+    # Préfixe des clés de cache propres au provider
+    cache_prefix = 'newsletter'
+
+    @property
+    def is_configured(self) -> bool:
+        """Identifiants du provider présents : sinon aucun appel n'est tenté."""
+        return True
+
     def subscribe(self, email: str, **kwargs) -> Dict[str, Any]:
         raise NotImplementedError
 
@@ -27,8 +203,41 @@ class BaseNewsletterService:
         raise NotImplementedError
 
     def get_subscriber(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Informations d'un abonné chez le provider (None s'il est inconnu).
+        Servies depuis le cache : les lectures répétées ne refont pas d'appel HTTP
+        et ne consomment pas de jeton du limiteur de débit.
+        """
+        key = self._subscriber_cache_key(email)
+        subscriber = cache.get(key, _MISSING)
+        if subscriber is _MISSING:
+            subscriber = self._fetch_subscriber(email)
+            cache.set(key, subscriber, SUBSCRIBER_CACHE_TIMEOUT)
+        return subscriber
+
+    def _fetch_subscriber(self, email: str) -> Optional[Dict[str, Any]]:
         raise NotImplementedError
 
+    def _subscriber_cache_key(self, email: str) -> str:
+        return f'{self.cache_prefix}:subscriber:{email.strip().lower()}'
+
+    def _forget_subscribers(self, *emails: str) -> None:
+        """Invalide les abonnés en cache après une inscription / un désabonnement."""
+        cache.delete_many([self._subscriber_cache_key(email) for email in emails])
+
+    def subscribe_bulk(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Inscrit plusieurs contacts ({'email', 'first_name', 'last_name'}).
+        Par défaut un appel par contact ; les providers le surchargent par leur
+        endpoint d'import groupé. Retourne {'success', 'ids': {email: id externe}}.
+        """
+        ids = {}
+        for entry in entries:
+            result = self.subscribe(**entry)
+            if result.get('id'):
+                ids[entry['email']] = str(result['id'])
+        return {'success': True, 'ids': ids}
+
 
 class BrevoService(BaseNewsletterService):
     """
@@ -37,25 +246,41 @@ class BrevoService(BaseNewsletterService):
     """
 
     BASE_URL = 'https://api.brevo.com/v3'
+    cache_prefix = 'brevo'
 
     def __init__(self):
         self.api_key = settings.BREVO_API_KEY
         self.list_id = settings.BREVO_LIST_ID
+        # Liste Brevo analysée une fois : vide si absente ou invalide
+        self.list_ids = []
+        if self.list_id:
+            try:
+                self.list_ids = [int(self.list_id)]
+            except (ValueError, TypeError):
+                logger.warning(f'Invalid BREVO_LIST_ID: {self.list_id}')
         self.headers = {
             'api-key': self.api_key,
             'Content-Type': 'application/json',
             'Accept': 'application/json',
         }
 
+    @property
+    def is_configured(self) -> bool:
+        return bool(self.api_key)
+
     def _make_request(self, method: str, endpoint: str, data: dict = None) -> requests.Response:
         """Effectue une requête vers l'API Brevo."""
+        if not self.is_configured:
+            raise NewsletterServiceError('BREVO_API_KEY non configuré')
+
         url = f'{self.BASE_URL}/{endpoint}'
+        _BREVO_BUCKET.acquire()
         try:
-            response = requests.request(
+            response = _HTTP_SESSION.request(
                 method=method,
                 url=url,
                 headers=self.headers,
-                json=data,
+                data=_dumps(data),
                 timeout=10
             )
             return response
@@ -63,49 +288,74 @@ class BrevoService(BaseNewsletterService):
             logger.error(f'Brevo API error: {e}')
             raise NewsletterServiceError(f'Erreur de connexion à Brevo: {e}')
 
+    @staticmethod
+    def _attributes(entry: dict) -> dict:
+        """Attributs Brevo (PRENOM / NOM) d'un contact."""
+        attributes = {}
+        if entry.get('first_name'):
+            attributes['PRENOM'] = entry['first_name']
+        if entry.get('last_name'):
+            attributes['NOM'] = entry['last_name']
+        return attributes
+
+    def subscribe_bulk(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Inscrit plusieurs contacts en un appel par lot (POST /contacts/import).
+        L'import est traité en asynchrone par Brevo : pas d'ID de contact en retour.
+        """
+        if not self.list_ids:
+            # L'import exige une liste : repli sur un appel par contact
+            return super().subscribe_bulk(entries)
+
+        for batch in _batches(entries, BULK_SUBSCRIBE_BATCH_SIZE):
+            data = {
+                'jsonBody': [
+                    {'email': entry['email'], 'attributes': self._attributes(entry)}
+                    for entry in batch
+                ],
+                'listIds': self.list_ids,
+                'updateExistingContacts': True,
+            }
+            response = self._make_request('POST', 'contacts/import', data)
+            self._forget_subscribers(*(entry['email'] for entry in batch))
+            if response.status_code not in [200, 201, 202]:
+                raise NewsletterServiceError(f'Erreur import Brevo: {response.status_code}')
+
+        logger.info(f'Successfully imported {len(entries)} contact(s) to Brevo')
+        return {'success': True, 'ids': {}}
+
     def subscribe(self, email: str, **kwargs) -> Dict[str, Any]:
         """
         Inscrit un email à la newsletter via Brevo.
         """
-        # Construire la liste des IDs de liste
-        list_ids = []
-        if self.list_id:
-            try:
-                list_ids = [int(self.list_id)]
-            except (ValueError, TypeError):
-                logger.warning(f'Invalid BREVO_LIST_ID: {self.list_id}')
-
         data = {
             'email': email,
-            'listIds': list_ids,
+            'listIds': self.list_ids,
             'updateEnabled': True,
         }
 
         # Ajouter les attributs supplémentaires
-        attributes = {}
-        if kwargs.get('first_name'):
-            attributes['PRENOM'] = kwargs['first_name']
-        if kwargs.get('last_name'):
-            attributes['NOM'] = kwargs['last_name']
+        attributes = self._attributes(kwargs)
         if attributes:
             data['attributes'] = attributes
 
         response = self._make_request('POST', 'contacts', data)
+        self._forget_subscribers(email)
 
         if response.status_code in [200, 201, 204]:
             logger.info(f'Successfully subscribed {email} to Brevo')
             # 204 = No Content, pas de body JSON
-            if response.status_code == 204 or not response.text:
+            if not response.content:
                 return {'success': True}
             try:
-                return {'success': True, 'id': response.json().get('id')}
-            except Exception:
+                return {'success': True, 'id': _json(response).get('id')}
+            except orjson.JSONDecodeError:
                 return {'success': True}
         elif response.status_code == 400:
-            error_data = response.json()
-            if 'duplicate' in str(error_data).lower():
+            # Doublon (cas courant) détecté sur le corps brut, sans décodage JSON
+            if b'duplicate' in response.content.lower():
                 return {'success': True, 'already_subscribed': True}
-            raise NewsletterServiceError(f'Erreur Brevo: {error_data}')
+            raise NewsletterServiceError(f'Erreur Brevo: {_error_body(response)}')
         else:
             raise NewsletterServiceError(f'Erreur Brevo: {response.status_code}')
 
@@ -125,6 +375,7 @@ class BrevoService(BaseNewsletterService):
             f'contacts/lists/{self.list_id}/contacts/remove',
             data
         )
+        self._forget_subscribers(email)
 
         if response.status_code in [200, 201, 204]:
             logger.info(f'Successfully unsubscribed {email} from Brevo')
@@ -133,14 +384,14 @@ class BrevoService(BaseNewsletterService):
             logger.error(f'Failed to unsubscribe {email}: {response.text}')
             return False
 
-    def get_subscriber(self, email: str) -> Optional[Dict[str, Any]]:
+    def _fetch_subscriber(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Récupère les informations d'un abonné.
         """
         response = self._make_request('GET', f'contacts/{email}')
 
         if response.status_code == 200:
-            return response.json()
+            return _json(response)
         elif response.status_code == 404:
             return None
         else:
@@ -159,109 +410,51 @@ class BrevoService(BaseNewsletterService):
         Envoie une notification email à tous les abonnés pour un nouvel article.
         Utilise l'API Brevo pour créer et envoyer une campagne.
         """
-        if not self.list_id:
+        return self._send_campaign(
+            name=f'Nouvel article: {article_title[:50]}',
+            subject=f'🆕 {article_title}',
+            template_name='engagement/emails/article_notification.html',
+            context={
+                'article_title': article_title,
+                'article_excerpt': article_excerpt,
+                'article_url': article_url,
+                'article_image_url': article_image_url,
+                'author_name': author_name,
+                'category_name': category_name,
+            },
+        )
+
+    def _send_campaign(self, *, name: str, subject: str, template_name: str, context: dict) -> Dict[str, Any]:
+        """
+        Envoie une campagne à la liste Brevo (notifications article / vidéo).
+        Le HTML est rendu depuis le template (compilé une fois, valeurs échappées).
+        La campagne est créée programmée pour envoi immédiat (scheduledAt) :
+        un seul appel API, sans POST sendNow séparé.
+        """
+        if not self.list_ids:
             raise NewsletterServiceError('BREVO_LIST_ID non configuré')
 
-        # Créer le contenu HTML de l'email
-        html_content = f'''
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin:0;padding:0;background-color:#f5f5f5;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,Helvetica,Arial,sans-serif;">
-    <table width="100%" cellpadding="0" cellspacing="0" style="background-color:#f5f5f5;padding:40px 20px;">
-        <tr>
-            <td align="center">
-                <table width="600" cellpadding="0" cellspacing="0" style="background-color:#ffffff;border-radius:16px;overflow:hidden;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
-                    <!-- Header -->
-                    <tr>
-                        <td style="background-color:#18181b;padding:30px;text-align:center;">
-                            <h1 style="margin:0;color:#ffffff;font-size:24px;font-weight:800;">Geniesdafriquemedia</h1>
-                            <p style="margin:10px 0 0;color:#a1a1aa;font-size:12px;text-transform:uppercase;letter-spacing:2px;">Nouvel Article</p>
-                        </td>
-                    </tr>
-
-                    <!-- Image -->
-                    {f'<tr><td><img src="{article_image_url}" width="600" style="width:100%;height:auto;display:block;" alt="{article_title}"></td></tr>' if article_image_url else ''}
-
-                    <!-- Content -->
-                    <tr>
-                        <td style="padding:40px;">
-                            <!-- Category Badge -->
-                            {f'<p style="margin:0 0 15px;"><span style="background-color:#f59e0b;color:#ffffff;padding:6px 16px;border-radius:20px;font-size:11px;font-weight:700;text-transform:uppercase;letter-spacing:1px;">{category_name}</span></p>' if category_name else ''}
-
-                            <!-- Title -->
-                            <h2 style="margin:0 0 20px;font-size:28px;font-weight:800;color:#18181b;line-height:1.3;">
-                                {article_title}
-                            </h2>
-
-                            <!-- Author -->
-                            {f'<p style="margin:0 0 20px;color:#71717a;font-size:14px;">Par <strong>{author_name}</strong></p>' if author_name else ''}
-
-                            <!-- Excerpt -->
-                            <p style="margin:0 0 30px;color:#52525b;font-size:16px;line-height:1.7;">
-                                {article_excerpt}
-                            </p>
-
-                            <!-- CTA Button -->
-                            <a href="{article_url}" style="display:inline-block;background-color:#f59e0b;color:#ffffff;padding:16px 32px;border-radius:12px;text-decoration:none;font-weight:700;font-size:14px;text-transform:uppercase;letter-spacing:1px;">
-                                Lire l'article →
-                            </a>
-                        </td>
-                    </tr>
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color:#fafafa;padding:30px;text-align:center;border-top:1px solid #e5e5e5;">
-                            <p style="margin:0 0 10px;color:#71717a;font-size:12px;">
-                                Vous recevez cet email car vous êtes inscrit à notre newsletter.
-                            </p>
-                            <p style="margin:0;color:#a1a1aa;font-size:11px;">
-                                © 2025 Geniesdafriquemedia. Tous droits réservés.
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-'''
-
-        # Créer la campagne
         campaign_data = {
-            'name': f'Nouvel article: {article_title[:50]}',
-            'subject': f'🆕 {article_title}',
+            'name': name,
+            'subject': subject,
             'sender': {
                 'name': 'Geniesdafriquemedia',
                 'email': 'geniesdafriquemedia@gmail.com'
             },
             'type': 'classic',
-            'htmlContent': html_content,
+            'htmlContent': _render_email(template_name, context),
             'recipients': {
-                'listIds': [int(self.list_id)]
+                'listIds': self.list_ids
             },
+            'scheduledAt': (timezone.now() + CAMPAIGN_SCHEDULE_DELAY).isoformat(timespec='milliseconds'),
         }
 
-        # Créer la campagne
         response = self._make_request('POST', 'emailCampaigns', campaign_data)
 
         if response.status_code in [200, 201]:
-            campaign_id = response.json().get('id')
-            logger.info(f'Campaign created: {campaign_id}')
-
-            # Envoyer immédiatement la campagne
-            send_response = self._make_request('POST', f'emailCampaigns/{campaign_id}/sendNow')
-
-            if send_response.status_code in [200, 201, 204]:
-                logger.info(f'Campaign {campaign_id} sent successfully')
-                return {'success': True, 'campaign_id': campaign_id}
-            else:
-                logger.error(f'Failed to send campaign: {send_response.text}')
-                raise NewsletterServiceError(f'Erreur envoi campagne: {send_response.status_code}')
+            campaign_id = _json(response).get('id')
+            logger.info(f'Campaign {campaign_id} scheduled: {name}')
+            return {'success': True, 'campaign_id': campaign_id}
         else:
             logger.error(f'Failed to create campaign: {response.text}')
             raise NewsletterServiceError(f'Erreur création campagne: {response.status_code}')
@@ -303,7 +496,7 @@ class BrevoService(BaseNewsletterService):
         response = self._make_request('POST', 'smtp/email', data)
 
         if response.status_code in [200, 201, 202]:
-            message_id = response.json().get('messageId', '')
+            message_id = _json(response).get('messageId', '')
             logger.info(f'Transactional email sent to {to_email}: {message_id}')
             return {'success': True, 'message_id': message_id}
         else:
@@ -322,137 +515,21 @@ class BrevoService(BaseNewsletterService):
         """
         Envoie une notification email à tous les abonnés pour une nouvelle vidéo.
         """
-        if not self.list_id:
-            raise NewsletterServiceError('BREVO_LIST_ID non configuré')
-
-        # Build conditional sections
-        thumbnail_section = ''
-        if video_thumbnail_url:
-            thumbnail_section = f'''<tr>
-                        <td style="position:relative;">
-                            <a href="{video_url}" style="display:block;position:relative;">
-                                <img src="{video_thumbnail_url}" width="600" style="width:100%;height:auto;display:block;" alt="{video_title}">
-                            </a>
-                        </td>
-                    </tr>'''
-
-        video_type_badge = ''
-        if video_type:
-            video_type_badge = f'<p style="margin:0 0 15px;"><span style="background-color:#dc2626;color:#ffffff;padding:6px 16px;border-radius:20px;font-size:11px;font-weight:700;text-transform:uppercase;letter-spacing:1px;">&#9654; {video_type}</span></p>'
-
-        youtube_button = ''
-        if youtube_url:
-            youtube_button = f'<td><a href="{youtube_url}" style="display:inline-block;background-color:#dc2626;color:#ffffff;padding:16px 32px;border-radius:12px;text-decoration:none;font-weight:700;font-size:14px;text-transform:uppercase;letter-spacing:1px;">&#9654; YouTube</a></td>'
-
         description_text = video_description[:300] + ('...' if len(video_description) > 300 else '')
 
-        # Créer le contenu HTML de l'email
-        html_content = f'''
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin:0;padding:0;background-color:#f5f5f5;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,Helvetica,Arial,sans-serif;">
-    <table width="100%" cellpadding="0" cellspacing="0" style="background-color:#f5f5f5;padding:40px 20px;">
-        <tr>
-            <td align="center">
-                <table width="600" cellpadding="0" cellspacing="0" style="background-color:#ffffff;border-radius:16px;overflow:hidden;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
-                    <!-- Header -->
-                    <tr>
-                        <td style="background-color:#18181b;padding:30px;text-align:center;">
-                            <h1 style="margin:0;color:#ffffff;font-size:24px;font-weight:800;">Geniesdafriquemedia</h1>
-                            <p style="margin:10px 0 0;color:#a1a1aa;font-size:12px;text-transform:uppercase;letter-spacing:2px;">&#128250; Nouvelle Video Web TV</p>
-                        </td>
-                    </tr>
-
-                    <!-- Thumbnail -->
-                    {thumbnail_section}
-
-                    <!-- Content -->
-                    <tr>
-                        <td style="padding:40px;">
-                            <!-- Video Type Badge -->
-                            {video_type_badge}
-
-                            <!-- Title -->
-                            <h2 style="margin:0 0 20px;font-size:28px;font-weight:800;color:#18181b;line-height:1.3;">
-                                {video_title}
-                            </h2>
-
-                            <!-- Description -->
-                            <p style="margin:0 0 30px;color:#52525b;font-size:16px;line-height:1.7;">
-                                {description_text}
-                            </p>
-
-                            <!-- CTA Buttons -->
-                            <table cellpadding="0" cellspacing="0" style="margin:0 auto;">
-                                <tr>
-                                    <td style="padding-right:10px;">
-                                        <a href="{video_url}" style="display:inline-block;background-color:#f59e0b;color:#ffffff;padding:16px 32px;border-radius:12px;text-decoration:none;font-weight:700;font-size:14px;text-transform:uppercase;letter-spacing:1px;">
-                                            Regarder sur GAM
-                                        </a>
-                                    </td>
-                                    {youtube_button}
-                                </tr>
-                            </table>
-                        </td>
-                    </tr>
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color:#fafafa;padding:30px;text-align:center;border-top:1px solid #e5e5e5;">
-                            <p style="margin:0 0 10px;color:#71717a;font-size:12px;">
-                                Vous recevez cet email car vous etes inscrit a notre newsletter.
-                            </p>
-                            <p style="margin:0;color:#a1a1aa;font-size:11px;">
-                                2025 Geniesdafriquemedia. Tous droits reserves.
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-'''
-
-        # Créer la campagne
-        campaign_data = {
-            'name': f'Nouvelle vidéo: {video_title[:50]}',
-            'subject': f'📺 {video_title}',
-            'sender': {
-                'name': 'Geniesdafriquemedia',
-                'email': 'geniesdafriquemedia@gmail.com'
+        return self._send_campaign(
+            name=f'Nouvelle vidéo: {video_title[:50]}',
+            subject=f'📺 {video_title}',
+            template_name='engagement/emails/video_notification.html',
+            context={
+                'video_title': video_title,
+                'description_text': description_text,
+                'video_url': video_url,
+                'video_thumbnail_url': video_thumbnail_url,
+                'video_type': video_type,
+                'youtube_url': youtube_url,
             },
-            'type': 'classic',
-            'htmlContent': html_content,
-            'recipients': {
-                'listIds': [int(self.list_id)]
-            },
-        }
-
-        # Créer la campagne
-        response = self._make_request('POST', 'emailCampaigns', campaign_data)
-
-        if response.status_code in [200, 201]:
-            campaign_id = response.json().get('id')
-            logger.info(f'Video campaign created: {campaign_id}')
-
-            # Envoyer immédiatement la campagne
-            send_response = self._make_request('POST', f'emailCampaigns/{campaign_id}/sendNow')
-
-            if send_response.status_code in [200, 201, 204]:
-                logger.info(f'Video campaign {campaign_id} sent successfully')
-                return {'success': True, 'campaign_id': campaign_id}
-            else:
-                logger.error(f'Failed to send video campaign: {send_response.text}')
-                raise NewsletterServiceError(f'Erreur envoi campagne vidéo: {send_response.status_code}')
-        else:
-            logger.error(f'Failed to create video campaign: {response.text}')
-            raise NewsletterServiceError(f'Erreur création campagne vidéo: {response.status_code}')
+        )
 
 
 class MailchimpService(BaseNewsletterService):
@@ -461,6 +538,8 @@ class MailchimpService(BaseNewsletterService):
     Documentation: https://mailchimp.com/developer/marketing/api/
     """
 
+    cache_prefix = 'mailchimp'
+
     def __init__(self):
         self.api_key = settings.MAILCHIMP_API_KEY
         self.list_id = settings.MAILCHIMP_LIST_ID
@@ -477,30 +556,72 @@ class MailchimpService(BaseNewsletterService):
         }
         self.auth = ('anystring', self.api_key)
 
+    @property
+    def is_configured(self) -> bool:
+        # base_url est dérivé du datacenter de la clé API
+        return bool(self.api_key and self.base_url)
+
     def _make_request(self, method: str, endpoint: str, data: dict = None) -> requests.Response:
         """Effectue une requête vers l'API Mailchimp."""
-        if not self.base_url:
+        if not self.is_configured:
             raise NewsletterServiceError('Configuration Mailchimp invalide')
 
         url = f'{self.base_url}/{endpoint}'
+        _MAILCHIMP_BUCKET.acquire()
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                auth=self.auth,
-                json=data,
-                timeout=10
-            )
+            with _MAILCHIMP_CONNECTIONS:
+                response = _HTTP_SESSION.request(
+                    method=method,
+                    url=url,
+                    headers=self.headers,
+                    auth=self.auth,
+                    data=_dumps(data),
+                    timeout=10
+                )
             return response
         except requests.RequestException as e:
             logger.error(f'Mailchimp API error: {e}')
             raise NewsletterServiceError(f'Erreur de connexion à Mailchimp: {e}')
 
+    def subscribe_bulk(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Inscrit plusieurs contacts en un appel par lot (POST /lists/{id}, 500 membres max).
+        """
+        ids = {}
+        for batch in _batches(entries, BULK_SUBSCRIBE_BATCH_SIZE):
+            members = []
+            for entry in batch:
+                member = {'email_address': entry['email'], 'status': 'subscribed'}
+                merge_fields = {}
+                if entry.get('first_name'):
+                    merge_fields['FNAME'] = entry['first_name']
+                if entry.get('last_name'):
+                    merge_fields['LNAME'] = entry['last_name']
+                if merge_fields:
+                    member['merge_fields'] = merge_fields
+                members.append(member)
+
+            response = self._make_request(
+                'POST',
+                f'lists/{self.list_id}',
+                {'members': members, 'update_existing': True}
+            )
+            self._forget_subscribers(*(entry['email'] for entry in batch))
+            if response.status_code != 200:
+                raise NewsletterServiceError(f'Erreur Mailchimp: {response.status_code}')
+
+            result = _json(response)
+            for member in result.get('new_members', []) + result.get('updated_members', []):
+                ids[member['email_address'].lower()] = member['id']
+            if result.get('errors'):
+                logger.warning(f'Mailchimp batch subscribe errors: {result["errors"]}')
+
+        logger.info(f'Successfully subscribed {len(entries)} contact(s) to Mailchimp')
+        return {'success': True, 'ids': ids}
+
     def _get_subscriber_hash(self, email: str) -> str:
         """Génère le hash MD5 de l'email pour l'API Mailchimp."""
-        import hashlib
-        return hashlib.md5(email.lower().encode()).hexdigest()
+        return _subscriber_hash(email)
 
     def subscribe(self, email: str, **kwargs) -> Dict[str, Any]:
         """
@@ -525,16 +646,17 @@ class MailchimpService(BaseNewsletterService):
             f'lists/{self.list_id}/members',
             data
         )
+        self._forget_subscribers(email)
 
         if response.status_code in [200, 201]:
-            result = response.json()
+            result = _json(response)
             logger.info(f'Successfully subscribed {email} to Mailchimp')
             return {'success': True, 'id': result.get('id')}
         elif response.status_code == 400:
-            error_data = response.json()
-            if 'already a list member' in str(error_data).lower():
+            # Membre existant (cas courant) détecté sur le corps brut, sans décodage JSON
+            if b'already a list member' in response.content.lower():
                 return {'success': True, 'already_subscribed': True}
-            raise NewsletterServiceError(f'Erreur Mailchimp: {error_data}')
+            raise NewsletterServiceError(f'Erreur Mailchimp: {_error_body(response)}')
         else:
             raise NewsletterServiceError(f'Erreur Mailchimp: {response.status_code}')
 
@@ -552,6 +674,7 @@ class MailchimpService(BaseNewsletterService):
             f'lists/{self.list_id}/members/{subscriber_hash}',
             data
         )
+        self._forget_subscribers(email)
 
         if response.status_code in [200, 204]:
             logger.info(f'Successfully unsubscribed {email} from Mailchimp')
@@ -560,7 +683,7 @@ class MailchimpService(BaseNewsletterService):
             logger.error(f'Failed to unsubscribe {email}: {response.text}')
             return False
 
-    def get_subscriber(self, email: str) -> Optional[Dict[str, Any]]:
+    def _fetch_subscriber(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Récupère les informations d'un abonné.
         """
@@ -571,16 +694,19 @@ class MailchimpService(BaseNewsletterService):
         )
 
         if response.status_code == 200:
-            return response.json()
+            return _json(response)
         elif response.status_code == 404:
             return None
         else:
             raise NewsletterServiceError(f'Erreur Mailchimp: {response.status_code}')
 
 
+@functools.lru_cache(maxsize=1)
 def get_newsletter_service() -> BaseNewsletterService:
     """
     Factory pour obtenir le service newsletter configuré.
+    Une instance par processus (réglages lus une fois) ; les services sont
+    sans état mutable, donc partageables entre threads.
     """
     provider = getattr(settings, 'NEWSLETTER_PROVIDER', 'brevo')
 
@@ -590,53 +716,226 @@ def get_newsletter_service() -> BaseNewsletterService:
         return BrevoService()
 
 
+@receiver(setting_changed)
+def _reset_newsletter_service(setting, **kwargs):
+    """Réglages modifiés (override_settings) : le service est reconstruit."""
+    if setting == 'NEWSLETTER_PROVIDER' or setting.startswith(('BREVO_', 'MAILCHIMP_')):
+        get_newsletter_service.cache_clear()
+
+
+# sync_error des inscriptions non synchronisées faute d'identifiants provider
+PROVIDER_NOT_CONFIGURED = 'Provider newsletter non configuré'
+
+
 def subscribe_to_newsletter(email: str, ip_address: str = None, source: str = '', **kwargs) -> Dict[str, Any]:
     """
     Fonction principale pour inscrire un email à la newsletter.
-    Gère la création locale et la synchronisation avec le provider.
-    """
-    from .models import NewsletterSubscription
-
-    # Vérifier si l'email existe déjà
-    subscription, created = NewsletterSubscription.objects.get_or_create(
-        email=email.lower(),
-        defaults={
-            'ip_address': ip_address,
-            'source': source,
-            'status': NewsletterSubscription.Status.CONFIRMED,
-            'confirmed_at': timezone.now(),
-        }
-    )
-
-    if not created:
-        if subscription.status == NewsletterSubscription.Status.UNSUBSCRIBED:
-            # Réactiver l'abonnement
-            subscription.status = NewsletterSubscription.Status.CONFIRMED
-            subscription.confirmed_at = timezone.now()
-            subscription.save()
-        else:
+    Gère la création locale ; la synchronisation avec le provider est
+    planifiée en tâche (sync_newsletter_subscription_task) après le commit.
+    """
+    if connection.vendor == 'postgresql':
+        # Création, réactivation ou rien (déjà inscrit) : un seul aller-retour
+        upserted = NewsletterSubscription.objects.upsert_confirmed(
+            email, ip_address, source
+        )
+        if upserted is None:
             return {'success': True, 'already_subscribed': True}
+        subscription_pk, created = upserted
+    else:
+        # Vérifier si l'email existe déjà (la source n'est résolue qu'à la création)
+        subscription, created = NewsletterSubscription.objects.for_email(email).get_or_create(
+            defaults={
+                'email': email,
+                'ip_address': ip_address,
+                'source': lambda: NewsletterSource.get_for_slug(source),
+                'status': NewsletterSubscription.Status.CONFIRMED,
+                'confirmed_at': timezone.now(),
+            }
+        )
+
+        if not created:
+            if subscription.status == NewsletterSubscription.Status.UNSUBSCRIBED:
+                # Réactiver l'abonnement (UPDATE de status / confirmed_at uniquement)
+                subscription.confirm()
+            else:
+                return {'success': True, 'already_subscribed': True}
+        subscription_pk = subscription.pk
+
+    if not get_newsletter_service().is_configured:
+        # Provider sans identifiants (dev, staging) : inscription locale uniquement
+        NewsletterSubscription.objects.filter(pk=subscription_pk).update(
+            sync_error=PROVIDER_NOT_CONFIGURED
+        )
+        return {'success': True, 'created': created}
+
+    # Synchronisation avec le provider externe hors du chemin de la requête,
+    # une fois l'inscription locale validée
+    transaction.on_commit(lambda: sync_newsletter_subscription_task.enqueue(subscription_pk, kwargs))
+
+    return {'success': True, 'created': created}
+
+
+# Réservation d'une synchronisation en cours (couvre l'appel au provider)
+SYNC_CLAIM_TIMEOUT = 60  # secondes
+
+
+def sync_newsletter_subscription(subscription, **kwargs) -> Dict[str, Any]:
+    """
+    Synchronise une inscription avec le provider externe et enregistre le résultat
+    (external_id / synced_at, ou sync_error : l'inscription locale reste valide).
+    Idempotente : une inscription déjà synchronisée depuis sa (ré)activation,
+    ou en cours de synchronisation ailleurs, ne refait pas d'appel au provider.
+    """
+    if (
+        subscription.synced_at and subscription.confirmed_at
+        and subscription.synced_at >= subscription.confirmed_at
+    ):
+        return {'success': True, 'already_synced': True}
+
+    claim_key = f'engagement:subscription-sync:{subscription.pk}'
+    if not cache.add(claim_key, True, SYNC_CLAIM_TIMEOUT):
+        return {'success': True, 'already_synced': True}
 
-    # Synchroniser avec le provider externe
+    try:
+        return _sync_subscription(subscription, **kwargs)
+    finally:
+        # Libérée une fois le résultat enregistré
+        cache.delete(claim_key)
+
+
+def _sync_subscription(subscription, **kwargs) -> Dict[str, Any]:
+    # Champs du résultat, écrits en un seul UPDATE (date NOW() SQL)
     try:
         service = get_newsletter_service()
-        result = service.subscribe(email, **kwargs)
+        result = service.subscribe(subscription.email, **kwargs)
 
+        updates = {'synced_at': Now(), 'sync_error': ''}
         if result.get('id'):
-            subscription.external_id = str(result['id'])
-        subscription.synced_at = timezone.now()
-        subscription.sync_error = ''
-        subscription.save(update_fields=['external_id', 'synced_at', 'sync_error'])
+            updates['external_id'] = str(result['id'])
+        response = {'success': True}
+
+    except NewsletterServiceError as e:
+        logger.error(f'Newsletter sync error for {subscription.email}: {e}')
+        updates = {'sync_error': str(e)}
+        response = {'success': False, 'sync_warning': str(e)}
+
+    NewsletterSubscription.objects.filter(pk=subscription.pk).update(**updates)
+    return response
 
-        return {'success': True, 'created': created}
 
+# Lignes par INSERT lors d'un import groupé
+IMPORT_BATCH_SIZE = 1000
+
+
+def subscribe_many_to_newsletter(entries, ip_address: str = None, source: str = '') -> Dict[str, Any]:
+    """
+    Inscrit plusieurs emails ({'email', 'first_name', 'last_name'}) en lot :
+    un INSERT par lot pour les nouvelles inscriptions, un UPDATE pour les réactivations,
+    puis une seule tâche d'import chez le provider au lieu d'un POST par email.
+    """
+    # Un contact par email normalisé (le premier l'emporte)
+    contacts = {}
+    for entry in entries:
+        email = NewsletterSubscription.normalize_email(entry['email'])
+        contacts.setdefault(email, {**entry, 'email': email})
+
+    existing = dict(
+        NewsletterSubscription.objects.for_emails(contacts).values_list(Lower('email'), 'status')
+    )
+    new_emails = [email for email in contacts if email not in existing]
+    reactivated = [
+        email for email, status in existing.items()
+        if status == NewsletterSubscription.Status.UNSUBSCRIBED
+    ]
+
+    if new_emails:
+        source_obj = NewsletterSource.get_for_slug(source)
+        now = timezone.now()
+        NewsletterSubscription.objects.bulk_create(
+            [
+                NewsletterSubscription(
+                    email=email,
+                    ip_address=ip_address,
+                    source=source_obj,
+                    status=NewsletterSubscription.Status.CONFIRMED,
+                    confirmed_at=now,
+                )
+                for email in new_emails
+            ],
+            batch_size=IMPORT_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+    if reactivated:
+        NewsletterSubscription.objects.for_emails(reactivated).filter(
+            status=NewsletterSubscription.Status.UNSUBSCRIBED
+        ).update(status=NewsletterSubscription.Status.CONFIRMED, confirmed_at=Now())
+
+    summary = {
+        'success': True,
+        'created': len(new_emails),
+        'reactivated': len(reactivated),
+        'already_subscribed': len(existing) - len(reactivated),
+    }
+    to_sync = new_emails + reactivated
+    if not to_sync:
+        return summary
+
+    if not get_newsletter_service().is_configured:
+        # Provider sans identifiants (dev, staging) : inscriptions locales uniquement
+        NewsletterSubscription.objects.for_emails(to_sync).update(sync_error=PROVIDER_NOT_CONFIGURED)
+        return summary
+
+    # Synchronisation avec le provider externe (un appel pour tout le lot)
+    # hors du chemin de la requête, une fois les inscriptions validées
+    batch = [contacts[email] for email in to_sync]
+    transaction.on_commit(lambda: sync_newsletter_subscriptions_bulk_task.enqueue(batch))
+    return summary
+
+
+def sync_newsletter_subscriptions_bulk(contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Synchronise un lot d'inscriptions avec le provider en un seul appel d'import
+    et enregistre le résultat (external_id / synced_at, ou sync_error).
+    """
+    to_sync = [contact['email'] for contact in contacts]
+    try:
+        result = get_newsletter_service().subscribe_bulk(contacts)
     except NewsletterServiceError as e:
-        logger.error(f'Newsletter sync error for {email}: {e}')
-        subscription.sync_error = str(e)
-        subscription.save(update_fields=['sync_error'])
+        logger.error(f'Newsletter bulk sync error ({len(to_sync)} email(s)): {e}')
+        NewsletterSubscription.objects.for_emails(to_sync).update(sync_error=str(e))
+        return {'success': False, 'sync_warning': str(e)}
+
+    ids = result.get('ids', {})
+    subscriptions = list(
+        NewsletterSubscription.objects.for_emails(to_sync).only('pk', 'email', 'external_id')
+    )
+    now = timezone.now()
+    for subscription in subscriptions:
+        subscription.external_id = ids.get(subscription.email.lower(), subscription.external_id)
+        subscription.synced_at = now
+        subscription.sync_error = ''
+    NewsletterSubscription.objects.bulk_update(
+        subscriptions, ['external_id', 'synced_at', 'sync_error'], batch_size=500
+    )
+    return {'success': True, 'synced': len(subscriptions)}
 
-        # On retourne quand même succès car l'inscription locale a réussi
-        return {'success': True, 'created': created, 'sync_warning': str(e)}
+
+# Marqueur "notification prise en charge" (cache.add : posé une seule fois)
+NOTIFICATION_CLAIM_TIMEOUT = 60 * 60 * 24  # 24 heures
+
+
+def _claim_notification(kind: str, pk: int) -> bool:
+    """
+    Réserve l'envoi de la notification d'un contenu. False si elle est déjà
+    réservée : les rappels suivants (republication, tâche rejouée) ne touchent
+    plus la base. La contrainte unique en base reste la garantie entre processus.
+    """
+    return cache.add(f'engagement:notification:{kind}:{pk}', True, NOTIFICATION_CLAIM_TIMEOUT)
+
+
+def _release_notification(kind: str, pk: int) -> None:
+    """Libère la réservation quand aucun envoi n'a été enregistré."""
+    cache.delete(f'engagement:notification:{kind}:{pk}')
 
 
 def send_article_notification(article) -> Dict[str, Any]:
@@ -644,12 +943,12 @@ def send_article_notification(article) -> Dict[str, Any]:
     Envoie une notification email pour un nouvel article publié.
     Évite les doublons en vérifiant si une notification a déjà été envoyée.
     """
-    from .models import ArticleNotification
+    service = get_newsletter_service()
 
-    # Vérifier si une notification a déjà été envoyée pour cet article
-    if ArticleNotification.objects.filter(article_id=article.id).exists():
-        logger.info(f'Notification already sent for article {article.id}')
-        return {'success': True, 'already_sent': True}
+    # Vérifier que le service supporte les notifications, avant tout travail
+    if not hasattr(service, 'send_article_notification'):
+        logger.warning('Newsletter service does not support article notifications')
+        return {'success': False, 'error': 'Service non supporté'}
 
     # Construire l'URL de l'article
     frontend_url = getattr(settings, 'FRONTEND_URL', 'https://geniesdafriquemedia.com')
@@ -664,13 +963,17 @@ def send_article_notification(article) -> Dict[str, Any]:
             backend_url = getattr(settings, 'BACKEND_URL', 'http://localhost:8000')
             article_image_url = f'{backend_url}{article.image_url}'
 
-    try:
-        service = get_newsletter_service()
+    # Envoi déjà pris en charge par ce processus : ni requête ni campagne.
+    # Toute erreur après la réservation la libère (except ci-dessous)
+    if not _claim_notification('article', article.id):
+        logger.info(f'Notification already claimed for article {article.id}')
+        return {'success': True, 'already_sent': True}
 
-        # Vérifier que le service supporte les notifications
-        if not hasattr(service, 'send_article_notification'):
-            logger.warning('Newsletter service does not support article notifications')
-            return {'success': False, 'error': 'Service non supporté'}
+    try:
+        # Vérifier si une notification a déjà été envoyée pour cet article
+        if ArticleNotification.objects.filter(article_id=article.id).exists():
+            logger.info(f'Notification already sent for article {article.id}')
+            return {'success': True, 'already_sent': True}
 
         result = service.send_article_notification(
             article_title=article.title,
@@ -682,11 +985,7 @@ def send_article_notification(article) -> Dict[str, Any]:
         )
 
         # Enregistrer la notification envoyée
-        ArticleNotification.objects.create(
-            article_id=article.id,
-            campaign_id=result.get('campaign_id', ''),
-            status='sent'
-        )
+        ArticleNotification.bulk_mark_sent([article.id], result.get('campaign_id', ''))
 
         logger.info(f'Article notification sent for: {article.title}')
         return result
@@ -695,26 +994,27 @@ def send_article_notification(article) -> Dict[str, Any]:
         logger.error(f'Failed to send article notification: {e}')
 
         # Enregistrer l'échec
-        ArticleNotification.objects.create(
-            article_id=article.id,
-            status='failed',
-            error_message=str(e)
-        )
+        ArticleNotification.bulk_mark_failed([article.id], str(e))
 
         return {'success': False, 'error': str(e)}
 
+    except Exception:
+        # Erreur inattendue : rien d'enregistré, un nouvel essai reste possible
+        _release_notification('article', article.id)
+        raise
+
 
 def send_video_notification(video) -> Dict[str, Any]:
     """
     Envoie une notification email pour une nouvelle vidéo publiée.
     Évite les doublons en vérifiant si une notification a déjà été envoyée.
     """
-    from .models import VideoNotification
+    service = get_newsletter_service()
 
-    # Vérifier si une notification a déjà été envoyée pour cette vidéo
-    if VideoNotification.objects.filter(video_id=video.id).exists():
-        logger.info(f'Notification already sent for video {video.id}')
-        return {'success': True, 'already_sent': True}
+    # Vérifier que le service supporte les notifications vidéo, avant tout travail
+    if not hasattr(service, 'send_video_notification'):
+        logger.warning('Newsletter service does not support video notifications')
+        return {'success': False, 'error': 'Service non supporté'}
 
     # Construire l'URL de la vidéo
     frontend_url = getattr(settings, 'FRONTEND_URL', 'https://geniesdafriquemedia.com')
@@ -729,13 +1029,17 @@ def send_video_notification(video) -> Dict[str, Any]:
             backend_url = getattr(settings, 'BACKEND_URL', 'http://localhost:8000')
             video_thumbnail_url = f'{backend_url}{video.thumbnail_url}'
 
-    try:
-        service = get_newsletter_service()
+    # Envoi déjà pris en charge par ce processus : ni requête ni campagne.
+    # Toute erreur après la réservation la libère (except ci-dessous)
+    if not _claim_notification('video', video.id):
+        logger.info(f'Notification already claimed for video {video.id}')
+        return {'success': True, 'already_sent': True}
 
-        # Vérifier que le service supporte les notifications vidéo
-        if not hasattr(service, 'send_video_notification'):
-            logger.warning('Newsletter service does not support video notifications')
-            return {'success': False, 'error': 'Service non supporté'}
+    try:
+        # Vérifier si une notification a déjà été envoyée pour cette vidéo
+        if VideoNotification.objects.filter(video_id=video.id).exists():
+            logger.info(f'Notification already sent for video {video.id}')
+            return {'success': True, 'already_sent': True}
 
         result = service.send_video_notification(
             video_title=video.title,
@@ -747,11 +1051,7 @@ def send_video_notification(video) -> Dict[str, Any]:
         )
 
         # Enregistrer la notification envoyée
-        VideoNotification.objects.create(
-            video_id=video.id,
-            campaign_id=result.get('campaign_id', ''),
-            status='sent'
-        )
+        VideoNotification.bulk_mark_sent([video.id], result.get('campaign_id', ''))
 
         logger.info(f'Video notification sent for: {video.title}')
         return result
@@ -760,14 +1060,53 @@ def send_video_notification(video) -> Dict[str, Any]:
         logger.error(f'Failed to send video notification: {e}')
 
         # Enregistrer l'échec
-        VideoNotification.objects.create(
-            video_id=video.id,
-            status='failed',
-            error_message=str(e)
-        )
+        VideoNotification.bulk_mark_failed([video.id], str(e))
 
         return {'success': False, 'error': str(e)}
 
+    except Exception:
+        # Erreur inattendue : rien d'enregistré, un nouvel essai reste possible
+        _release_notification('video', video.id)
+        raise
+
+
+# Envois simultanés, sous les limites des providers (voir TokenBucket)
+NOTIFICATION_WORKERS = 8
+
+
+def _send_in_thread(send, content) -> Dict[str, Any]:
+    try:
+        return send(content)
+    finally:
+        # Connexions base propres au thread : fermées avant sa réutilisation
+        connections.close_all()
+
+
+def send_notifications_bulk(contents, send=send_article_notification) -> Dict[int, Dict[str, Any]]:
+    """
+    Envoie les notifications de plusieurs contenus publiés ensemble
+    (send : send_article_notification ou send_video_notification).
+    Les appels HTTP des différents contenus se chevauchent dans un pool de threads.
+    Retourne {pk: résultat}.
+    """
+    contents = list(contents)
+    if len(contents) <= 1:
+        return {content.pk: send(content) for content in contents}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(NOTIFICATION_WORKERS, len(contents))) as executor:
+        futures = {
+            executor.submit(_send_in_thread, send, content): content for content in contents
+        }
+        for future in as_completed(futures):
+            content = futures[future]
+            try:
+                results[content.pk] = future.result()
+            except Exception as e:
+                logger.exception(f'Notification failed for {content._meta.model_name} {content.pk}')
+                results[content.pk] = {'success': False, 'error': str(e)}
+    return results
+
 
 def send_contact_notification(contact_message) -> Dict[str, Any]:
     """
@@ -776,88 +1115,6 @@ def send_contact_notification(contact_message) -> Dict[str, Any]:
     admin_email = getattr(settings, 'CONTACT_ADMIN_EMAIL', 'geniesdafriquemedia@gmail.com')
     admin_name = getattr(settings, 'CONTACT_ADMIN_NAME', 'Geniesdafriquemedia')
 
-    # Créer le contenu HTML de l'email
-    html_content = f'''
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin:0;padding:0;background-color:#f5f5f5;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,Helvetica,Arial,sans-serif;">
-    <table width="100%" cellpadding="0" cellspacing="0" style="background-color:#f5f5f5;padding:40px 20px;">
-        <tr>
-            <td align="center">
-                <table width="600" cellpadding="0" cellspacing="0" style="background-color:#ffffff;border-radius:16px;overflow:hidden;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
-                    <!-- Header -->
-                    <tr>
-                        <td style="background-color:#18181b;padding:30px;text-align:center;">
-                            <h1 style="margin:0;color:#ffffff;font-size:24px;font-weight:800;">Geniesdafriquemedia</h1>
-                            <p style="margin:10px 0 0;color:#a1a1aa;font-size:12px;text-transform:uppercase;letter-spacing:2px;">📩 Nouveau Message de Contact</p>
-                        </td>
-                    </tr>
-
-                    <!-- Content -->
-                    <tr>
-                        <td style="padding:40px;">
-                            <!-- Alert Badge -->
-                            <p style="margin:0 0 20px;">
-                                <span style="background-color:#3b82f6;color:#ffffff;padding:8px 20px;border-radius:20px;font-size:12px;font-weight:700;text-transform:uppercase;letter-spacing:1px;">
-                                    Nouveau message
-                                </span>
-                            </p>
-
-                            <!-- Sender Info -->
-                            <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom:30px;background-color:#f9fafb;border-radius:12px;padding:20px;">
-                                <tr>
-                                    <td style="padding:15px;">
-                                        <p style="margin:0 0 10px;color:#6b7280;font-size:12px;text-transform:uppercase;letter-spacing:1px;font-weight:600;">De</p>
-                                        <p style="margin:0;color:#18181b;font-size:18px;font-weight:700;">{contact_message.name}</p>
-                                        <p style="margin:5px 0 0;color:#3b82f6;font-size:14px;">
-                                            <a href="mailto:{contact_message.email}" style="color:#3b82f6;text-decoration:none;">{contact_message.email}</a>
-                                        </p>
-                                    </td>
-                                </tr>
-                            </table>
-
-                            <!-- Subject -->
-                            <p style="margin:0 0 10px;color:#6b7280;font-size:12px;text-transform:uppercase;letter-spacing:1px;font-weight:600;">Sujet</p>
-                            <h2 style="margin:0 0 25px;font-size:22px;font-weight:700;color:#18181b;line-height:1.3;">
-                                {contact_message.subject}
-                            </h2>
-
-                            <!-- Message -->
-                            <p style="margin:0 0 10px;color:#6b7280;font-size:12px;text-transform:uppercase;letter-spacing:1px;font-weight:600;">Message</p>
-                            <div style="background-color:#f9fafb;border-left:4px solid #f59e0b;padding:20px;border-radius:0 12px 12px 0;margin-bottom:30px;">
-                                <p style="margin:0;color:#374151;font-size:16px;line-height:1.8;white-space:pre-wrap;">{contact_message.message}</p>
-                            </div>
-
-                            <!-- Reply Button -->
-                            <a href="mailto:{contact_message.email}?subject=Re: {contact_message.subject}" style="display:inline-block;background-color:#f59e0b;color:#ffffff;padding:16px 32px;border-radius:12px;text-decoration:none;font-weight:700;font-size:14px;text-transform:uppercase;letter-spacing:1px;">
-                                Répondre à {contact_message.name} →
-                            </a>
-                        </td>
-                    </tr>
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color:#fafafa;padding:25px;text-align:center;border-top:1px solid #e5e5e5;">
-                            <p style="margin:0 0 5px;color:#71717a;font-size:12px;">
-                                Message reçu le {contact_message.created_at.strftime('%d/%m/%Y à %H:%M')}
-                            </p>
-                            <p style="margin:0;color:#a1a1aa;font-size:11px;">
-                                © 2025 Geniesdafriquemedia - Formulaire de contact
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-'''
-
     try:
         service = get_newsletter_service()
 
@@ -866,6 +1123,15 @@ def send_contact_notification(contact_message) -> Dict[str, Any]:
             logger.warning('Newsletter service does not support transactional emails')
             return {'success': False, 'error': 'Service non supporté'}
 
+        if not service.is_configured:
+            logger.warning('Newsletter provider not configured, contact notification skipped')
+            return {'success': False, 'error': PROVIDER_NOT_CONFIGURED}
+
+        # Contenu HTML rendu seulement si l'email peut partir (template compilé une fois par processus)
+        html_content = _render_email('engagement/emails/contact_notification.html', {
+            'contact_message': contact_message,
+        })
+
         result = service.send_transactional_email(
             to_email=admin_email,
             to_name=admin_name,
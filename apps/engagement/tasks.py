@@ -0,0 +1,119 @@
+"""
+Engagement Tasks - Tâches asynchrones (django_tasks, backend configuré via TASKS)
+Les tâches reçoivent uniquement des identifiants et rechargent les objets.
+"""
+
+import logging
+from django.apps import apps
+from django_tasks import task
+
+logger = logging.getLogger(__name__)
+
+
+@task()
+def send_article_notification_task(article_pk: int):
+    """Envoie la notification newsletter d'un article publié."""
+    from apps.editorial.models import Article
+    from .services import send_article_notification
+
+    article = Article.objects.select_related('author', 'category').filter(pk=article_pk).first()
+    if article is None:
+        logger.warning(f'Article {article_pk} not found, notification skipped')
+        return None
+
+    result = send_article_notification(article)
+
+    if result.get('already_sent'):
+        logger.debug(f'Notification already sent for article: {article.title}')
+    elif result.get('success'):
+        logger.info(f'Newsletter notification sent for article: {article.title}')
+    else:
+        logger.warning(f'Failed to send notification for article: {article.title}')
+
+    return result
+
+
+@task()
+def send_video_notification_task(video_pk: int):
+    """Envoie la notification newsletter d'une vidéo publiée."""
+    from apps.editorial.models import Video
+    from .services import send_video_notification
+
+    video = Video.objects.select_related('category').filter(pk=video_pk).first()
+    if video is None:
+        logger.warning(f'Video {video_pk} not found, notification skipped')
+        return None
+
+    result = send_video_notification(video)
+
+    if result.get('already_sent'):
+        logger.debug(f'Notification already sent for video: {video.title}')
+    elif result.get('success'):
+        logger.info(f'Newsletter notification sent for video: {video.title}')
+    else:
+        logger.warning(f'Failed to send notification for video: {video.title}')
+
+    return result
+
+
+@task()
+def send_notifications_bulk_task(model_label: str, pks: list):
+    """
+    Envoie les notifications de plusieurs articles ou vidéos publiés ensemble
+    (publication groupée depuis l'admin) ; les envois se chevauchent.
+    """
+    from .services import send_article_notification, send_notifications_bulk, send_video_notification
+
+    model = apps.get_model(model_label)
+    if model_label == 'editorial.Article':
+        contents = model.objects.select_related('author', 'category').filter(pk__in=pks)
+        send = send_article_notification
+    else:
+        contents = model.objects.select_related('category').filter(pk__in=pks)
+        send = send_video_notification
+
+    results = send_notifications_bulk(contents, send)
+    sent = sum(1 for result in results.values() if result.get('success'))
+    logger.info(f'{sent}/{len(results)} {model_label} notifications sent')
+    return results
+
+
+@task()
+def sync_newsletter_subscription_task(subscription_pk: int, attributes: dict):
+    """Synchronise une inscription newsletter avec le provider (Brevo / Mailchimp)."""
+    from .models import NewsletterSubscription
+    from .services import sync_newsletter_subscription
+
+    subscription = NewsletterSubscription.objects.only('email', 'confirmed_at', 'synced_at').filter(pk=subscription_pk).first()
+    if subscription is None:
+        logger.warning(f'Subscription {subscription_pk} not found, sync skipped')
+        return None
+
+    return sync_newsletter_subscription(subscription, **attributes)
+
+
+@task()
+def sync_newsletter_subscriptions_bulk_task(contacts: list):
+    """Synchronise un import groupé d'inscriptions avec le provider (un seul appel)."""
+    from .services import sync_newsletter_subscriptions_bulk
+
+    return sync_newsletter_subscriptions_bulk(contacts)
+
+
+@task()
+def send_contact_notification_task(contact_message_pk: int):
+    """Envoie à l'admin la notification d'un message de contact reçu."""
+    from .models import ContactMessage
+    from .services import send_contact_notification
+
+    contact_message = ContactMessage.objects.filter(pk=contact_message_pk).first()
+    if contact_message is None:
+        logger.warning(f'Contact message {contact_message_pk} not found, notification skipped')
+        return None
+
+    result = send_contact_notification(contact_message)
+
+    if not result.get('success'):
+        logger.warning(f'Failed to send contact notification for message {contact_message_pk}')
+
+    return result
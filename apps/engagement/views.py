@@ -2,22 +2,38 @@
 Engagement Views - Vues pour l'engagement utilisateur
 """
 
+import orjson
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import Substr
+from django.http import StreamingHttpResponse
 from rest_framework import generics, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.throttling import ScopedRateThrottle
 from drf_spectacular.utils import extend_schema
 
+from apps.core.mixins import MultiSerializerViewSetMixin
+from apps.core.utils import get_client_ip
+
+from .filters import NewsletterSubscriptionFilter
 from .models import NewsletterSubscription, ContactMessage
 from .serializers import (
+    NewsletterImportCSVSerializer,
+    NewsletterImportSerializer,
     NewsletterSubscribeSerializer,
     NewsletterUnsubscribeSerializer,
     NewsletterSubscriptionSerializer,
+    CONTACT_MESSAGE_PREVIEW_LENGTH,
     ContactMessageCreateSerializer,
+    ContactMessageListSerializer,
     ContactMessageSerializer,
 )
-from .services import subscribe_to_newsletter, send_contact_notification
+from .services import subscribe_many_to_newsletter, subscribe_to_newsletter
+from .tasks import send_contact_notification_task
 
 
 # =============================================================================
@@ -41,7 +57,7 @@ class NewsletterSubscribeView(generics.GenericAPIView):
         serializer.is_valid(raise_exception=True)
 
         data = serializer.validated_data
-        ip_address = self._get_client_ip(request)
+        ip_address = get_client_ip(request)
 
         try:
             result = subscribe_to_newsletter(
@@ -71,13 +87,6 @@ class NewsletterSubscribeView(generics.GenericAPIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _get_client_ip(self, request):
-        """Récupère l'adresse IP du client."""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR')
-
 
 @extend_schema(tags=['Newsletter'])
 class NewsletterUnsubscribeView(generics.GenericAPIView):
@@ -94,19 +103,37 @@ class NewsletterUnsubscribeView(generics.GenericAPIView):
 
         email = serializer.validated_data['email']
 
-        try:
-            subscription = NewsletterSubscription.objects.get(email=email)
-            subscription.unsubscribe()
+        # Un seul UPDATE : aucune ligne mise à jour signifie email inconnu
+        updated = NewsletterSubscription.bulk_unsubscribe(
+            NewsletterSubscription.objects.for_email(email)
+        )
+        if not updated:
+            raise ValidationError({'email': ['Cette adresse email n\'est pas inscrite.']})
+
+        return Response(
+            {'message': 'Vous avez été désabonné avec succès.'},
+            status=status.HTTP_200_OK
+        )
+
+
+# Statistiques d'administration : tableaux de bord interrogés en boucle,
+# un léger retard sur les compteurs est acceptable
+NEWSLETTER_STATS_CACHE_KEY = 'engagement:newsletter_stats:v1'
+CONTACT_STATS_CACHE_KEY = 'engagement:contact_stats:v1'
+STATS_CACHE_TIMEOUT = 30  # secondes
+
+# Lignes lues par aller-retour lors de l'export des emails
+EXPORT_CHUNK_SIZE = 2000
 
-            return Response(
-                {'message': 'Vous avez été désabonné avec succès.'},
-                status=status.HTTP_200_OK
-            )
-        except NewsletterSubscription.DoesNotExist:
-            return Response(
-                {'error': 'Email non trouvé.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+
+def _stream_emails(emails):
+    """Document JSON {"emails": [...], "count": N} produit morceau par morceau."""
+    count = 0
+    yield b'{"emails":['
+    for email in emails:
+        yield orjson.dumps(email) if not count else b',' + orjson.dumps(email)
+        count += 1
+    yield b'],"count":%d}' % count
 
 
 @extend_schema(tags=['Admin - Newsletter'])
@@ -114,40 +141,73 @@ class AdminNewsletterViewSet(viewsets.ModelViewSet):
     """
     Administration des inscriptions newsletter.
     """
-    queryset = NewsletterSubscription.objects.all()
+    queryset = NewsletterSubscription.objects.select_related('source')
     serializer_class = NewsletterSubscriptionSerializer
     permission_classes = [IsAdminUser]
-    filterset_fields = ['status', 'source']
+    filterset_class = NewsletterSubscriptionFilter
     search_fields = ['email']
     ordering_fields = ['created_at', 'confirmed_at']
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """Statistiques des inscriptions."""
-        total = self.get_queryset().count()
-        confirmed = self.get_queryset().filter(
-            status=NewsletterSubscription.Status.CONFIRMED
-        ).count()
-        unsubscribed = self.get_queryset().filter(
-            status=NewsletterSubscription.Status.UNSUBSCRIBED
-        ).count()
-
-        return Response({
-            'total': total,
-            'confirmed': confirmed,
-            'unsubscribed': unsubscribed,
+        """Statistiques des inscriptions (en cache quelques secondes)."""
+        return Response(
+            cache.get_or_set(NEWSLETTER_STATS_CACHE_KEY, self._compute_stats, STATS_CACHE_TIMEOUT)
+        )
+
+    def _compute_stats(self) -> dict:
+        # Tous les compteurs en une seule requête (agrégats conditionnels)
+        counts = self.get_queryset().aggregate(
+            total=Count('pk'),
+            confirmed=Count('pk', filter=Q(status=NewsletterSubscription.Status.CONFIRMED)),
+            unsubscribed=Count('pk', filter=Q(status=NewsletterSubscription.Status.UNSUBSCRIBED)),
+        )
+        total, confirmed = counts['total'], counts['confirmed']
+
+        return {
+            **counts,
             'active_rate': round(confirmed / total * 100, 2) if total > 0 else 0,
-        })
+        }
+
+    @extend_schema(request={
+        'application/json': NewsletterImportSerializer,
+        'multipart/form-data': NewsletterImportCSVSerializer,
+    })
+    @action(detail=False, methods=['post'], url_path='import')
+    def bulk_import(self, request):
+        """
+        Import groupé d'inscriptions (JSON, ou fichier CSV envoyé dans "file") :
+        un INSERT / UPDATE en base par lot, puis une seule tâche d'import
+        chez le provider (Brevo / Mailchimp).
+        """
+        if 'file' in request.FILES:
+            serializer = NewsletterImportCSVSerializer(data=request.data)
+            contacts_field = 'file'
+        else:
+            serializer = NewsletterImportSerializer(data=request.data)
+            contacts_field = 'contacts'
+        serializer.is_valid(raise_exception=True)
+
+        result = subscribe_many_to_newsletter(
+            serializer.validated_data[contacts_field],
+            source=serializer.validated_data['source'],
+        )
+        return Response(result, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'])
     def export(self, request):
-        """Export des emails confirmés."""
-        emails = list(
+        """
+        Export des emails confirmés, diffusé en flux ({"emails": [...], "count": N}) :
+        les lignes sont lues par lots et écrites au fil de l'eau, sans liste en mémoire.
+        """
+        emails = (
             self.get_queryset()
             .filter(status=NewsletterSubscription.Status.CONFIRMED)
+            .order_by()
             .values_list('email', flat=True)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
         )
-        return Response({'emails': emails, 'count': len(emails)})
+        return StreamingHttpResponse(_stream_emails(emails), content_type='application/json')
 
 
 # =============================================================================
@@ -166,33 +226,18 @@ class ContactMessageCreateView(generics.CreateAPIView):
     serializer_class = ContactMessageCreateSerializer
 
     def perform_create(self, serializer):
-        ip_address = self._get_client_ip(self.request)
+        ip_address = get_client_ip(self.request)
         serializer.save(ip_address=ip_address)
 
-    def _get_client_ip(self, request):
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR')
-
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
 
-        # Envoyer la notification email à l'admin
-        contact_message = serializer.instance
-        try:
-            result = send_contact_notification(contact_message)
-            if result.get('success'):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info(f'Contact notification sent for message from: {contact_message.email}')
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f'Error sending contact notification: {e}')
-            # Ne pas bloquer l'envoi du message en cas d'erreur email
+        # Notification email à l'admin hors du chemin de la requête, après le commit :
+        # une erreur d'envoi ne bloque pas l'enregistrement du message
+        contact_message_pk = serializer.instance.pk
+        transaction.on_commit(lambda: send_contact_notification_task.enqueue(contact_message_pk))
 
         return Response(
             {'message': 'Votre message a été envoyé avec succès.'},
@@ -201,17 +246,29 @@ class ContactMessageCreateView(generics.CreateAPIView):
 
 
 @extend_schema(tags=['Admin - Contact'])
-class AdminContactMessageViewSet(viewsets.ModelViewSet):
+class AdminContactMessageViewSet(MultiSerializerViewSetMixin, viewsets.ModelViewSet):
     """
     Administration des messages de contact.
     """
-    queryset = ContactMessage.objects.all()
+    queryset = ContactMessage.objects.with_replier()
     serializer_class = ContactMessageSerializer
+    serializer_action_classes = {
+        'list': ContactMessageListSerializer,
+    }
     permission_classes = [IsAdminUser]
     filterset_fields = ['status']
     search_fields = ['name', 'email', 'subject', 'message']
     ordering_fields = ['created_at', 'status']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Texte complet non lu pour la liste : seul l'aperçu sort de la base
+            return queryset.defer('message').annotate(
+                message_preview=Substr('message', 1, CONTACT_MESSAGE_PREVIEW_LENGTH)
+            )
+        return queryset
+
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         instance.mark_as_read()
@@ -229,22 +286,28 @@ class AdminContactMessageViewSet(viewsets.ModelViewSet):
     def archive(self, request, pk=None):
         """Archive un message."""
         message = self.get_object()
-        message.status = ContactMessage.Status.ARCHIVED
-        message.save()
+        message.archive()
         return Response({'message': 'Message archivé.'})
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """Statistiques des messages."""
-        total = self.get_queryset().count()
-        new = self.get_queryset().filter(status=ContactMessage.Status.NEW).count()
-        replied = self.get_queryset().filter(status=ContactMessage.Status.REPLIED).count()
-
-        return Response({
-            'total': total,
-            'new': new,
-            'read': self.get_queryset().filter(status=ContactMessage.Status.READ).count(),
-            'replied': replied,
-            'archived': self.get_queryset().filter(status=ContactMessage.Status.ARCHIVED).count(),
+        """Statistiques des messages (en cache quelques secondes)."""
+        return Response(
+            cache.get_or_set(CONTACT_STATS_CACHE_KEY, self._compute_stats, STATS_CACHE_TIMEOUT)
+        )
+
+    def _compute_stats(self) -> dict:
+        # Tous les compteurs en une seule requête (agrégats conditionnels)
+        counts = self.get_queryset().aggregate(
+            total=Count('pk'),
+            new=Count('pk', filter=Q(status=ContactMessage.Status.NEW)),
+            read=Count('pk', filter=Q(status=ContactMessage.Status.READ)),
+            replied=Count('pk', filter=Q(status=ContactMessage.Status.REPLIED)),
+            archived=Count('pk', filter=Q(status=ContactMessage.Status.ARCHIVED)),
+        )
+        total, replied = counts['total'], counts['replied']
+
+        return {
+            **counts,
             'response_rate': round(replied / total * 100, 2) if total > 0 else 0,
-        })
+        }
@@ -63,11 +63,7 @@ class SearchService:
 
         now = timezone.now()
 
-        queryset = Article.objects.filter(
-            status='published'
-        ).filter(
-            Q(published_at__isnull=True) | Q(published_at__lte=now)
-        ).filter(
+        queryset = Article.objects.published(now).filter(
             Q(title__icontains=self.query) |
             Q(excerpt__icontains=self.query) |
             Q(content__icontains=self.query) |
@@ -107,11 +103,7 @@ class SearchService:
 
         now = timezone.now()
 
-        queryset = Video.objects.filter(
-            status='published'
-        ).filter(
-            Q(published_at__isnull=True) | Q(published_at__lte=now)
-        ).filter(
+        queryset = Video.objects.published(now).filter(
             Q(title__icontains=self.query) |
             Q(description__icontains=self.query) |
             Q(tags__icontains=self.query)
@@ -124,7 +116,7 @@ class SearchService:
                 'title': video.title,
                 'slug': video.slug,
                 'description': video.description[:200] if video.description else '',
-                'thumbnail_url': video.thumbnail_url,
+                'thumbnail_url': video.thumbnail_url_cached,
                 'video_type': video.video_type,
                 'duration_formatted': video.duration_formatted,
                 'category': {
@@ -205,14 +197,10 @@ def get_trending_tags(limit: int = 10) -> List[str]:
     now = timezone.now()
 
     # Récupérer tous les tags des articles récents (exclure les tags vides)
-    articles = Article.objects.filter(
-        status='published',
-    ).exclude(
+    articles = Article.objects.published(now).exclude(
         tags__isnull=True
     ).exclude(
         tags=''
-    ).filter(
-        Q(published_at__isnull=True) | Q(published_at__lte=now)
     ).order_by('-published_at')[:100]
 
     tag_counts = {}
@@ -240,21 +228,15 @@ def get_search_suggestions(query: str, limit: int = 5) -> List[str]:
 
     # Titres d'articles correspondants
     article_titles = list(
-        Article.objects.filter(
-            status='published',
+        Article.objects.published(now).filter(
             title__icontains=query
-        ).filter(
-            Q(published_at__isnull=True) | Q(published_at__lte=now)
         ).values_list('title', flat=True)[:limit]
     )
 
     # Titres de vidéos correspondants
     video_titles = list(
-        Video.objects.filter(
-            status='published',
+        Video.objects.published(now).filter(
             title__icontains=query
-        ).filter(
-            Q(published_at__isnull=True) | Q(published_at__lte=now)
         ).values_list('title', flat=True)[:limit]
     )
 
@@ -148,6 +148,12 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='gam_password'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        # Connexions persistantes : pas de handshake TCP + auth à chaque requête
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        # Derrière un pooler en mode transaction (pgbouncer), les curseurs serveur
+        # utilisés par QuerySet.iterator() ne survivent pas d'une transaction à l'autre
+        'DISABLE_SERVER_SIDE_CURSORS': config('DB_TRANSACTION_POOLING', default=False, cast=bool),
     }
 }
 
@@ -238,7 +244,11 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.EstimatedCountPageNumberPagination',
     'PAGE_SIZE': 12,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_THROTTLE_CLASSES': [